@@ -0,0 +1,161 @@
+"""
+국가 × 월 2차원 NumPy 배열 기반 예측 조회 엔진
+
+- (년, 월, 국가) 조회는 정수 인덱스 계산만으로 O(1)
+- 전월 대비 증가량/증가율(MoM)은 생성 시 한 번만 계산
+- 데이터가 없는 칸(예: 코로나 기간 20~22년)은 NaN
+"""
+
+import numpy as np
+import pandas as pd
+
+from core import store
+
+
+class ForecastCube:
+    """국가 × 월 밀집 배열로 예측 입국자 수를 보관하는 조회 엔진"""
+
+    def __init__(self, countries, start_period, values):
+        # countries: 국가명 배열 (행 순서), start_period: 첫 번째 열의 datetime64[M]
+        # values: (국가 수, 월 수) float64 배열
+        self.countries = np.asarray(countries, dtype=object)
+        self.country_index = {name: i for i, name in enumerate(self.countries)}
+        self.values = values
+        self.start_period = np.datetime64(start_period, "M")
+        self.periods = self.start_period + np.arange(values.shape[1])
+        # 첫 번째 열의 절대 월 번호 (년 * 12 + 월 - 1)
+        self._p0 = int(self.start_period.astype(np.int64)) + 1970 * 12
+
+        # ✅ 전월 대비 증가량/증가율 사전 계산 (첫 달은 비교 대상이 없으므로 NaN)
+        previous = np.full_like(values, np.nan)
+        previous[:, 1:] = values[:, :-1]
+        self.mom_abs = values - previous
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self.mom_pct = np.where(previous > 0, self.mom_abs / previous * 100, 0.0)
+        self.mom_pct[np.isnan(previous)] = np.nan
+
+    @classmethod
+    def from_arrays(cls, years, months, country_codes, categories, counts):
+        """(년, 월, 국가코드, 입국자수) 컬럼 배열로부터 큐브 생성"""
+        years = np.asarray(years, dtype=np.int64)
+        months = np.asarray(months, dtype=np.int64)
+        country_codes = np.asarray(country_codes, dtype=np.int64)
+
+        # ✅ 국가 순서는 원본 데이터의 첫 등장 순서를 유지 (차트 색상 순서 유지)
+        present, first_seen = np.unique(country_codes, return_index=True)
+        present = present[np.argsort(first_seen)]
+        row_of_code = np.full(len(categories), -1, dtype=np.int64)
+        row_of_code[present] = np.arange(len(present))
+
+        period = years * 12 + (months - 1)
+        p0 = period.min()
+        values = np.full((len(present), period.max() - p0 + 1), np.nan)
+        values[row_of_code[country_codes], period - p0] = counts
+
+        start = np.datetime64(f"{p0 // 12:04d}-{p0 % 12 + 1:02d}", "M")
+        return cls(np.asarray(categories, dtype=object)[present], start, values)
+
+    @classmethod
+    def from_frame(cls, df):
+        """년, 월, 국적지역, 입국자수 컬럼을 가진 DataFrame 으로부터 큐브 생성"""
+        cat = pd.Categorical(df["국적지역"])
+        return cls.from_arrays(
+            df["년"].to_numpy(),
+            df["월"].to_numpy(),
+            cat.codes,
+            list(cat.categories),
+            df["입국자수"].to_numpy(),
+        )
+
+    @classmethod
+    def from_store(cls, name="df_total"):
+        """컴파일된 컬럼 번들(core.store)로부터 큐브 생성"""
+        arrays, meta = store.load_columns(name)
+        categories = next(
+            c["categories"] for c in meta["columns"] if c["name"] == "국적지역"
+        )
+        return cls.from_arrays(
+            arrays["년"], arrays["월"], arrays["국적지역"], categories, arrays["입국자수"]
+        )
+
+    def complete_years(self):
+        """12개월 모두 전체 국가의 값이 있는 연도 목록"""
+        last = int(self.periods[-1].astype(object).year)
+        first = int(self.start_period.astype(object).year)
+        return [
+            year
+            for year in range(first, last + 1)
+            if not np.isnan(self.slice((year, 1), (year, 12))[1]).any()
+            and self._column(year, 1) is not None
+            and self._column(year, 12) is not None
+        ]
+
+    def _column(self, year, month):
+        """(년, 월) 의 열 인덱스, 범위 밖이면 None"""
+        t = (year * 12 + month - 1) - self._p0
+        if 0 <= t < self.values.shape[1]:
+            return t
+        return None
+
+    def value(self, year, month, country):
+        """(년, 월, 국가) 의 예측 입국자 수, 데이터가 없으면 NaN"""
+        t = self._column(year, month)
+        if t is None:
+            return np.nan
+        return self.values[self.country_index[country], t]
+
+    def month_values(self, year, month):
+        """(년, 월) 의 국가별 입국자 수 (국가 순서는 self.countries)"""
+        t = self._column(year, month)
+        if t is None:
+            return np.full(len(self.countries), np.nan)
+        return self.values[:, t]
+
+    def slice(self, start, end):
+        """(년, 월) start~end (양끝 포함) 구간의 (월 배열, 국가 × 월 배열) 반환"""
+        i = max(start[0] * 12 + start[1] - 1 - self._p0, 0)
+        j = min(end[0] * 12 + end[1] - self._p0, self.values.shape[1])
+        return self.periods[i:j], self.values[:, i:j]
+
+    def frame(self, start, end, countries=None):
+        """구간 데이터를 차트용 long 포맷 DataFrame(국적지역, ds, yhat) 으로 반환"""
+        periods, block = self.slice(start, end)
+        rows = np.arange(len(self.countries))
+        if countries is not None:
+            rows = np.array([self.country_index[c] for c in countries], dtype=np.int64)
+        block = block[rows]
+
+        mask = ~np.isnan(block)
+        country_idx, period_idx = np.nonzero(mask)
+        return pd.DataFrame(
+            {
+                "국적지역": self.countries[rows][country_idx],
+                "ds": periods[period_idx].astype("datetime64[ns]"),
+                "yhat": block[mask].astype(np.int64),
+            }
+        )
+
+    def order(self, year, month):
+        """(년, 월) 기준 입국자 수 내림차순 국가 인덱스 (데이터 없는 국가 제외, 동률은 원본 순서)"""
+        column = self.month_values(year, month)
+        valid = np.flatnonzero(~np.isnan(column))
+        return valid[np.argsort(-column[valid], kind="stable")]
+
+    def rank(self, year, month):
+        """(년, 월) 기준 입국자 수 내림차순 국가명 배열"""
+        return self.countries[self.order(year, month)]
+
+    def top_mover(self, year, month):
+        """
+        전월 대비 입국자 수 증가량이 가장 큰 국가
+        (국가명, 증가량, 증가율%) 반환, 비교할 데이터가 없으면 None
+        """
+        t = self._column(year, month)
+        if t is None:
+            return None
+        growth = self.mom_abs[:, t]
+        valid = np.flatnonzero(~np.isnan(growth))
+        if valid.size == 0:
+            return None
+        best = valid[np.argmax(growth[valid])]
+        return self.countries[best], growth[best], self.mom_pct[best, t]
@@ -0,0 +1,68 @@
+"""
+XGBRegressor 입력 피처 생성 (pipeline.train 학습과 core.serving 예측이 함께 사용)
+
+피처: 년, 월_sin, 월_cos, 국적지역_<국가> 원핫
+- 행 단위 반복문 없이 NumPy 브로드캐스팅으로 float32 배열에 바로 채움
+- 국가 × 미래 월 조합은 future_grid 로 한 번에 생성
+"""
+
+import numpy as np
+import pandas as pd
+
+# 학습된 모델 파일 폴더 (pipeline.train 이 저장, core.serving 이 로드)
+MODEL_DIR = "model"
+
+# 코로나 회복 영향이 커서 Prophet 대신 XGBRegressor 예측을 사용하는 국가
+XGB_COUNTRIES = ["중국"]
+
+BASE_COLUMNS = ["년", "월_sin", "월_cos"]
+
+
+def feature_names(categories):
+    """피처 컬럼명 (학습된 모델의 feature_names 와 같은 순서)"""
+    return BASE_COLUMNS + [f"국적지역_{c}" for c in categories]
+
+
+def country_codes(countries, categories):
+    """국가명 배열을 categories 기준 정수 코드로 변환 (없는 국가는 -1)"""
+    return pd.Categorical(countries, categories=categories).codes.astype(np.int64)
+
+
+def xgb_matrix(years, months, codes, n_categories):
+    """(년, 월, 국가코드) 행 배열로부터 float32 피처 행렬 (행 수, 3 + 국가 수)"""
+    years = np.asarray(years)
+    months = np.asarray(months)
+    codes = np.asarray(codes)
+
+    X = np.empty((len(years), len(BASE_COLUMNS) + n_categories), dtype=np.float32)
+    angle = 2 * np.pi * months / 12
+    X[:, 0] = years
+    X[:, 1] = np.sin(angle)
+    X[:, 2] = np.cos(angle)
+    # ✅ 원핫: 국가코드 열벡터와 국가 번호 행벡터 비교 (코드 -1 은 모두 0)
+    X[:, 3:] = codes[:, None] == np.arange(n_categories)
+    return X
+
+
+def xgb_features(years, months, countries, categories):
+    """학습용 피처 DataFrame (컬럼명 유지, 값은 float32 행렬 그대로)"""
+    X = xgb_matrix(years, months, country_codes(countries, categories), len(categories))
+    return pd.DataFrame(X, columns=feature_names(categories), copy=False)
+
+
+def future_grid(years, months, countries, categories):
+    """
+    국가 × 월 전체 조합의 피처 행렬 (국가 순서대로, 국가마다 월 순서대로)
+    반환: (피처 행렬, 행별 년, 행별 월, 행별 국가명)
+    """
+    years = np.asarray(years)
+    months = np.asarray(months)
+    countries = np.asarray(countries, dtype=object)
+    codes = country_codes(countries, categories)
+
+    n_countries, n_months = len(countries), len(years)
+    row_years = np.broadcast_to(years, (n_countries, n_months)).ravel()
+    row_months = np.broadcast_to(months, (n_countries, n_months)).ravel()
+    row_codes = np.broadcast_to(codes[:, None], (n_countries, n_months)).ravel()
+    X = xgb_matrix(row_years, row_months, row_codes, len(categories))
+    return X, row_years, row_months, np.repeat(countries, n_months)
@@ -0,0 +1,145 @@
+"""
+국적 레지스트리: 별칭 → 표준 국적명, ISO 3166-1 alpha-3 코드, 대륙, 언어
+
+원본 수집(pipeline.ingest), Country 페이지 지도, 여행 성향 조회가 모두 이 모듈로 국적명을 해석한다.
+컬럼 전체 변환(map_series 등)은 고유값마다 한 번만 조회하고 정수 코드로 펼친다.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+Nationality = namedtuple("Nationality", ["id", "name", "iso3", "region", "language"])
+
+# ✅ 표준 국적 (국적명, ISO3, 대륙(법무부 통계 기준), 언어)
+NATIONALITIES = [
+    ("중국", "CHN", "아시아주", "중국어"),
+    ("일본", "JPN", "아시아주", "일본어"),
+    ("대만", "TWN", "아시아주", "중국어"),
+    ("홍콩", "HKG", "아시아주", "중국어, 영어"),
+    ("몽골", "MNG", "아시아주", "몽골어"),
+    ("태국", "THA", "아시아주", "태국어"),
+    ("베트남", "VNM", "아시아주", "베트남어"),
+    ("필리핀", "PHL", "아시아주", "영어, 타갈로그어"),
+    ("인도네시아", "IDN", "아시아주", "인도네시아어"),
+    ("말레이시아", "MYS", "아시아주", "말레이어"),
+    ("싱가포르", "SGP", "아시아주", "영어, 중국어"),
+    ("캄보디아", "KHM", "아시아주", "크메르어"),
+    ("미얀마", "MMR", "아시아주", "미얀마어"),
+    ("인도", "IND", "아시아주", "힌디어, 영어"),
+    ("네팔", "NPL", "아시아주", "네팔어"),
+    ("우즈베키스탄", "UZB", "아시아주", "우즈베크어"),
+    ("카자흐스탄", "KAZ", "아시아주", "카자흐어, 러시아어"),
+    ("튀르키예", "TUR", "아시아주", "터키어"),
+    ("미국", "USA", "북아메리카주", "영어"),
+    ("캐나다", "CAN", "북아메리카주", "영어, 프랑스어"),
+    ("멕시코", "MEX", "남아메리카주", "스페인어"),
+    ("브라질", "BRA", "남아메리카주", "포르투갈어"),
+    ("러시아", "RUS", "유럽주", "러시아어"),
+    ("영국", "GBR", "유럽주", "영어"),
+    ("프랑스", "FRA", "유럽주", "프랑스어"),
+    ("독일", "DEU", "유럽주", "독일어"),
+    ("이탈리아", "ITA", "유럽주", "이탈리아어"),
+    ("스페인", "ESP", "유럽주", "스페인어"),
+    ("네덜란드", "NLD", "유럽주", "네덜란드어"),
+    ("체코", "CZE", "유럽주", "체코어"),
+    ("오스트레일리아", "AUS", "오세아니아주", "영어"),
+    ("뉴질랜드", "NZL", "오세아니아주", "영어"),
+]
+
+# ✅ 별칭 → 표준 국적명 (원본 데이터 표기, 노트북 nationality_mapping 통합)
+ALIASES = {
+    "한국계중국인": "중국",
+    "타이완": "대만",
+    "타이완(대만)": "대만",
+    "홍콩거주난민": "홍콩",
+    "타이": "태국",
+    "타이(태국)": "태국",
+    "티모르민주공화국(동티모르)": "동티모르",
+    "터키": "튀르키예",
+    "미국인근섬": "미국",
+    "러시아(연방)": "러시아",
+    "러시아연방": "러시아",
+    "한국계러시아인": "러시아",
+    "벨라루스": "벨로루시",
+    "영령버진아일랜드": "영국",
+    "영령인도양섬": "영국",
+    "영국속령지시민": "영국",
+    "영국해외영토시민": "영국",
+    "영국보호민": "영국",
+    "영국외지민": "영국",
+    "북마케도니아": "마케도니아",
+    "보스니아헤르체고비나": "보스니아",
+    "보스니아-헤르체고비나": "보스니아",
+    "세르비아": "유고슬라비아",
+    "몬테네그로": "유고슬라비아",
+    "코소보": "유고슬라비아",
+    "스와질란드": "에스와티니",
+    "체코공화국": "체코",
+    "슬로바크": "슬로바키아",
+    "콩고공화국": "콩고",
+    "예멘공화국": "예멘",
+    "호주": "오스트레일리아",
+}
+
+
+class NationalityRegistry:
+    """국적명 해석기 (별칭 정규화, ISO 코드/대륙/언어 조회, 정수 id)"""
+
+    def __init__(self, nationalities, aliases):
+        self.entries = [
+            Nationality(i, name, iso3, region, language)
+            for i, (name, iso3, region, language) in enumerate(nationalities)
+        ]
+        self._by_name = {entry.name: entry for entry in self.entries}
+
+        # 별칭이 다른 별칭을 가리키면 한 번의 치환으로 결과가 달라지므로 허용하지 않음
+        chained = [alias for alias, name in aliases.items() if name in aliases]
+        if chained:
+            raise ValueError(f"별칭의 대상이 다시 별칭입니다: {chained}")
+        self.aliases = aliases
+
+    @staticmethod
+    def _normalize(name):
+        # '중      국', '영령 버진아일랜드' 처럼 공백이 섞인 원본 표기 정리
+        return str(name).replace(" ", "")
+
+    def canonical(self, name):
+        """표준 국적명 (등록되지 않은 이름은 공백만 제거하여 그대로 반환)"""
+        name = self._normalize(name)
+        return self.aliases.get(name, name)
+
+    def get(self, name):
+        """Nationality 정보, 등록되지 않은 국적이면 None"""
+        return self._by_name.get(self.canonical(name))
+
+    def iso3(self, name):
+        entry = self.get(name)
+        return entry.iso3 if entry else None
+
+    def _map_unique(self, values, func, fill=None, dtype=object):
+        """고유값마다 func 를 한 번씩만 적용하여 전체 배열로 펼침 (결측값은 fill)"""
+        codes, uniques = pd.factorize(np.asarray(values, dtype=object))
+        # 결측값 코드 -1 이 마지막 fill 을 가리키도록 덧붙임 (모두 결측이어도 빈 배열이 아님)
+        mapped = np.array([func(name) for name in uniques] + [fill], dtype=dtype)
+        return mapped[codes]
+
+    def map_series(self, values):
+        """국적명 컬럼 전체를 표준 국적명 배열로 변환"""
+        return self._map_unique(values, self.canonical)
+
+    def iso3_series(self, values):
+        """국적명 컬럼 전체를 ISO3 코드 배열로 변환 (미등록 국적은 None)"""
+        return self._map_unique(values, self.iso3)
+
+    def _id(self, name):
+        entry = self.get(name)
+        return entry.id if entry else -1
+
+    def ids(self, values):
+        """국적명 컬럼 전체를 정수 id 배열로 변환 (미등록 국적은 -1)"""
+        return self._map_unique(values, self._id, fill=-1, dtype=np.int64)
+
+
+REGISTRY = NationalityRegistry(NATIONALITIES, ALIASES)
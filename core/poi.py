@@ -0,0 +1,85 @@
+"""
+관광지/숙소 POI 공간 인덱스 (테마 위치 반경 r km 이내 가까운 순 조회)
+
+- 위도/경도를 CELL_DEG 격자로 나눈 셀 번호 순으로 정렬해 두고,
+  조회 시 반경을 덮는 셀 행마다 searchsorted 로 연속 구간만 후보로 가져옴
+- 후보만 하버사인 거리 계산 → 반경/카테고리 필터 → 가까운 순 k 개
+- 레코드는 카카오 로컬 검색 document 형식 (x: 경도, y: 위도, category_group_code)
+"""
+
+import numpy as np
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEG_LAT = np.pi * EARTH_RADIUS_KM / 180
+
+# 격자 한 칸 크기 (도, 약 5.5km)
+CELL_DEG = 0.05
+# 셀 번호 = 위도 칸 * _ROW + 경도 칸 (경도 칸 수 7,200 보다 크게)
+_ROW = 10000
+
+
+def _cells(lat, lng):
+    return np.floor((lat + 90) / CELL_DEG).astype(np.int64), np.floor(
+        (lng + 180) / CELL_DEG
+    ).astype(np.int64)
+
+
+def haversine_km(lat1, lng1, lat2, lng2):
+    """두 지점(배열 가능) 사이 대원 거리 (km)"""
+    lat1, lng1, lat2, lng2 = map(np.radians, (lat1, lng1, lat2, lng2))
+    a = (
+        np.sin((lat2 - lat1) / 2) ** 2
+        + np.cos(lat1) * np.cos(lat2) * np.sin((lng2 - lng1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+
+
+class PoiIndex:
+    """POI 레코드 목록 + 격자 셀 정렬 인덱스"""
+
+    def __init__(self, records):
+        lat = np.array([float(r["y"]) for r in records], dtype=np.float64)
+        lng = np.array([float(r["x"]) for r in records], dtype=np.float64)
+        codes = np.array([r.get("category_group_code") or "" for r in records], dtype=object)
+
+        rows, cols = _cells(lat, lng)
+        keys = rows * _ROW + cols
+        order = np.argsort(keys, kind="stable")
+        self.records = [records[i] for i in order]
+        self._keys = keys[order]
+        self._lat = lat[order]
+        self._lng = lng[order]
+        self._codes = codes[order]
+
+    def __len__(self):
+        return len(self.records)
+
+    def _candidates(self, lat, lng, radius_km):
+        """반경을 덮는 셀들에 속한 레코드 위치 배열"""
+        dlat = radius_km / KM_PER_DEG_LAT
+        # 반경 안에서 가장 극에 가까운 위도 기준 (경도 1도 거리가 가장 짧은 곳)
+        cos_lat = max(np.cos(np.radians(min(abs(lat) + dlat, 89.9))), 1e-6)
+        dlng = radius_km / (KM_PER_DEG_LAT * cos_lat)
+
+        row0, col0 = _cells(np.float64(lat - dlat), np.float64(lng - dlng))
+        row1, col1 = _cells(np.float64(lat + dlat), np.float64(lng + dlng))
+        rows = np.arange(row0, row1 + 1) * _ROW
+        starts = np.searchsorted(self._keys, rows + col0, side="left")
+        ends = np.searchsorted(self._keys, rows + col1, side="right")
+        if not len(starts):
+            return np.empty(0, dtype=np.int64)
+        return np.concatenate([np.arange(s, e) for s, e in zip(starts, ends)])
+
+    def nearby(self, lat, lng, radius_km, categories=None, k=None):
+        """
+        (lat, lng) 반경 radius_km 이내 레코드를 가까운 순으로 [(레코드, 거리 km), ...]
+        categories: 허용할 category_group_code 목록 (None 이면 전체), k: 최대 개수
+        """
+        idx = self._candidates(lat, lng, radius_km)
+        if categories is not None and len(idx):
+            idx = idx[np.isin(self._codes[idx], list(categories))]
+        distances = haversine_km(lat, lng, self._lat[idx], self._lng[idx])
+        inside = distances <= radius_km
+        idx, distances = idx[inside], distances[inside]
+        order = np.argsort(distances, kind="stable")[:k]
+        return [(self.records[i], float(distances[j])) for j, i in zip(order, idx[order])]
@@ -0,0 +1,91 @@
+"""
+Country 페이지 순위/티어 계산 엔진
+
+(년, 월) 마다 argsort 한 번으로 만든 순서 하나를 캐싱해 두고,
+1~5위 / 6~10위 / 11~15위 티어, 30,000명 이상 표, 계절 Tip 을 모두 그 순서에서 꺼내 쓴다.
+"""
+
+import numpy as np
+import pandas as pd
+
+SEASON_COLUMNS = ["봄철 증가율", "여름철 증가율", "가을철 증가율", "겨울철 증가율"]
+
+
+class MonthRanking:
+    """한 달 기준 국가 순위 (입국자 수 내림차순)"""
+
+    def __init__(self, countries, values, season_growth):
+        # countries, values: 내림차순 정렬된 국가명/입국자 수
+        # season_growth: 같은 순서로 정렬된 {계절 컬럼: 증가율 배열}
+        self.countries = countries
+        self.values = values
+        self.season_growth = season_growth
+
+    def tier(self, start, stop):
+        """start+1 ~ stop 위 국가 목록 (예: tier(0, 5) → 1~5위)"""
+        return self.countries[start:stop].tolist()
+
+    def bottom(self, n):
+        """입국자 수가 가장 적은 n개 국가 (적은 순)"""
+        return self.countries[::-1][:n].tolist()
+
+    def _count_at_least(self, min_value):
+        """min_value 이상인 국가 수 (내림차순이므로 앞쪽 구간 길이)"""
+        if min_value is None:
+            return len(self.values)
+        return int(np.searchsorted(-self.values, -min_value, side="right"))
+
+    def table(self, min_value=None):
+        """순위, 국가, 예상 입국자수 표 (min_value 지정 시 해당 인원 이상 국가만)"""
+        n = self._count_at_least(min_value)
+        return pd.DataFrame(
+            {
+                "순위": np.arange(1, n + 1),
+                "국가": self.countries[:n],
+                "예상 입국자수": self.values[:n],
+            }
+        )
+
+    def season_leader(self, season_col, min_value=None):
+        """min_value 이상 국가 중 해당 계절 증가율이 가장 높은 (국가, 증가율), 없으면 None"""
+        n = self._count_at_least(min_value)
+        growth = self.season_growth[season_col][:n]
+        valid = np.flatnonzero(~np.isnan(growth))
+        if valid.size == 0:
+            return None
+        best = valid[np.argmax(growth[valid])]
+        return self.countries[best], growth[best]
+
+
+class RankingEngine:
+    """ForecastCube 위에서 월별 순위를 한 번만 계산하고 캐싱하는 엔진"""
+
+    def __init__(self, cube, seasonal_growth_df=None):
+        self.cube = cube
+        self._cache = {}
+
+        # ✅ 계절별 증가율을 큐브의 국가 순서에 맞춘 배열로 미리 정렬
+        self._season_growth = {}
+        for col in SEASON_COLUMNS:
+            growth = np.full(len(cube.countries), np.nan)
+            if seasonal_growth_df is not None:
+                lookup = dict(
+                    zip(seasonal_growth_df["국적지역"], seasonal_growth_df[col])
+                )
+                for i, country in enumerate(cube.countries):
+                    growth[i] = lookup.get(country, np.nan)
+            self._season_growth[col] = growth
+
+    def month(self, year, month):
+        """(년, 월) 순위 (MonthRanking), 월 단위로 캐싱"""
+        key = (year, month)
+        ranking = self._cache.get(key)
+        if ranking is None:
+            order = self.cube.order(year, month)
+            ranking = MonthRanking(
+                self.cube.countries[order],
+                self.cube.month_values(year, month)[order].astype(np.int64),
+                {col: growth[order] for col, growth in self._season_growth.items()},
+            )
+            self._cache[key] = ranking
+        return ranking
@@ -0,0 +1,199 @@
+"""
+학습된 모델(model/prophet_model.pkl, model/xgb_model.pkl) 예측 서빙
+
+- 모델 파일은 프로세스당 한 번만 로드 (UI 에서는 st.cache_resource 로 공유)
+- (국가, 시작 년월, 끝 년월) 요청을 모아서 XGB 는 한 번의 predict, Prophet 은 국가별 한 번의 predict 로 처리
+- 요청 결과는 메모이즈하여 같은 구간은 다시 계산하지 않음
+- df_total.csv 를 다시 만들지 않고 ForecastCube 의 예측 구간을 연장할 수 있음
+
+필요 패키지: joblib, prophet, xgboost (없으면 load 가 None 을 반환하고 CSV 예측만 사용)
+"""
+
+import logging
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+
+from core.cube import ForecastCube
+from core.features import MODEL_DIR, XGB_COUNTRIES, country_codes, xgb_matrix
+
+logger = logging.getLogger(__name__)
+
+
+def _period(year, month):
+    """절대 월 번호 (년 * 12 + 월 - 1)"""
+    return year * 12 + month - 1
+
+
+def _year_months(start, end):
+    """(년, 월) start~end (양끝 포함) 의 년 배열, 월 배열"""
+    periods = np.arange(_period(*start), _period(*end) + 1)
+    return periods // 12, periods % 12 + 1
+
+
+class ModelServer:
+    """국가별 Prophet 모델 + 전체 국가 XGB 모델 예측 서버"""
+
+    def __init__(self, prophet_models, xgb_model=None, xgb_countries=XGB_COUNTRIES):
+        # prophet_models: {국가: Prophet}, xgb_model: XGBRegressor (없으면 None)
+        self.prophet_models = prophet_models
+        self.xgb_model = xgb_model
+        self.xgb_countries = set(xgb_countries) if xgb_model is not None else set()
+        self.xgb_categories = []
+        if xgb_model is not None:
+            # ✅ 원핫 컬럼명(국적지역_중국 ...)에서 학습 당시 국가 목록 복원
+            self.xgb_categories = [
+                name.split("_", 1)[1]
+                for name in xgb_model.get_booster().feature_names
+                if name.startswith("국적지역_")
+            ]
+
+        # Prophet 학습 마지막 월 (이후 구간은 월말 날짜로 예측, pipeline.train.to_year_month 참고)
+        self._last_trained = {
+            country: _period(ds.year, ds.month)
+            for country, model in prophet_models.items()
+            for ds in [pd.Timestamp(model.history["ds"].max())]
+        }
+        self._cache = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, model_dir=MODEL_DIR, countries=None):
+        """
+        모델 파일 로드, 패키지나 파일이 없으면 None
+        countries: 모두 예측할 수 있어야 하는 국가 목록 (하나라도 모델이 없으면 XGB 모델을 읽지 않고 None)
+        """
+        try:
+            import joblib
+        except ImportError:
+            return None
+
+        prophet_path = os.path.join(model_dir, "prophet_model.pkl")
+        xgb_path = os.path.join(model_dir, "xgb_model.pkl")
+        try:
+            prophet_models = joblib.load(prophet_path) if os.path.exists(prophet_path) else {}
+            if not isinstance(prophet_models, dict):
+                # 노트북에서 저장한 단일 모델 파일은 어느 국가 모델인지 알 수 없음
+                prophet_models = {}
+            if countries is not None and any(
+                c not in prophet_models and c not in XGB_COUNTRIES for c in countries
+            ):
+                return None
+            xgb_model = joblib.load(xgb_path) if os.path.exists(xgb_path) else None
+        except ImportError as e:
+            logger.warning("모델 로드에 필요한 패키지가 없습니다: %s", e)
+            return None
+        if not prophet_models and xgb_model is None:
+            return None
+        return cls(prophet_models, xgb_model)
+
+    @property
+    def countries(self):
+        """예측 가능한 국가 목록"""
+        return sorted(set(self.prophet_models) | self.xgb_countries)
+
+    def _model_type(self, country):
+        if country in self.xgb_countries:
+            return "xgb"
+        if country in self.prophet_models:
+            return "prophet"
+        return None
+
+    def _predict_xgb(self, requests):
+        """XGB 요청 전체를 하나의 피처 행렬로 한 번에 예측"""
+        parts = [_year_months(start, end) for _, start, end in requests]
+        years = np.concatenate([y for y, _ in parts])
+        months = np.concatenate([m for _, m in parts])
+        countries = np.repeat([c for c, _, _ in requests], [len(y) for y, _ in parts])
+        codes = country_codes(countries, self.xgb_categories)
+        X = xgb_matrix(years, months, codes, len(self.xgb_categories))
+        predicted = np.round(self.xgb_model.predict(X)).astype(np.int64)
+        bounds = np.cumsum([0] + [len(y) for y, _ in parts])
+        return [predicted[i:j] for i, j in zip(bounds[:-1], bounds[1:])]
+
+    def _predict_prophet(self, country, requests):
+        """한 국가의 Prophet 요청들을 합친 구간으로 한 번에 예측"""
+        model = self.prophet_models[country]
+        lo = min(_period(*start) for _, start, _ in requests)
+        hi = max(_period(*end) for _, _, end in requests)
+        periods = np.arange(lo, hi + 1)
+
+        # 학습 구간은 월초, 미래 구간은 전월 말일 (df_total.csv 생성 방식과 동일)
+        ds = pd.to_datetime({"year": periods // 12, "month": periods % 12 + 1, "day": 1})
+        ds = ds.where(periods <= self._last_trained[country], ds - pd.Timedelta(days=1))
+        yhat = model.predict(pd.DataFrame({"ds": ds}))["yhat"].astype(int).to_numpy()
+        return [
+            yhat[_period(*start) - lo : _period(*end) - lo + 1]
+            for _, start, end in requests
+        ]
+
+    def predict(self, requests):
+        """
+        (국가, (시작 년, 월), (끝 년, 월)) 요청 목록의 월별 예측 입국자 수
+        반환: {요청: int 배열}, 모델이 없는 국가는 제외
+        """
+        requests = [(c, tuple(s), tuple(e)) for c, s, e in requests]
+        results = {}
+        missing = []
+        for request in dict.fromkeys(requests):
+            if request in self._cache:
+                results[request] = self._cache[request]
+            elif self._model_type(request[0]) is not None:
+                missing.append(request)
+
+        # ✅ 캐시에 없는 요청만 모델별로 묶어서 예측
+        computed = []
+        xgb_requests = [r for r in missing if self._model_type(r[0]) == "xgb"]
+        if xgb_requests:
+            computed += zip(xgb_requests, self._predict_xgb(xgb_requests))
+        prophet_requests = {}
+        for r in missing:
+            if self._model_type(r[0]) == "prophet":
+                prophet_requests.setdefault(r[0], []).append(r)
+        for country, group in prophet_requests.items():
+            computed += zip(group, self._predict_prophet(country, group))
+
+        with self._lock:
+            for request, values in computed:
+                values.setflags(write=False)
+                self._cache[request] = values
+                results[request] = values
+        return results
+
+    def frame(self, requests):
+        """예측 결과를 차트용 long 포맷 DataFrame(국적지역, ds, yhat) 으로 반환"""
+        frames = []
+        for (country, start, end), values in self.predict(requests).items():
+            years, months = _year_months(start, end)
+            frames.append(
+                pd.DataFrame(
+                    {
+                        "국적지역": country,
+                        "ds": pd.to_datetime({"year": years, "month": months, "day": 1}),
+                        "yhat": values,
+                    }
+                )
+            )
+        if not frames:
+            return pd.DataFrame(columns=["국적지역", "ds", "yhat"])
+        return pd.concat(frames, ignore_index=True)
+
+    def extend_cube(self, cube, end):
+        """큐브의 마지막 달 다음부터 end (년, 월) 까지 모델 예측으로 채운 새 ForecastCube"""
+        last = cube.periods[-1].astype(object)
+        start_period = _period(last.year, last.month) + 1
+        n_extra = _period(*end) - start_period + 1
+        # 일부 국가만 예측 가능하면 연장하지 않음 (월별 순위가 일부 국가만으로 계산되지 않도록)
+        if n_extra <= 0 or any(self._model_type(c) is None for c in cube.countries):
+            return cube
+
+        start = (start_period // 12, start_period % 12 + 1)
+        extra = np.full((len(cube.countries), n_extra), np.nan)
+        requests = [(country, start, end) for country in cube.countries]
+        for (country, _, _), values in self.predict(requests).items():
+            extra[cube.country_index[country]] = values
+        return ForecastCube(
+            cube.countries, cube.start_period, np.hstack([cube.values, extra])
+        )
@@ -0,0 +1,202 @@
+"""
+예측 결과 CSV를 컬럼 단위 NumPy 번들(.npy)로 컴파일하고, 메모리 매핑으로 여는 저장소
+
+- 국적지역/국가 같은 문자열 컬럼은 카테고리 코드(int8) + 카테고리 목록으로 저장
+- 년은 int16, 월은 int8 로 저장하여 텍스트 파싱 없이 바로 사용
+- 컬럼 파일 이름에 원본 CSV 수정 시각을 붙여(col0-<mtime_ns>.npy) 다시 컴파일해도 기존 파일을 덮어쓰지 않음
+  (각 파일은 임시 파일에 쓴 뒤 교체, meta.json 을 마지막에 교체하여 읽는 쪽은 항상 완성된 번들만 봄)
+- 컴파일: python -m core.store
+"""
+
+import glob
+import json
+import os
+import re
+import sys
+
+import numpy as np
+import pandas as pd
+
+DATA_DIR = "data"
+STORE_DIR = os.path.join(DATA_DIR, "store")
+META_FILE = "meta.json"
+# 컬럼 파일 이름 (col<번호>-<원본 mtime_ns>.npy, 이전 형식 col<번호>.npy 는 버전 0)
+_COLUMN_FILE = re.compile(r"col\d+(?:-(\d+))?\.npy")
+
+# ✅ 컴파일 대상 테이블 정의: 테이블명 -> 원본 CSV, 인덱스 컬럼, 컬럼별 dtype
+TABLES = {
+    "df_total": {
+        "csv": "df_total.csv",
+        "index_col": None,
+        "dtypes": {
+            "년": "int16",
+            "월": "int8",
+            "국적지역": "category",
+            "입국자수": "int64",
+        },
+    },
+    "df_seasonal_growth": {
+        "csv": "df_seasonal_growth.csv",
+        "index_col": None,
+        "dtypes": {
+            "국적지역": "category",
+            "연평균입국자수": "float64",
+            "봄철 증가율": "float64",
+            "여름철 증가율": "float64",
+            "가을철 증가율": "float64",
+            "겨울철 증가율": "float64",
+        },
+    },
+    "example_travel_preference": {
+        "csv": "example_travel_preference.csv",
+        "index_col": "국가",
+        "dtypes": {
+            "국가": "category",
+            "언어": "category",
+            "여행 성향": "category",
+        },
+    },
+}
+
+
+def _csv_path(name):
+    return os.path.join(DATA_DIR, TABLES[name]["csv"])
+
+
+def _table_dir(name):
+    return os.path.join(STORE_DIR, name)
+
+
+def _read_meta(name):
+    meta_path = os.path.join(_table_dir(name), META_FILE)
+    if not os.path.exists(meta_path):
+        return None
+    with open(meta_path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def is_stale(name):
+    """컴파일된 번들이 없거나 원본 CSV보다 오래되었으면 True"""
+    meta = _read_meta(name)
+    if meta is None:
+        return True
+    return meta["source_mtime"] != os.path.getmtime(_csv_path(name))
+
+
+def compile_table(name):
+    """원본 CSV를 한 번 파싱하여 컬럼별 .npy 파일과 meta.json 으로 저장"""
+    spec = TABLES[name]
+    csv_path = _csv_path(name)
+    # 파싱 전에 수정 시각을 읽어 두어야 도중에 CSV 가 바뀌면 다음 조회에서 다시 컴파일됨
+    source_stat = os.stat(csv_path)
+    version = source_stat.st_mtime_ns
+    df = pd.read_csv(csv_path)
+
+    table_dir = _table_dir(name)
+    os.makedirs(table_dir, exist_ok=True)
+
+    columns = []
+    for i, (col, dtype) in enumerate(spec["dtypes"].items()):
+        file_name = f"col{i}-{version}.npy"
+        entry = {"name": col, "file": file_name, "dtype": dtype}
+        if dtype == "category":
+            cat = pd.Categorical(df[col])
+            # ✅ 카테고리 수가 적으므로 코드는 int8 (범위를 넘으면 int16)
+            code_dtype = "int8" if len(cat.categories) < 127 else "int16"
+            values = cat.codes.astype(code_dtype)
+            entry["categories"] = [str(c) for c in cat.categories]
+        else:
+            values = df[col].to_numpy().astype(dtype)
+        # 같은 CSV 를 동시에 컴파일하는 프로세스끼리도 겹치지 않도록 프로세스별 임시 파일
+        path = os.path.join(table_dir, file_name)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.save(f, values)
+        os.replace(tmp_path, path)
+        columns.append(entry)
+
+    meta = {
+        "source": spec["csv"],
+        "source_mtime": source_stat.st_mtime,
+        "rows": len(df),
+        "index_col": spec["index_col"],
+        "columns": columns,
+    }
+    previous = _read_meta(name)
+    # ✅ meta.json 은 마지막에 원자적으로 교체 (읽는 쪽은 항상 완성된 번들만 봄)
+    tmp_path = os.path.join(table_dir, f"{META_FILE}.{os.getpid()}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, os.path.join(table_dir, META_FILE))
+    # 직전 번들은 남겨 둠 (교체 직전에 이전 meta 를 읽은 프로세스가 아직 파일을 열지 않았을 수 있음)
+    if previous is not None:
+        _remove_older_columns(table_dir, min(version, _version(previous)))
+    return table_dir
+
+
+def _version(meta):
+    """meta 가 가리키는 컬럼 파일 버전 (원본 mtime_ns, 이전 형식은 0)"""
+    match = _COLUMN_FILE.fullmatch(meta["columns"][0]["file"])
+    return int(match.group(1) or 0) if match else 0
+
+
+def _remove_older_columns(table_dir, version):
+    """version 보다 오래된 컬럼 파일 삭제 (이미 메모리 매핑한 프로세스는 계속 읽을 수 있음)"""
+    for path in glob.glob(os.path.join(table_dir, "col*.npy")):
+        match = _COLUMN_FILE.fullmatch(os.path.basename(path))
+        if match and int(match.group(1) or 0) < version:
+            try:
+                os.remove(path)
+            except FileNotFoundError:  # 다른 프로세스가 먼저 삭제
+                pass
+
+
+def compile_all():
+    """TABLES 에 정의된 모든 테이블 컴파일"""
+    return [compile_table(name) for name in TABLES]
+
+
+def load_columns(name):
+    """번들을 메모리 매핑으로 열어 {컬럼명: ndarray} 와 meta 를 반환 (번들이 낡았으면 먼저 컴파일)"""
+    if is_stale(name):
+        compile_table(name)
+    table_dir = _table_dir(name)
+
+    for attempt in range(2):
+        meta = _read_meta(name)
+        try:
+            arrays = {
+                entry["name"]: np.load(os.path.join(table_dir, entry["file"]), mmap_mode="r")
+                for entry in meta["columns"]
+            }
+            return arrays, meta
+        except FileNotFoundError:
+            # meta 를 읽은 뒤 다른 프로세스가 새 번들로 교체하며 이전 파일을 삭제한 경우 다시 읽음
+            if attempt:
+                raise
+
+
+def load_table(name):
+    """번들을 pandas DataFrame 으로 반환 (문자열 컬럼은 Categorical)"""
+    arrays, meta = load_columns(name)
+
+    data = {}
+    for entry in meta["columns"]:
+        values = arrays[entry["name"]]
+        if entry["dtype"] == "category":
+            data[entry["name"]] = pd.Categorical.from_codes(
+                np.asarray(values), categories=entry["categories"]
+            )
+        else:
+            data[entry["name"]] = values
+    df = pd.DataFrame(data)
+
+    if meta["index_col"]:
+        df = df.set_index(meta["index_col"])
+    return df
+
+
+if __name__ == "__main__":
+    for path in compile_all():
+        print(f"✅ 컴파일 완료: {path}")
+    sys.exit(0)
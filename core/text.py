@@ -0,0 +1,61 @@
+"""
+네이버 블로그 검색 결과 설명 정리 (Festival, Seasons, Tourist Spot 메뉴 공용)
+
+기존 BeautifulSoup(text, "html.parser").get_text() + 마크다운 기호 제거와 같은 결과를 만든다.
+- 네이버 설명은 검색어 강조 <b>, </b> 와 &quot; &amp; 같은 엔티티뿐이므로 파서 트리 없이
+  문자열 치환 + html.unescape 로 처리
+- 그 외 태그나 세미콜론 없는 엔티티처럼 파서마다 해석이 갈리는 입력만 BeautifulSoup 사용
+- 마크다운 패턴은 기존과 같은 순서로 한 번씩 적용 (미리 컴파일, 기호가 없는 글은 건너뜀)
+"""
+
+import html
+import re
+
+from bs4 import BeautifulSoup
+
+# <b>, </b> 이외의 '<', 네이버가 쓰는 엔티티(&quot; &amp; &lt; &gt; &apos; &nbsp; &#39; 등)가 아닌 '&'
+_NEEDS_PARSER = re.compile(
+    r"<(?!/?b>)|&(?!(?:quot|amp|lt|gt|apos|nbsp|#[0-9]+|#[xX][0-9A-Fa-f]+);)"
+)
+
+# 태그 사이(또는 글 전체)가 공백 한 칸이 아닌 공백뿐인 구간
+_BLANK_RUN = re.compile(r"(?:\A|>)(?! (?:<|\Z))\s+(?:<|\Z)")
+
+# (기호 포함 여부 확인용 문자열, 패턴) — 태그 내용만 남기고 마크다운 기호 삭제
+_MARKDOWN = [
+    ("**", re.compile(r"\*\*(.*?)\*\*")),  # **볼드체**
+    ("__", re.compile(r"__(.*?)__")),  # __이탤릭체__
+    ("~~", re.compile(r"~~(.*?)~~")),  # ~~취소선~~
+    ("`", re.compile(r"`(.*?)`")),  # `코드 블록`
+    ("](", re.compile(r"\[(.*?)\]\(.*?\)")),  # [링크 텍스트](URL)
+]
+
+
+def strip_html(text):
+    """HTML 태그 제거 + 엔티티 복원 (BeautifulSoup html.parser 의 get_text() 와 같은 결과)"""
+    # 공백뿐인 텍스트 조각은 BeautifulSoup 이 한 글자로 줄이므로 함께 파서로 처리
+    if _NEEDS_PARSER.search(text) or _BLANK_RUN.search(text):
+        return BeautifulSoup(text, "html.parser").get_text()
+    if "<" in text:
+        text = text.replace("<b>", "").replace("</b>", "")
+    if "&" in text:
+        text = html.unescape(text)
+    return text
+
+
+def strip_markdown(text):
+    """마크다운 기호 제거 (취소선, 볼드, 이탤릭, 코드, 링크)"""
+    for marker, pattern in _MARKDOWN:
+        if marker in text:
+            text = pattern.sub(r"\1", text)
+    return text
+
+
+def clean_html(text):
+    """HTML 태그 및 마크다운 기호 제거"""
+    return strip_markdown(strip_html(text))
+
+
+def clean_html_many(texts):
+    """여러 설명을 한 번에 정리 (입력 순서 유지, None 은 그대로)"""
+    return [None if text is None else clean_html(text) for text in texts]
@@ -0,0 +1,226 @@
+"""
+국가별 / 모델별 rolling-origin 교차 검증 (data/evaluation_df.csv 생성)
+
+- 학습 데이터의 마지막 folds × horizon 개월을 horizon 개월씩 나눠 시험 구간으로 사용
+  (각 폴드는 시험 구간 이전 데이터 전체로 학습)
+- 모델: prophet (국가별), xgb / linear (전체 국가 한 모델, 월_sin/월_cos + 국적지역 원핫)
+- 폴드 학습은 프로세스 풀에서 병렬 실행, 학습된 모델은 model/backtest_cache 에 저장하여 재실행 시 재사용
+- 국가 × 모델별 MAPE, RMSE, 폴드당 평균 학습/예측 시간(초) 을 data/evaluation_df.csv 로 저장
+
+실행: python -m pipeline.backtest [--folds 4] [--horizon 3] [--models prophet xgb linear] [--workers N]
+필요 패키지: prophet, xgboost, scikit-learn, joblib
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from core.features import xgb_features
+from pipeline import fingerprint
+from pipeline.train import (
+    DATA_DIR,
+    MODEL_DIR,
+    PROPHET_PARAMS,
+    TRAIN_CSV,
+    XGB_PARAMS,
+    load_training_data,
+    mape,
+    write_csv,
+)
+
+MODEL_TYPES = ["prophet", "xgb", "linear"]
+CACHE_DIR = os.path.join(MODEL_DIR, "backtest_cache")
+
+# 모델별 설정 (캐시 키에 포함되어 설정이 바뀌면 다시 학습)
+MODEL_PARAMS = {"prophet": PROPHET_PARAMS, "xgb": XGB_PARAMS, "linear": {}}
+
+
+def rolling_origins(dates, folds=4, horizon=3):
+    """폴드별 시험 구간 날짜 배열 목록 (오래된 폴드부터)"""
+    dates = np.sort(pd.unique(pd.Series(dates)))
+    if len(dates) <= folds * horizon:
+        raise ValueError(f"학습 월 수({len(dates)})가 folds × horizon 보다 많아야 합니다.")
+    end = len(dates)
+    return [
+        dates[end - (folds - k) * horizon : end - (folds - k - 1) * horizon]
+        for k in range(folds)
+    ]
+
+
+def _fit(model_type, train, categories):
+    if model_type == "prophet":
+        from prophet import Prophet
+
+        logging.getLogger("cmdstanpy").setLevel(logging.WARNING)
+        logging.getLogger("prophet").setLevel(logging.WARNING)
+
+        model = Prophet(**PROPHET_PARAMS)
+        model.fit(train.rename(columns={"날짜": "ds", "입국자수": "y"})[["ds", "y"]])
+        return model
+
+    X = xgb_features(train["년"], train["월"], train["국적지역"], categories)
+    if model_type == "xgb":
+        from xgboost import XGBRegressor
+
+        model = XGBRegressor(**XGB_PARAMS)
+    else:
+        from sklearn.linear_model import LinearRegression
+
+        model = LinearRegression()
+    model.fit(X, train["입국자수"])
+    return model
+
+
+def _predict(model_type, model, test, categories):
+    if model_type == "prophet":
+        return model.predict(test.rename(columns={"날짜": "ds"})[["ds"]])["yhat"].to_numpy()
+    X = xgb_features(test["년"], test["월"], test["국적지역"], categories)
+    return np.asarray(model.predict(X), dtype=float)
+
+
+def _cache_path(cache_dir, model_type, train, categories):
+    """학습 데이터 + 모델 설정 지문으로 만든 폴드 모델 캐시 경로"""
+    settings = json.dumps(
+        {"model": model_type, "params": MODEL_PARAMS[model_type], "categories": categories},
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    key = fingerprint.frame_fingerprint(train, settings)
+    return os.path.join(cache_dir, f"{model_type}_{key[:32]}.pkl")
+
+
+def run_fold(model_type, fold, train, test, categories, cache_dir=CACHE_DIR):
+    """
+    폴드 하나 학습 + 예측 (프로세스 풀 워커에서 실행)
+    캐시에 같은 학습 데이터로 학습된 모델이 있으면 학습을 생략하고 저장된 학습 시간을 사용
+    반환: 시험 구간 행별 (국적지역, 모델, 폴드, 날짜, 입국자수, 예측, 학습 시간, 예측 시간) DataFrame
+    """
+    import joblib
+
+    path = _cache_path(cache_dir, model_type, train, categories) if cache_dir else None
+    if path and os.path.exists(path):
+        cached = joblib.load(path)
+    else:
+        start = time.perf_counter()
+        model = _fit(model_type, train, categories)
+        cached = {"model": model, "fit_seconds": time.perf_counter() - start}
+        if path:
+            os.makedirs(cache_dir, exist_ok=True)
+            joblib.dump(cached, path + ".tmp")
+            os.replace(path + ".tmp", path)
+
+    start = time.perf_counter()
+    predicted = _predict(model_type, cached["model"], test, categories)
+    predict_seconds = time.perf_counter() - start
+
+    return pd.DataFrame(
+        {
+            "국적지역": test["국적지역"].to_numpy(),
+            "모델": model_type,
+            "폴드": fold,
+            "날짜": test["날짜"].to_numpy(),
+            "입국자수": test["입국자수"].to_numpy(),
+            "예측": predicted,
+            "학습 시간(초)": cached["fit_seconds"],
+            "예측 시간(초)": predict_seconds,
+        }
+    )
+
+
+def backtest(df, folds=4, horizon=3, models=MODEL_TYPES, workers=None, cache_dir=CACHE_DIR):
+    """
+    전체 국가 × 모델 × 폴드 교차 검증을 프로세스 풀에서 병렬 실행
+    반환: 시험 구간 행별 예측 결과 DataFrame (run_fold 결과 결합)
+    """
+    categories = sorted(df["국적지역"].unique())
+    jobs = []
+    for fold, test_dates in enumerate(rolling_origins(df["날짜"], folds, horizon)):
+        train = df[df["날짜"] < test_dates[0]]
+        test = df[df["날짜"].isin(test_dates)]
+        for model_type in models:
+            if model_type == "prophet":
+                # Prophet 은 국가별 모델이므로 국가마다 한 작업
+                jobs += [
+                    (model_type, fold, train[train["국적지역"] == c], test[test["국적지역"] == c])
+                    for c in categories
+                ]
+            else:
+                jobs.append((model_type, fold, train, test))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(run_fold, model_type, fold, train, test, categories, cache_dir)
+            for model_type, fold, train, test in jobs
+        ]
+        return pd.concat([f.result() for f in futures], ignore_index=True)
+
+
+def summarize(predictions):
+    """국가 × 모델별 MAPE, RMSE, 폴드당 평균 학습/예측 시간 (evaluation_df.csv 형식)"""
+    rows = []
+    for (country, model_type), group in predictions.groupby(["국적지역", "모델"], sort=True):
+        error = group["예측"] - group["입국자수"]
+        timings = group.drop_duplicates("폴드")
+        rows.append(
+            {
+                "국적지역": country,
+                "모델": model_type,
+                "MAPE(%)": mape(group["입국자수"], group["예측"]),
+                "RMSE": float(np.sqrt(np.mean(error**2))),
+                "학습 시간(초)": timings["학습 시간(초)"].mean(),
+                "예측 시간(초)": timings["예측 시간(초)"].mean(),
+            }
+        )
+    return pd.DataFrame(rows)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="국가별 / 모델별 rolling-origin 교차 검증")
+    parser.add_argument("--data", default=TRAIN_CSV, help="학습 데이터 CSV")
+    parser.add_argument("--folds", type=int, default=4, help="폴드 수")
+    parser.add_argument("--horizon", type=int, default=3, help="폴드당 시험 개월 수")
+    parser.add_argument(
+        "--models", nargs="+", choices=MODEL_TYPES, default=MODEL_TYPES, help="검증할 모델"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None, help="프로세스 수 (기본: CPU 코어 수)"
+    )
+    parser.add_argument("--data-dir", default=DATA_DIR, help="evaluation_df.csv 저장 폴더")
+    parser.add_argument("--cache-dir", default=CACHE_DIR, help="폴드 모델 캐시 폴더")
+    parser.add_argument("--no-cache", action="store_true", help="폴드 모델 캐시 사용 안 함")
+    args = parser.parse_args(argv)
+
+    df = load_training_data(args.data)
+    start = time.perf_counter()
+    predictions = backtest(
+        df,
+        folds=args.folds,
+        horizon=args.horizon,
+        models=args.models,
+        workers=args.workers,
+        cache_dir=None if args.no_cache else args.cache_dir,
+    )
+    evaluation = summarize(predictions)
+    write_csv(evaluation, os.path.join(args.data_dir, "evaluation_df.csv"))
+
+    print(
+        f"✅ {df['국적지역'].nunique()}개국 × {len(args.models)}개 모델 × {args.folds}폴드 "
+        f"검증 완료 ({time.perf_counter() - start:.1f}초)"
+    )
+    print(
+        evaluation.pivot(index="국적지역", columns="모델", values="MAPE(%)")
+        .round(2)
+        .to_string()
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,106 @@
+"""
+한국관광공사 응답 파싱 마이크로 벤치마크 (services.kto.parse_json / parse_xml vs 기존 트리 방식)
+
+실제 searchFestival1 응답과 같은 모양(항목당 필드 20여 개)의 페이지를 만들어
+세 방식의 결과가 같은지 확인한 뒤 페이지당 파싱 시간을 비교한다.
+
+실행: python -m pipeline.bench_kto_parse [--items 100] [--repeat 200]
+"""
+
+import argparse
+import json
+import sys
+import time
+import xml.etree.ElementTree as ET
+
+from services import kto
+
+# 응답에는 있지만 앱에서 쓰지 않는 필드
+EXTRA_FIELDS = [
+    "addr2", "areacode", "booktour", "cat1", "cat2", "cat3", "contenttypeid",
+    "createdtime", "firstimage2", "cpyrhtDivCd", "mapx", "mapy", "mlevel",
+    "sigungucode", "tel",
+]
+
+
+def sample_items(n):
+    items = []
+    for i in range(n):
+        item = {field: f"{field} 값 {i}" for field in kto.FESTIVAL_FIELDS + EXTRA_FIELDS}
+        item["firstimage"] = "" if i % 5 == 0 else item["firstimage"]  # 이미지 없는 축제
+        items.append(item)
+    return items
+
+
+def sample_xml(items):
+    rows = "".join(
+        "<item>" + "".join(f"<{k}>{v}</{k}>" if v else f"<{k}/>" for k, v in item.items()) + "</item>"
+        for item in items
+    )
+    return (
+        "<response><header><resultCode>0000</resultCode><resultMsg>OK</resultMsg></header>"
+        f"<body><items>{rows}</items><numOfRows>{len(items)}</numOfRows>"
+        f"<pageNo>1</pageNo><totalCount>{len(items)}</totalCount></body></response>"
+    ).encode("utf-8")
+
+
+def sample_json(items):
+    body = {"items": {"item": items}, "numOfRows": len(items), "pageNo": 1, "totalCount": len(items)}
+    return json.dumps(
+        {"response": {"header": {"resultCode": "0000", "resultMsg": "OK"}, "body": body}},
+        ensure_ascii=False,
+    ).encode("utf-8")
+
+
+def parse_tree(content, fields):
+    """기존 방식: 전체 트리를 만든 뒤 항목마다 필드별 find"""
+    root = ET.fromstring(content)
+    records = []
+    for item in root.iter("item"):
+        record = {}
+        for field in fields:
+            node = item.find(field)
+            record[field] = node.text if node is not None else None
+        records.append(record)
+    total = root.findtext(".//totalCount")
+    return records, int(total) if total else len(records)
+
+
+def measure(parse, content, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        parse(content, kto.FESTIVAL_FIELDS)
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="한국관광공사 응답 파싱 벤치마크")
+    parser.add_argument("--items", type=int, default=kto.PAGE_SIZE, help="페이지당 항목 수")
+    parser.add_argument("--repeat", type=int, default=200, help="반복 횟수")
+    args = parser.parse_args(argv)
+
+    items = sample_items(args.items)
+    xml_content, json_content = sample_xml(items), sample_json(items)
+
+    expected = parse_tree(xml_content, kto.FESTIVAL_FIELDS)
+    cases = [
+        ("기존 (ET.fromstring + find)", parse_tree, xml_content),
+        ("parse_xml (iterparse)", kto.parse_xml, xml_content),
+        ("parse_json", kto.parse_json, json_content),
+        ("parse_page (JSON 응답)", kto.parse_page, json_content),
+    ]
+    for name, parse, content in cases:
+        if parse(content, kto.FESTIVAL_FIELDS) != expected:
+            print(f"❌ {name}: 기존 방식과 결과가 다릅니다.")
+            return 1
+
+    baseline = None
+    for name, parse, content in cases:
+        ms = measure(parse, content, args.repeat)
+        baseline = baseline or ms
+        print(f"✅ {name}: {ms:.3f} ms/페이지 (x{baseline / ms:.1f}), {len(content) / 1024:.0f} KB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
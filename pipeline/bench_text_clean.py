@@ -0,0 +1,125 @@
+"""
+네이버 블로그 설명 정리 벤치마크 (core.text.clean_html vs 기존 BeautifulSoup 방식)
+
+1. 결과 동일성 확인: 경계 사례 목록 + 무작위 조합 입력에서 기존 방식과 결과 비교
+2. 네이버 검색 결과 모양의 설명(검색어 <b> 강조, &quot; 등 엔티티)으로 설명당 처리 시간 비교
+
+실행: python -m pipeline.bench_text_clean [--samples 2000] [--fuzz 20000]
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+import warnings
+
+from bs4 import BeautifulSoup, MarkupResemblesLocatorWarning
+
+from core.text import clean_html, clean_html_many
+
+# 경계 사례 (네이버 응답에 드물게 섞이는 태그, 세미콜론 없는 엔티티, 공백뿐인 조각, 마크다운 기호)
+EDGE_CASES = [
+    "",
+    " ",
+    " \n",
+    "<b>부산</b> <b>불꽃축제</b>",
+    "<b>축제</b>\n<b>후기</b>",
+    "&quot;진해 군항제&quot; &amp; 벚꽃 &lt;2025&gt; &#39;여좌천&#39;",
+    "&lt;b&gt;태그가 아닌 글자&lt;/b&gt;",
+    "AT&T &amp &copy; &foo; &#150; &#x41; &nbsp;",
+    "1 < 2 > 0, a<1",
+    "<B>대문자</B> <br/>줄바꿈 <a href='x>y'>링크</a>",
+    "<!-- 주석 --> 본문 <!-- 닫히지 않은 주석",
+    "**볼드** __이탤릭__ ~~취소~~ `코드` [링크](https://blog.naver.com)",
+    "**<b>강조</b>** 안의 [<b>링크</b>](url) ~~&quot;인용&quot;~~",
+    "끝이 잘린 태그 <b",
+    "\r\n윈도우 줄바꿈\r\n",
+]
+
+FUZZ_TOKENS = [
+    "<b>", "</b>", "&quot;", "&amp;", "&lt;", "&gt;", "&#39;", "&nbsp;", "&amp", "&foo;",
+    "**", "__", "~~", "`", "[", "](", ")", "<", ">", "&", "<br/>", "<!--", "-->",
+    "축제", "a", " ", "\n", "\r", "\t", "*", "_", "~",
+]
+
+MARKDOWN_PATTERNS = [
+    r"\*\*(.*?)\*\*",
+    r"__(.*?)__",
+    r"~~(.*?)~~",
+    r"`(.*?)`",
+    r"\[(.*?)\]\(.*?\)",
+]
+
+
+def clean_html_with_bs(text):
+    """기존 방식 (Festival, Seasons, Tourist Spot 메뉴에 복사되어 있던 함수)"""
+    cleaned_text = BeautifulSoup(text, "html.parser").get_text()
+    for pattern in MARKDOWN_PATTERNS:
+        cleaned_text = re.sub(pattern, r"\1", cleaned_text)
+    return cleaned_text
+
+
+def naver_like_samples(n, rng):
+    """네이버 블로그 검색 설명 모양의 샘플 (검색어 강조, 엔티티, 가끔 마크다운)"""
+    words = ["벚꽃", "축제", "여행", "후기", "주차", "맛집", "야경", "코스", "가족", "주말", "2025"]
+    samples = []
+    for _ in range(n):
+        parts = []
+        for _ in range(rng.randint(15, 40)):
+            word = rng.choice(words)
+            roll = rng.random()
+            if roll < 0.15:
+                word = f"<b>{word}</b>"
+            elif roll < 0.2:
+                word = f"&quot;{word}&quot;"
+            elif roll < 0.22:
+                word = f"**{word}**"
+            parts.append(word)
+        samples.append(" ".join(parts) + " ...")
+    return samples
+
+
+def check_equivalence(fuzz, rng):
+    """기존 방식과 결과가 다른 입력 목록"""
+    inputs = list(EDGE_CASES)
+    inputs += [
+        "".join(rng.choice(FUZZ_TOKENS) for _ in range(rng.randint(0, 12))) for _ in range(fuzz)
+    ]
+    return [text for text in inputs if clean_html(text) != clean_html_with_bs(text)]
+
+
+def measure(func, samples):
+    start = time.perf_counter()
+    func(samples)
+    return (time.perf_counter() - start) / len(samples) * 1e6
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="네이버 블로그 설명 정리 벤치마크")
+    parser.add_argument("--samples", type=int, default=2000, help="벤치마크 설명 수")
+    parser.add_argument("--fuzz", type=int, default=20000, help="무작위 동일성 검사 입력 수")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    # 짧은 입력에 대한 BeautifulSoup 경고 (URL/파일명처럼 보임) 숨김
+    warnings.filterwarnings("ignore", category=MarkupResemblesLocatorWarning)
+    rng = random.Random(args.seed)
+
+    mismatches = check_equivalence(args.fuzz, rng)
+    if mismatches:
+        for text in mismatches[:10]:
+            print(f"❌ {text!r}: {clean_html_with_bs(text)!r} != {clean_html(text)!r}")
+        return 1
+    print(f"✅ 경계 사례 {len(EDGE_CASES)}개 + 무작위 {args.fuzz}개 입력 결과 동일")
+
+    samples = naver_like_samples(args.samples, rng)
+    before = measure(lambda texts: [clean_html_with_bs(t) for t in texts], samples)
+    after = measure(clean_html_many, samples)
+    print(f"✅ 기존 (BeautifulSoup + re.sub): {before:.1f} µs/설명")
+    print(f"✅ core.text.clean_html_many: {after:.1f} µs/설명 (x{before / after:.1f})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+"""
+학습 데이터 지문(fingerprint) 관리
+
+국가별 입국자 수 시계열과 학습 설정을 해시하여 model/train_manifest.json 에 저장하고,
+다음 학습 때 지문이 바뀐 국가만 다시 학습하도록 비교한다.
+"""
+
+import hashlib
+import json
+import os
+
+import pandas as pd
+
+MANIFEST_FILE = "train_manifest.json"
+
+
+def _hash(*parts):
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part if isinstance(part, bytes) else str(part).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def series_fingerprint(history, settings):
+    """한 국가의 (날짜, 입국자수) 시계열 + 학습 설정 해시"""
+    values = pd.util.hash_pandas_object(
+        history[["날짜", "입국자수"]].reset_index(drop=True), index=False
+    )
+    return _hash(values.to_numpy().tobytes(), settings)
+
+
+def frame_fingerprint(df, settings):
+    """여러 국가 (국적지역, 날짜, 입국자수) 학습 데이터 + 설정 해시 (교차 검증 폴드 모델 캐시 키)"""
+    values = pd.util.hash_pandas_object(
+        df[["국적지역", "날짜", "입국자수"]].reset_index(drop=True), index=False
+    )
+    return _hash(values.to_numpy().tobytes(), settings)
+
+
+def compute(df, settings):
+    """
+    학습 데이터 전체의 지문
+    - countries: {국가: 시계열 지문} (Prophet 국가별 모델용)
+    - xgb: 전체 데이터 지문 (XGB 는 모든 국가를 함께 학습하므로)
+    """
+    settings = json.dumps(settings, sort_keys=True, ensure_ascii=False)
+    countries = {
+        country: series_fingerprint(history, settings)
+        for country, history in df.groupby("국적지역", sort=True)
+    }
+    return {
+        "countries": countries,
+        "xgb": _hash(*[f"{c}:{fp}" for c, fp in countries.items()]),
+    }
+
+
+def changed(current, previous):
+    """
+    다시 학습해야 하는 (국가 목록, XGB 재학습 여부)
+    이전 지문이 없으면 전체 재학습
+    """
+    if previous is None:
+        return sorted(current["countries"]), True
+    old = previous["countries"]
+    countries = [c for c, fp in sorted(current["countries"].items()) if old.get(c) != fp]
+    return countries, current["xgb"] != previous["xgb"]
+
+
+def load_manifest(model_dir):
+    """저장된 지문 로드, 없으면 None"""
+    path = os.path.join(model_dir, MANIFEST_FILE)
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_manifest(fingerprints, model_dir):
+    """지문 저장 (임시 파일에 쓴 뒤 교체)"""
+    path = os.path.join(model_dir, MANIFEST_FILE)
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(fingerprints, f, ensure_ascii=False, indent=2)
+    os.replace(path + ".tmp", path)
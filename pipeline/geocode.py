@@ -0,0 +1,68 @@
+"""
+축제/계절 여행지 주소 좌표 미리 변환 (카카오 주소 검색 → services.kakao 디스크 캐시)
+
+pipeline.kto_sync 로컬 사본(data/kto/*.json)의 모든 주소를 동시에 변환해 두어
+Tourist Spot 메뉴의 지도가 카카오 응답을 기다리지 않도록 한다.
+
+실행: python -m pipeline.geocode
+카카오 REST 키: 환경 변수 KAKAO_API_KEY 또는 .streamlit/secrets.toml 의 KAKAO_API_KEY
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+import tomllib
+
+from pipeline.kto_sync import SECRETS_PATH
+from services import kakao, kto
+
+
+def load_api_key():
+    """카카오 REST API 키 (환경 변수 우선)"""
+    key = os.environ.get("KAKAO_API_KEY")
+    if key:
+        return key
+    if os.path.exists(SECRETS_PATH):
+        with open(SECRETS_PATH, "rb") as f:
+            return tomllib.load(f).get("KAKAO_API_KEY")
+    return None
+
+
+def local_addresses(local_dir=kto.LOCAL_DIR):
+    """로컬 사본 전체의 주소 목록 (중복 제거)"""
+    addresses = []
+    for path in sorted(glob.glob(os.path.join(local_dir, "*.json"))):
+        name = os.path.splitext(os.path.basename(path))[0]
+        addresses += [r["addr1"] for r in kto.load_local(name, local_dir, max_age=None) if r.get("addr1")]
+    return list(dict.fromkeys(addresses))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="축제/여행지 주소 좌표 미리 변환")
+    parser.add_argument("--local-dir", default=kto.LOCAL_DIR, help="kto_sync 로컬 사본 폴더")
+    args = parser.parse_args(argv)
+
+    api_key = load_api_key()
+    if not api_key:
+        print("❌ 카카오 REST API 키가 없습니다. (KAKAO_API_KEY)")
+        return 1
+
+    addresses = local_addresses(args.local_dir)
+    if not addresses:
+        print("❌ 주소가 없습니다. 먼저 python -m pipeline.kto_sync 를 실행하세요.")
+        return 1
+
+    start = time.perf_counter()
+    results = kakao.geocode_many(addresses, api_key)
+    found = sum(result is not None for result in results.values())
+    print(
+        f"✅ 주소 {len(addresses)}개 중 {found}개 좌표 변환 "
+        f"({time.perf_counter() - start:.1f}초, 캐시 {kakao.GEOCODE_CACHE.stats()})"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
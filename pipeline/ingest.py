@@ -0,0 +1,175 @@
+"""
+법무부 외국인 입국자 원본 CSV 수집 (processed/df18, df19, df23_24, df18_19_23_24 노트북을 한 번에 실행)
+
+- data/법무부_*.csv 를 cp949 로 청크 단위 읽기 (파일별 프로세스 병렬)
+- 월별 컬럼형(18, 19년)과 년/월 행형(22~24년) 양식을 모두 년, 월, 국적지역, 입국자수 로 변환
+- 국적명은 core.nationality 레지스트리로 고유값 단위 한 번만 매핑 (행 단위 replace 없음)
+- 스키마 검증 후 data/df_arrivals.csv (전체 국가), data/df_top15.csv (상위 15개국) 저장
+
+실행: python -m pipeline.ingest [--workers N] [--top 15]
+"""
+
+import argparse
+import glob
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from core.nationality import REGISTRY
+
+DATA_DIR = "data"
+RAW_PATTERN = "법무부_*.csv"
+RAW_ENCODING = "cp949"
+CHUNK_SIZE = 50_000
+COLUMNS = ["년", "월", "국적지역", "입국자수"]
+
+# 코로나 입국 제한 기간 (2022년 6월 이후에도 일부 국가 제한이 지속되어 22년 전체 제외)
+EXCLUDED_YEARS = [2020, 2021, 2022]
+
+MONTH_COLUMN = re.compile(r"^(\d{1,2})월$")
+
+
+def map_nationalities(values):
+    """국적명 배열 정규화 (공백 제거 + 별칭 통합, core.nationality 레지스트리)"""
+    return REGISTRY.map_series(values)
+
+
+def _to_counts(series):
+    """입국자수 컬럼을 정수로 변환 ('125465 ', '1,234' 같은 문자열 포함)"""
+    if series.dtype == object or pd.api.types.is_string_dtype(series):
+        series = series.astype(str).str.strip().str.replace(",", "")
+    return pd.to_numeric(series, errors="raise").astype(np.int64)
+
+
+def _year_from_filename(path):
+    match = re.search(r"\((\d{4})", os.path.basename(path))
+    if not match:
+        raise ValueError(f"파일명에서 연도를 찾을 수 없습니다: {path}")
+    return int(match.group(1))
+
+
+def _long_chunk(chunk):
+    """년, 월, 국적지역, 입국자수 행형 청크 (22~24년 양식)"""
+    return pd.DataFrame(
+        {
+            "년": pd.to_numeric(chunk["년"]).astype(np.int64),
+            "월": pd.to_numeric(chunk["월"]).astype(np.int64),
+            "국적지역": map_nationalities(chunk["국적지역"]),
+            "입국자수": _to_counts(chunk["입국자수"]),
+        }
+    )
+
+
+def _wide_chunk(chunk, year):
+    """국적 + 1월~12월 컬럼형 청크 (18, 19년 양식, 성별 행은 합산)"""
+    month_columns = {
+        col: int(MONTH_COLUMN.match(col).group(1))
+        for col in chunk.columns
+        if MONTH_COLUMN.match(col)
+    }
+    if len(month_columns) != 12:
+        raise ValueError(f"월별 컬럼이 12개가 아닙니다: {list(chunk.columns)}")
+
+    nationalities = map_nationalities(chunk["국적"])
+    counts = np.column_stack([_to_counts(chunk[col]) for col in month_columns])
+    return pd.DataFrame(
+        {
+            "년": year,
+            "월": np.tile(list(month_columns.values()), len(chunk)),
+            "국적지역": np.repeat(nationalities, len(month_columns)),
+            "입국자수": counts.ravel(),
+        }
+    )
+
+
+def read_raw_file(path, chunk_size=CHUNK_SIZE):
+    """원본 CSV 한 개를 청크 단위로 읽어 (년, 월, 국적지역) 별 합계 반환"""
+    partials = []
+    year = None
+    for chunk in pd.read_csv(path, encoding=RAW_ENCODING, chunksize=chunk_size):
+        # '국  적', '1 월' 처럼 공백이 섞인 컬럼명 정리
+        chunk.columns = chunk.columns.str.replace(" ", "")
+        if "국적지역" in chunk.columns:
+            frame = _long_chunk(chunk)
+        elif "국적" in chunk.columns:
+            year = year or _year_from_filename(path)
+            frame = _wide_chunk(chunk, year)
+        else:
+            raise ValueError(f"알 수 없는 양식입니다: {path} {list(chunk.columns)}")
+        # ✅ 청크마다 부분 합계 (남/여, 통합된 국적명 합산)
+        partials.append(frame.groupby(COLUMNS[:3], as_index=False)["입국자수"].sum())
+
+    df = pd.concat(partials, ignore_index=True)
+    return df.groupby(COLUMNS[:3], as_index=False)["입국자수"].sum()
+
+
+def validate(df):
+    """정규화된 long 테이블 스키마 검증, 문제가 있으면 ValueError"""
+    if list(df.columns) != COLUMNS:
+        raise ValueError(f"컬럼이 {COLUMNS} 와 다릅니다: {list(df.columns)}")
+    if df[COLUMNS].isna().any().any():
+        raise ValueError("빈 값이 있습니다.")
+    if not df["월"].between(1, 12).all():
+        raise ValueError("월 값이 1~12 범위를 벗어났습니다.")
+    if (df["입국자수"] < 0).any():
+        raise ValueError("입국자수에 음수가 있습니다.")
+    if df.duplicated(COLUMNS[:3]).any():
+        raise ValueError("년, 월, 국적지역 중복 행이 있습니다.")
+    return df
+
+
+def ingest(paths, workers=None):
+    """원본 CSV 들을 병렬로 읽어 하나의 long 테이블 (총계, 제외 연도 삭제) 로 결합"""
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        frames = list(executor.map(read_raw_file, paths))
+
+    df = pd.concat(frames, ignore_index=True)
+    df = df[(df["국적지역"] != "총계") & ~df["년"].isin(EXCLUDED_YEARS)]
+    # 여러 파일에 같은 년월이 있으면 합산
+    df = df.groupby(COLUMNS[:3], as_index=False)["입국자수"].sum()
+    df = df.sort_values(["국적지역", "년", "월"]).reset_index(drop=True)
+    return validate(df[COLUMNS])
+
+
+def select_top(df, top=15):
+    """전체 기간 입국자수 합계 상위 top 개국 + 날짜 컬럼 (df_top15.csv 형식)"""
+    totals = df.groupby("국적지역")["입국자수"].sum().sort_values(ascending=False)
+    top_df = df[df["국적지역"].isin(totals.head(top).index)].copy()
+    top_df["날짜"] = pd.to_datetime(
+        {"year": top_df["년"], "month": top_df["월"], "day": 1}
+    )
+    return top_df.sort_values(["국적지역", "날짜"]).reset_index(drop=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="법무부 입국자 원본 CSV 수집")
+    parser.add_argument("--data-dir", default=DATA_DIR, help="원본/결과 CSV 폴더")
+    parser.add_argument("--top", type=int, default=15, help="학습 대상 상위 국가 수")
+    parser.add_argument(
+        "--workers", type=int, default=None, help="프로세스 수 (기본: CPU 코어 수)"
+    )
+    args = parser.parse_args(argv)
+
+    paths = sorted(glob.glob(os.path.join(args.data_dir, RAW_PATTERN)))
+    if not paths:
+        print(f"❌ 원본 파일이 없습니다: {os.path.join(args.data_dir, RAW_PATTERN)}")
+        return 1
+
+    df = ingest(paths, workers=args.workers)
+    top_df = select_top(df, args.top)
+
+    df.to_csv(os.path.join(args.data_dir, "df_arrivals.csv"), index=False)
+    top_df.to_csv(os.path.join(args.data_dir, f"df_top{args.top}.csv"), index=False)
+    print(
+        f"✅ {len(paths)}개 파일, {df['국적지역'].nunique()}개 국적 {len(df)}행 수집, "
+        f"상위 {args.top}개국 {len(top_df)}행 저장"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,194 @@
+"""
+한국관광공사 축제/계절 키워드 목록 증분 동기화 (data/kto/*.json 로컬 사본)
+
+- contentid 기준 로컬 사본 유지, 수정일(modifiedtime) 최신순으로 받아 마지막 동기화 이후 바뀐 항목만 반영
+- 수정일이 바뀌었어도 내용 해시가 같으면 갱신하지 않음
+- 임시 파일에 쓴 뒤 교체하여 앱이 읽는 도중 반쯤 쓰인 파일을 보지 않도록 함
+- 첫 동기화 또는 --full 은 모든 페이지를 동시에 받아 전체 교체 (API 에서 삭제된 항목 정리)
+- 축제 사본에는 시작일(since)을 함께 저장 (앱은 그 이전 월을 API 로 조회), --since 가 바뀌면 전체 받기
+
+실행: python -m pipeline.kto_sync [--full] [--since 20250101] [--loop 초]
+서비스 키: 환경 변수 DATA_GO_API_KEY 또는 .streamlit/secrets.toml 의 data_go_API_KEY
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+import tomllib
+from datetime import date
+
+from services import http, kto
+
+SECRETS_PATH = os.path.join(".streamlit", "secrets.toml")
+SEASONS = ["봄", "여름", "가을", "겨울"]
+
+
+def load_service_key():
+    """공공데이터포털 서비스 키 (환경 변수 우선)"""
+    key = os.environ.get("DATA_GO_API_KEY")
+    if key:
+        return key
+    if os.path.exists(SECRETS_PATH):
+        with open(SECRETS_PATH, "rb") as f:
+            return tomllib.load(f).get("data_go_API_KEY")
+    return None
+
+
+def content_hash(record):
+    """수정일을 제외한 레코드 내용 해시"""
+    content = {k: v for k, v in record.items() if k != "modifiedtime"}
+    return hashlib.sha256(
+        json.dumps(content, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    ).hexdigest()
+
+
+def load_store(name, local_dir=kto.LOCAL_DIR):
+    """로컬 사본 {watermark, synced_at, since, items: {contentid: {hash, record}}}, 없으면 빈 사본"""
+    path = os.path.join(local_dir, f"{name}.json")
+    if not os.path.exists(path):
+        return {"watermark": "", "synced_at": None, "since": None, "items": {}}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_store(name, store, local_dir=kto.LOCAL_DIR):
+    """로컬 사본 저장 (임시 파일에 쓴 뒤 교체)"""
+    os.makedirs(local_dir, exist_ok=True)
+    path = os.path.join(local_dir, f"{name}.json")
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(store, f, ensure_ascii=False)
+    os.replace(path + ".tmp", path)
+
+
+def fetch_changed(url, params, fields, watermark, page_size=kto.PAGE_SIZE):
+    """
+    수정일 최신순(arrange=C) 페이지를 차례로 받아 watermark 이후 수정된 레코드만 반환
+    watermark 이하 항목이 나오면 이후 페이지는 요청하지 않음, 요청 실패/오류 응답 시 None
+    """
+    changed = []
+    page_no = 1
+    while True:
+        response = http.get(url, params=dict(params, numOfRows=page_size, pageNo=page_no))
+        if response.status_code != 200:
+            return None
+        page = kto.parse_page(response.content, fields)
+        if page is None:  # 인증키 오류 등 오류 응답
+            return None
+        records, total = page
+        for record in records:
+            if (record["modifiedtime"] or "") <= watermark:
+                return changed
+            changed.append(record)
+        if page_no * page_size >= total:
+            return changed
+        page_no += 1
+
+
+def sync(name, url, params, fields, full=False, local_dir=kto.LOCAL_DIR, since=None):
+    """
+    로컬 사본 하나 동기화
+    since: 축제 시작일 기준 (YYYYMMDD), 저장된 사본의 시작일과 다르면 전체 받기
+    반환: {added, updated, unchanged, total} 또는 요청 실패 시 None
+    (기존 사본이 있는데 전체 받기 결과가 비어 있어도 실패로 보고 사본 유지)
+    """
+    store = load_store(name, local_dir)
+    full = full or not store["items"] or store.get("since") != since
+    params = dict(params, arrange="C")
+
+    if full:
+        records = kto.fetch_all_pages(url, params, fields)
+        items = {}
+    else:
+        records = fetch_changed(url, params, fields, store["watermark"])
+        items = dict(store["items"])
+    if records is None:
+        return None
+    if full and not records and store["items"]:
+        # 전체 받기 결과가 비어 있으면 API 이상으로 보고 기존 사본을 지우지 않음
+        return None
+
+    counts = {"added": 0, "updated": 0, "unchanged": 0}
+    previous = store["items"]
+    for record in records:
+        key = record["contentid"]
+        digest = content_hash(record)
+        old = previous.get(key)
+        if old is None:
+            counts["added"] += 1
+        elif old["hash"] == digest:
+            counts["unchanged"] += 1
+            items[key] = old
+            continue
+        else:
+            counts["updated"] += 1
+        items[key] = {"hash": digest, "record": record}
+
+    modified = [r["modifiedtime"] for r in records if r["modifiedtime"]]
+    store = {
+        "watermark": max(modified + [store["watermark"]]),
+        "synced_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "since": since,
+        "items": items,
+    }
+    save_store(name, store, local_dir)
+    return dict(counts, total=len(items))
+
+
+def sync_all(service_key, since, full=False, local_dir=kto.LOCAL_DIR):
+    """축제 + 계절 키워드 목록 동기화, {이름: 결과}"""
+    common = kto.common_params(service_key)
+    targets = [
+        ("festival", kto.FESTIVAL_URL, dict(common, eventStartDate=since), kto.FESTIVAL_FIELDS, since)
+    ] + [
+        (f"keyword_{season}", kto.KEYWORD_URL, dict(common, keyword=season), kto.KEYWORD_FIELDS, None)
+        for season in SEASONS
+    ]
+    return {
+        name: sync(name, url, params, fields, full=full, local_dir=local_dir, since=start)
+        for name, url, params, fields, start in targets
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="한국관광공사 축제/키워드 목록 증분 동기화")
+    parser.add_argument("--full", action="store_true", help="증분 대신 전체 다시 받기")
+    parser.add_argument(
+        "--since",
+        default=f"{date.today().year}0101",
+        help="축제 시작일 기준 (YYYYMMDD, 기본: 올해 1월 1일)",
+    )
+    parser.add_argument("--local-dir", default=kto.LOCAL_DIR, help="로컬 사본 폴더")
+    parser.add_argument(
+        "--loop", type=int, default=None, help="지정한 초 간격으로 계속 동기화"
+    )
+    args = parser.parse_args(argv)
+
+    service_key = load_service_key()
+    if not service_key:
+        print("❌ 공공데이터포털 서비스 키가 없습니다. (DATA_GO_API_KEY)")
+        return 1
+
+    full = args.full
+    while True:
+        start = time.perf_counter()
+        results = sync_all(service_key, args.since, full=full, local_dir=args.local_dir)
+        for name, result in results.items():
+            if result is None:
+                print(f"❌ {name}: API 요청 실패 또는 오류/빈 응답, 기존 사본 유지")
+            else:
+                print(
+                    f"✅ {name}: 추가 {result['added']}, 변경 {result['updated']}, "
+                    f"동일 {result['unchanged']}, 전체 {result['total']}"
+                )
+        print(f"⏱ {time.perf_counter() - start:.1f}초")
+        if args.loop is None:
+            return 0 if all(r is not None for r in results.values()) else 1
+        full = False  # 반복 실행 시 전체 받기는 첫 회만
+        time.sleep(args.loop)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
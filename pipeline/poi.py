@@ -0,0 +1,79 @@
+"""
+관광지/숙소 POI 저장소 채우기 (services.poi_store)
+
+pipeline.kto_sync 로컬 사본(data/kto/*.json)의 축제/여행지 주소 좌표(services.kakao 디스크 캐시) 주변
+관광명소(AT4)·숙박(AD5)을 카카오 카테고리 검색으로 받아 저장해 두어
+Tourist Spot 메뉴가 실시간 키워드 검색 없이 반경 조회로 추천하도록 한다.
+
+실행: python -m pipeline.poi [--radius-km 10]  (pipeline.kto_sync, pipeline.geocode 이후)
+카카오 REST 키: 환경 변수 KAKAO_API_KEY 또는 .streamlit/secrets.toml 의 KAKAO_API_KEY
+"""
+
+import argparse
+import sys
+import time
+
+import requests
+
+from core.poi import CELL_DEG
+from pipeline.geocode import load_api_key, local_addresses
+from services import http, kakao, kto, poi_store
+from services.fanout import fan_out
+
+DEFAULT_RADIUS_KM = 10
+
+
+def search_centers(coordinates):
+    """가까운 좌표는 격자 칸 하나당 한 번만 검색 (칸 중심 좌표 목록)"""
+    cells = {(round(lat / CELL_DEG), round(lng / CELL_DEG)) for lat, lng in coordinates}
+    return [(row * CELL_DEG, col * CELL_DEG) for row, col in sorted(cells)]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="관광지/숙소 POI 저장소 채우기")
+    parser.add_argument("--local-dir", default=kto.LOCAL_DIR, help="kto_sync 로컬 사본 폴더")
+    parser.add_argument(
+        "--radius-km", type=float, default=DEFAULT_RADIUS_KM, help="좌표별 검색 반경 (km)"
+    )
+    args = parser.parse_args(argv)
+
+    api_key = load_api_key()
+    if not api_key:
+        print("❌ 카카오 REST API 키가 없습니다. (KAKAO_API_KEY)")
+        return 1
+
+    addresses = local_addresses(args.local_dir)
+    if not addresses:
+        print("❌ 주소가 없습니다. 먼저 python -m pipeline.kto_sync 를 실행하세요.")
+        return 1
+
+    start = time.perf_counter()
+    coordinates = [c for c in kakao.geocode_many(addresses, api_key).values() if c]
+    centers = search_centers(coordinates)
+    jobs = [
+        (code, lat, lng)
+        for lat, lng in centers
+        for code in poi_store.ATTRACTION_CODES + poi_store.LODGING_CODES
+    ]
+
+    def search(job):
+        code, lat, lng = job
+        try:
+            return kakao.search_category(code, lat, lng, args.radius_km * 1000, api_key)
+        except (http.ApiError, requests.RequestException) as e:
+            print(f"⚠ {code} ({lat:.2f}, {lng:.2f}) 검색 실패: {e}")
+            return None
+
+    results = fan_out(search, jobs)
+    saved = sum(poi_store.record_places(documents) for documents in results if documents)
+    failed = sum(documents is None for documents in results)
+    print(
+        f"✅ 좌표 {len(coordinates)}개 → 검색 지점 {len(centers)}개, 장소 {saved}건 저장 "
+        f"(실패 {failed}건, 저장소 {len(poi_store.load_places())}곳, "
+        f"{time.perf_counter() - start:.1f}초)"
+    )
+    return 0 if not failed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
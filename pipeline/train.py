@@ -0,0 +1,328 @@
+"""
+국가별 입국자 수 예측 모델 학습 파이프라인 (model/ml_prophet.ipynb, ml_XGBRegressor.ipynb 를 한 번에 실행)
+
+- data/df_top15.csv 를 읽어 국가별 Prophet 모델을 프로세스 풀에서 병렬 학습
+- 중국처럼 Prophet 오차가 큰 국가는 XGBRegressor 예측으로 대체
+- data/df_total.csv, model/prophet_model.pkl, model/xgb_model.pkl 저장
+  (data/evaluation_df.csv 는 pipeline.backtest 가 교차 검증으로 생성, 여기서는 학습 구간 MAPE 만 출력)
+- 국가별 시계열 지문(model/train_manifest.json)이 바뀐 국가만 다시 학습 (--full 로 전체 재학습)
+
+실행: python -m pipeline.train [--workers N] [--periods 24] [--full] [--warm-start]
+필요 패키지: prophet, xgboost, scikit-learn, joblib
+"""
+
+import argparse
+import logging
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from core.features import MODEL_DIR, XGB_COUNTRIES, future_grid, xgb_features
+from pipeline import fingerprint
+
+DATA_DIR = "data"
+TRAIN_CSV = os.path.join(DATA_DIR, "df_top15.csv")
+
+# ✅ Prophet 설정 (ml_prophet.ipynb 전체국가 예측과 동일)
+PROPHET_PARAMS = {
+    "yearly_seasonality": True,
+    "weekly_seasonality": False,
+    "daily_seasonality": False,
+    "seasonality_mode": "multiplicative",
+}
+
+# ✅ XGBRegressor 설정 (ml_XGBRegressor.ipynb 월_sin, 월_cos 적용 모델과 동일)
+XGB_PARAMS = {
+    "n_estimators": 100,
+    "learning_rate": 0.05,
+    "max_depth": 8,
+    "reg_lambda": 0.5,
+    "random_state": 42,
+}
+
+
+def load_training_data(path=TRAIN_CSV):
+    """학습 데이터 로드 (년, 월, 국적지역, 입국자수, 날짜)"""
+    df = pd.read_csv(path)
+    df["날짜"] = pd.to_datetime(df["날짜"])
+    return df.sort_values(["국적지역", "날짜"]).reset_index(drop=True)
+
+
+def to_year_month(ds):
+    """
+    Prophet 예측 날짜를 (년, 월) 로 변환
+    미래 구간은 월말(freq="ME") 날짜이므로 다음 달로 넘김 (2024-12-31 → 2025년 1월)
+    """
+    ds = pd.to_datetime(ds)
+    shifted = ds.where(ds.dt.day == 1, ds + pd.Timedelta(days=1))
+    return shifted.dt.year.to_numpy(), shifted.dt.month.to_numpy()
+
+
+def mape(actual, predicted):
+    """평균 절대 백분율 오차 (%)"""
+    actual = np.asarray(actual, dtype=float)
+    predicted = np.asarray(predicted, dtype=float)
+    return float(np.mean(np.abs((actual - predicted) / actual)) * 100)
+
+
+def warm_start_params(model):
+    """학습된 Prophet 모델의 파라미터를 다음 학습의 초기값(init)으로 변환"""
+    params = {name: model.params[name][0][0] for name in ["k", "m", "sigma_obs"]}
+    params.update({name: model.params[name][0] for name in ["delta", "beta"]})
+    return params
+
+
+def fit_prophet(country, history, periods, init=None):
+    """
+    한 국가의 Prophet 모델 학습 및 예측 (프로세스 풀 워커에서 실행)
+    init 이 주어지면 이전 모델 파라미터에서 최적화를 시작 (warm start)
+    반환: (국가, 모델, 예측 DataFrame[년, 월, 국적지역, 입국자수], MAPE)
+    """
+    from prophet import Prophet
+
+    logging.getLogger("cmdstanpy").setLevel(logging.WARNING)
+    logging.getLogger("prophet").setLevel(logging.WARNING)
+
+    df_country = history.rename(columns={"날짜": "ds", "입국자수": "y"})[["ds", "y"]]
+    model = Prophet(**PROPHET_PARAMS)
+    # init 의 배열 길이가 맞지 않으면 Prophet 이 기본 초기값으로 대체
+    fit_kwargs = {"init": init} if init else {}
+    model.fit(df_country, **fit_kwargs)
+
+    future = model.make_future_dataframe(periods=periods, freq="ME")
+    forecast = model.predict(future)
+
+    # ✅ 학습 구간 예측값으로 MAPE 계산
+    merged = df_country.merge(forecast[["ds", "yhat"]], on="ds", how="inner")
+    score = mape(merged["y"], merged["yhat"])
+
+    years, months = to_year_month(forecast["ds"])
+    result = pd.DataFrame(
+        {
+            "년": years,
+            "월": months,
+            "국적지역": country,
+            "입국자수": forecast["yhat"].astype(int).to_numpy(),
+        }
+    )
+    return country, model, result, score
+
+
+def future_year_months(last_date, periods):
+    """마지막 학습 월 다음 달부터 periods 개월의 (년, 월) 배열"""
+    start = pd.Timestamp(last_date).to_period("M") + 1
+    future = pd.period_range(start, periods=periods, freq="M")
+    return future.year.to_numpy(), future.month.to_numpy()
+
+
+def fit_xgb(df, periods, countries=XGB_COUNTRIES):
+    """
+    전체 국가 데이터로 XGBRegressor 학습 후 지정 국가의 미래 입국자 수 예측
+    반환: (모델, 예측 DataFrame[년, 월, 국적지역, 입국자수])
+    """
+    from sklearn.model_selection import train_test_split
+    from xgboost import XGBRegressor
+
+    categories = sorted(df["국적지역"].unique())
+    X = xgb_features(df["년"], df["월"], df["국적지역"], categories)
+    y = df["입국자수"]
+    X_train, _, y_train, _ = train_test_split(X, y, test_size=0.2, random_state=22)
+
+    model = XGBRegressor(**XGB_PARAMS)
+    model.fit(X_train, y_train)
+
+    # ✅ 예측 대상 국가 × 미래 월 피처를 한 번에 만들어 한 번의 predict 로 예측
+    years, months = future_year_months(df["날짜"].max(), periods)
+    X_future, row_years, row_months, row_countries = future_grid(
+        years, months, countries, categories
+    )
+    forecast = pd.DataFrame(
+        {
+            "년": row_years,
+            "월": row_months,
+            "국적지역": row_countries,
+            "입국자수": np.round(model.predict(X_future)).astype(int),
+        }
+    )
+    return model, forecast
+
+
+def train_all(df, periods=24, workers=None, countries=None, warm_models=None, refit_xgb=True):
+    """
+    모델 학습
+    Prophet 은 국가별로 프로세스 풀에서 병렬 실행, XGB 는 같은 풀에 함께 제출
+    - countries: 학습할 국가 (기본: 전체)
+    - warm_models: {국가: 이전 Prophet 모델}, 있으면 해당 파라미터로 warm start
+    - refit_xgb: False 면 XGB 학습 생략
+    """
+    workers = workers or os.cpu_count()
+    warm_models = warm_models or {}
+    groups = [
+        (country, history)
+        for country, history in df.groupby("국적지역", sort=True)
+        if countries is None or country in countries
+    ]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        xgb_future = executor.submit(fit_xgb, df, periods) if refit_xgb else None
+        prophet_futures = [
+            executor.submit(
+                fit_prophet,
+                country,
+                history,
+                periods,
+                warm_start_params(warm_models[country]) if country in warm_models else None,
+            )
+            for country, history in groups
+        ]
+        prophet_results = [f.result() for f in prophet_futures]
+        xgb_model, xgb_forecast = xgb_future.result() if xgb_future else (None, None)
+
+    return {
+        "prophet_models": {country: model for country, model, _, _ in prophet_results},
+        "prophet_forecasts": {country: fc for country, _, fc, _ in prophet_results},
+        "evaluation": pd.DataFrame(
+            [{"국적지역": country, "MAPE(%)": score} for country, _, _, score in prophet_results],
+            columns=["국적지역", "MAPE(%)"],
+        ),
+        "xgb_model": xgb_model,
+        "xgb_forecast": xgb_forecast,
+    }
+
+
+def load_previous(data_dir=DATA_DIR, model_dir=MODEL_DIR):
+    """이전 학습 결과 (df_total, 모델) 로드, 하나라도 없으면 None"""
+    import joblib
+
+    paths = {
+        "total": os.path.join(data_dir, "df_total.csv"),
+        "prophet_models": os.path.join(model_dir, "prophet_model.pkl"),
+        "xgb_model": os.path.join(model_dir, "xgb_model.pkl"),
+    }
+    if not all(os.path.exists(path) for path in paths.values()):
+        return None
+    prophet_models = joblib.load(paths["prophet_models"])
+    if not isinstance(prophet_models, dict):
+        # 노트북에서 저장한 단일 모델 파일이면 재사용 불가
+        return None
+    return {
+        "total": pd.read_csv(paths["total"]),
+        "prophet_models": prophet_models,
+        "xgb_model": joblib.load(paths["xgb_model"]),
+    }
+
+
+def merge_previous(df, results, previous):
+    """이번에 학습하지 않은 국가/모델은 이전 결과로 채움 (바뀐 국가의 행만 교체)"""
+    total = previous["total"]
+    for country, model in previous["prophet_models"].items():
+        if country in results["prophet_models"]:
+            continue
+        results["prophet_models"][country] = model
+        results["prophet_forecasts"][country] = total[total["국적지역"] == country]
+
+    if results["xgb_model"] is None:
+        # XGB 미래 예측 = 이전 df_total 중 학습 데이터 마지막 월 이후 행
+        period = total["년"] * 12 + total["월"]
+        last = df["날짜"].max()
+        results["xgb_model"] = previous["xgb_model"]
+        results["xgb_forecast"] = total[
+            total["국적지역"].isin(XGB_COUNTRIES) & (period > last.year * 12 + last.month)
+        ]
+    return results
+
+
+def build_total(df, results):
+    """
+    df_total.csv 형식으로 결합
+    - XGB 국가: 실제 입국자수 + XGB 미래 예측
+    - 나머지 국가: Prophet 학습 구간 적합값 + 미래 예측
+    """
+    frames = []
+    for country in XGB_COUNTRIES:
+        actual = df.loc[df["국적지역"] == country, ["년", "월", "국적지역", "입국자수"]]
+        future = results["xgb_forecast"]
+        frames += [actual, future[future["국적지역"] == country]]
+    for country, forecast in sorted(results["prophet_forecasts"].items()):
+        if country not in XGB_COUNTRIES:
+            frames.append(forecast)
+    return pd.concat(frames, ignore_index=True)[["년", "월", "국적지역", "입국자수"]]
+
+
+def write_csv(df, path):
+    """임시 파일에 쓴 뒤 교체 (앱이 읽는 도중 반쯤 쓰인 파일을 보지 않도록)"""
+    tmp_path = path + ".tmp"
+    df.to_csv(tmp_path, index=False)
+    os.replace(tmp_path, path)
+
+
+def write_outputs(df_total, results, data_dir=DATA_DIR, model_dir=MODEL_DIR):
+    """예측 결과 CSV 와 모델 파일 저장"""
+    import joblib
+
+    write_csv(df_total, os.path.join(data_dir, "df_total.csv"))
+    # 국가별 Prophet 모델은 {국가: 모델} 딕셔너리로 저장
+    joblib.dump(results["prophet_models"], os.path.join(model_dir, "prophet_model.pkl"))
+    joblib.dump(results["xgb_model"], os.path.join(model_dir, "xgb_model.pkl"))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="국가별 입국자 수 예측 모델 학습")
+    parser.add_argument("--data", default=TRAIN_CSV, help="학습 데이터 CSV")
+    parser.add_argument("--periods", type=int, default=24, help="예측 개월 수")
+    parser.add_argument(
+        "--workers", type=int, default=None, help="프로세스 수 (기본: CPU 코어 수)"
+    )
+    parser.add_argument("--data-dir", default=DATA_DIR, help="예측 결과 CSV 저장 폴더")
+    parser.add_argument("--model-dir", default=MODEL_DIR, help="모델 파일 저장 폴더")
+    parser.add_argument(
+        "--full", action="store_true", help="지문 비교 없이 전체 국가 재학습"
+    )
+    # 이전 최적해 근처에서 멈추는 경우가 있어 결과가 전체 재학습과 달라질 수 있음 (기본 꺼짐)
+    parser.add_argument(
+        "--warm-start",
+        action="store_true",
+        help="재학습 국가의 Prophet 을 이전 모델 파라미터에서 시작",
+    )
+    args = parser.parse_args(argv)
+
+    df = load_training_data(args.data)
+
+    # ✅ 지문이 바뀐 국가만 재학습 (이전 결과가 없으면 전체)
+    settings = {"periods": args.periods, "prophet": PROPHET_PARAMS, "xgb": XGB_PARAMS}
+    fingerprints = fingerprint.compute(df, settings)
+    previous = None if args.full else load_previous(args.data_dir, args.model_dir)
+    manifest = fingerprint.load_manifest(args.model_dir) if previous else None
+    countries, refit_xgb = fingerprint.changed(fingerprints, manifest)
+
+    if not countries and not refit_xgb:
+        print("✅ 학습 데이터 변경 없음, 재학습 생략")
+        return 0
+
+    results = train_all(
+        df,
+        periods=args.periods,
+        workers=args.workers,
+        countries=countries,
+        warm_models=previous["prophet_models"] if previous and args.warm_start else None,
+        refit_xgb=refit_xgb,
+    )
+    if previous:
+        results = merge_previous(df, results, previous)
+    df_total = build_total(df, results)
+    write_outputs(df_total, results, args.data_dir, args.model_dir)
+    fingerprint.save_manifest(fingerprints, args.model_dir)
+
+    print(
+        f"✅ {len(countries)}/{df['국적지역'].nunique()}개국 재학습"
+        f"{' (XGB 포함)' if refit_xgb else ''}, {len(df_total)}행 저장"
+    )
+    print(results["evaluation"].to_string(index=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
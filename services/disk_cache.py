@@ -0,0 +1,199 @@
+"""
+SQLite 디스크 캐시 (외부 API 응답용)
+
+- 모든 Streamlit 워커 프로세스가 같은 파일(data/cache/api_cache.sqlite3)을 공유, 재시작/재배포 후에도 유지
+- 네임스페이스별 TTL, 최대 항목 수 초과 시 가장 오래 사용하지 않은 항목부터 삭제
+- TTL 이 지난 항목도 삭제 전까지는 peek() 으로 조회 가능 (갱신 실패 시 마지막 값 사용)
+- 네임스페이스별 hit / miss 카운터도 같은 파일에 기록 (프로세스 전체 합계)
+- 공유 파일의 쓰기 잠금을 줄이기 위해 조회 시각은 TOUCH_INTERVAL 마다만 갱신,
+  카운터는 메모리에 모아 COUNTER_FLUSH_INTERVAL 마다 기록, 삭제는 항목 수가 최대치를 넘을 때만
+  (항목 수는 프로세스별 추정치로 판단하고 EVICT_CHECK_EVERY 번 저장마다 또는 최대치를 넘을 것 같을 때만 COUNT)
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+
+CACHE_DIR = os.path.join("data", "cache")
+CACHE_PATH = os.path.join(CACHE_DIR, "api_cache.sqlite3")
+
+# 조회 시각(accessed_at) 갱신 간격 (초, LRU 순서는 이 정도 오차면 충분)
+TOUCH_INTERVAL = 300
+# hit / miss 카운터를 파일에 기록하는 간격 (초)
+COUNTER_FLUSH_INTERVAL = 30
+# 최대 항목 수를 넘으면 이 비율까지 줄임 (최대치 근처에서 매번 삭제하지 않도록)
+EVICT_TO = 0.9
+# 항목 수를 다시 세는 저장 횟수 간격 (다른 프로세스가 저장한 항목 반영)
+EVICT_CHECK_EVERY = 100
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+);
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (namespace, accessed_at);
+CREATE TABLE IF NOT EXISTS counters (
+    namespace TEXT PRIMARY KEY,
+    hits INTEGER NOT NULL DEFAULT 0,
+    misses INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+
+def normalize_key(query):
+    """검색어 정규화 (앞뒤/중복 공백 제거, 소문자)"""
+    return " ".join(str(query).split()).lower()
+
+
+class DiskCache:
+    """네임스페이스 하나의 키 → JSON 값 캐시"""
+
+    def __init__(self, namespace, ttl, max_entries=5000, path=CACHE_PATH):
+        self.namespace = namespace
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.path = path
+        self._local = threading.local()
+        self._pending = {"hits": 0, "misses": 0}
+        self._flushed_at = time.monotonic()
+        self._lock = threading.Lock()
+        # 마지막으로 센 항목 수 (모르면 None), 그 뒤 이 프로세스의 저장 수 (교체도 추가로 셈 → 상한 추정)
+        self._counted = None
+        self._inserted = 0
+
+    def _connect(self):
+        # sqlite3 연결은 스레드 간 공유하지 않으므로 스레드마다 하나씩
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._local.conn = conn
+        return conn
+
+    def _count(self, conn, column):
+        """hit / miss 를 메모리에 모으고 COUNTER_FLUSH_INTERVAL 이 지났으면 한 번에 기록"""
+        with self._lock:
+            self._pending[column] += 1
+            if time.monotonic() - self._flushed_at < COUNTER_FLUSH_INTERVAL:
+                return
+        self._flush(conn)
+
+    def _flush(self, conn):
+        with self._lock:
+            hits, misses = self._pending["hits"], self._pending["misses"]
+            self._pending = {"hits": 0, "misses": 0}
+            self._flushed_at = time.monotonic()
+        if hits or misses:
+            conn.execute(
+                "INSERT INTO counters (namespace, hits, misses) VALUES (?, ?, ?) "
+                "ON CONFLICT(namespace) DO UPDATE SET hits = hits + ?, misses = misses + ?",
+                (self.namespace, hits, misses, hits, misses),
+            )
+
+    def _evict(self, conn, inserted):
+        """
+        inserted 개 저장 후 호출, 항목 수가 최대치를 넘었을 때만 가장 오래 사용하지 않은 항목부터
+        EVICT_TO 비율까지 삭제 (추정치로 충분히 여유가 있으면 COUNT 도 하지 않음)
+        """
+        with self._lock:
+            self._inserted += inserted
+            if (
+                self._counted is not None
+                and self._counted + self._inserted <= self.max_entries
+                and self._inserted < EVICT_CHECK_EVERY
+            ):
+                return
+            self._inserted = 0
+        (entries,) = conn.execute(
+            "SELECT COUNT(*) FROM entries WHERE namespace = ?", (self.namespace,)
+        ).fetchone()
+        if entries > self.max_entries:
+            conn.execute(
+                "DELETE FROM entries WHERE namespace = ? AND key IN ("
+                "  SELECT key FROM entries WHERE namespace = ?"
+                "  ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.namespace, self.namespace, int(self.max_entries * EVICT_TO)),
+            )
+            entries = int(self.max_entries * EVICT_TO)
+        with self._lock:
+            self._counted = entries
+
+    def peek(self, key):
+        """(캐시된 값, TTL 이내 여부), 없으면 None (TTL 이 지난 값도 반환)"""
+        conn = self._connect()
+        key = normalize_key(key)
+        now = time.time()
+        row = conn.execute(
+            "SELECT value, created_at, accessed_at FROM entries WHERE namespace = ? AND key = ?",
+            (self.namespace, key),
+        ).fetchone()
+        fresh = row is not None and now - row[1] <= self.ttl
+        self._count(conn, "hits" if fresh else "misses")
+        if row is None:
+            return None
+        if now - row[2] > TOUCH_INTERVAL:
+            conn.execute(
+                "UPDATE entries SET accessed_at = ? WHERE namespace = ? AND key = ?",
+                (now, self.namespace, key),
+            )
+        return json.loads(row[0]), fresh
+
+    def get(self, key):
+        """캐시된 값, 없거나 TTL 이 지났으면 None"""
+        entry = self.peek(key)
+        if entry is None or not entry[1]:
+            return None
+        return entry[0]
+
+    def set(self, key, value):
+        """값 저장 (JSON 직렬화 가능한 값), 최대 항목 수를 넘으면 오래된 항목 삭제"""
+        conn = self._connect()
+        now = time.time()
+        conn.execute(
+            "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+            (self.namespace, normalize_key(key), json.dumps(value, ensure_ascii=False), now, now),
+        )
+        self._evict(conn, 1)
+
+    def set_many(self, items):
+        """여러 (키, 값) 을 한 트랜잭션으로 저장, 최대 항목 수를 넘으면 오래된 항목 삭제"""
+        conn = self._connect()
+        now = time.time()
+        rows = [
+            (self.namespace, normalize_key(key), json.dumps(value, ensure_ascii=False), now, now)
+            for key, value in items
+        ]
+        with conn:
+            conn.execute("BEGIN")
+            conn.executemany("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)", rows)
+            self._evict(conn, len(rows))
+
+    def values(self):
+        """TTL 이내의 모든 값 (저장 순서 무관)"""
+        conn = self._connect()
+        rows = conn.execute(
+            "SELECT value FROM entries WHERE namespace = ? AND created_at >= ?",
+            (self.namespace, time.time() - self.ttl),
+        ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def stats(self):
+        """{hits, misses, entries} (모든 프로세스 합계, 이 프로세스의 기록 전 카운터 포함)"""
+        conn = self._connect()
+        self._flush(conn)
+        hits, misses = conn.execute(
+            "SELECT hits, misses FROM counters WHERE namespace = ?", (self.namespace,)
+        ).fetchone() or (0, 0)
+        (entries,) = conn.execute(
+            "SELECT COUNT(*) FROM entries WHERE namespace = ?", (self.namespace,)
+        ).fetchone()
+        return {"hits": hits, "misses": misses, "entries": entries}
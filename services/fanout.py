@@ -0,0 +1,46 @@
+"""
+외부 API 조회 동시 실행 (스레드 풀, 동시 실행 수 제한, 입력 순서 유지)
+
+- fan_out: 모든 결과를 기다린 뒤 입력 순서대로 반환
+- fan_out_as_completed: 끝나는 대로 (입력 위치, 결과) 를 하나씩 반환 (먼저 화면을 그리고 나중에 채울 때)
+
+Streamlit 스크립트에서 호출하면 워커 스레드에 현재 세션의 ScriptRunContext 를 붙여
+st.cache_data 로 감싼 조회 함수도 스크립트 스레드와 같은 캐시를 사용한다.
+"""
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+# 한 번에 동시에 보내는 요청 수 (services.http 호스트별 풀 크기 이하)
+DEFAULT_MAX_WORKERS = 8
+
+
+def _executor(max_workers):
+    """현재 세션의 ScriptRunContext 를 워커 스레드에 붙이는 스레드 풀"""
+    ctx = get_script_run_ctx(suppress_warning=True)
+    return ThreadPoolExecutor(
+        max_workers=max_workers,
+        initializer=None if ctx is None else lambda: add_script_run_ctx(ctx=ctx),
+    )
+
+
+def fan_out(func, items, max_workers=DEFAULT_MAX_WORKERS):
+    """items 각각에 func 를 동시에 적용한 결과 리스트 (items 순서 유지)"""
+    items = list(items)
+    if len(items) <= 1:
+        return [func(item) for item in items]
+
+    with _executor(min(max_workers, len(items))) as executor:
+        return list(executor.map(func, items))
+
+
+def fan_out_as_completed(func, items, max_workers=DEFAULT_MAX_WORKERS):
+    """items 각각에 func 를 동시에 적용하고, 끝나는 순서대로 (입력 위치, 결과) 를 반환하는 제너레이터"""
+    items = list(items)
+    if not items:
+        return
+    with _executor(min(max_workers, len(items))) as executor:
+        futures = {executor.submit(func, item): i for i, item in enumerate(items)}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
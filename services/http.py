@@ -0,0 +1,190 @@
+"""
+외부 API 공용 HTTP 클라이언트 (네이버, 공공데이터포털, 카카오)
+
+- API 호스트마다 커넥션 풀을 가진 requests.Session 하나를 프로세스 전체가 공유 (keep-alive 재사용)
+- 모든 요청에 타임아웃 적용, 연결 오류/429/5xx 는 backoff 를 두고 제한된 횟수만 재시도
+- 같은 GET 요청이 동시에 여러 번 들어오면 한 번만 보내고 응답을 공유 (throttle.SingleFlight)
+- 호스트별 토큰 버킷으로 초당 요청 수 제한, 할당량 초과(429) 전에 앱에서 대기 (throttle.TokenBucket)
+- 호스트별 서킷 브레이커: 연속 실패/느린 응답이 쌓이면 잠시 요청하지 않고 바로 CircuitOpenError (health())
+- 호스트별 호출 수, 실패 수, 누적/최대 응답 시간, 대기열 깊이 기록 (stats())
+  About 페이지의 '외부 API 상태' 에서 서버 프로세스의 stats() / health() 를 확인
+"""
+
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from services.resilience import CircuitBreaker
+from services.throttle import SingleFlight, TokenBucket
+
+# (연결, 읽기) 타임아웃 초
+DEFAULT_TIMEOUT = (3.05, 10)
+
+# ✅ 호스트별 커넥션 풀 크기 (한 페이지에서 동시에 보내는 요청 수 기준)
+POOL_SIZES = {
+    "openapi.naver.com": 16,  # 축제/여행지/관광지 블로그 설명
+    "apis.data.go.kr": 8,  # 한국관광공사 축제/키워드 검색
+    "dapi.kakao.com": 8,  # 카카오 주소/키워드 검색
+}
+DEFAULT_POOL_SIZE = 4
+
+# ✅ 호스트별 (초당 요청 수, 최대 버스트) — 등록되지 않은 호스트는 제한 없음
+RATE_LIMITS = {
+    "openapi.naver.com": (10, 10),  # 검색 API 초당 호출 제한
+    "apis.data.go.kr": (20, 20),
+    "dapi.kakao.com": (20, 20),
+}
+
+# GET 요청 재시도 정책 (재시도 후에도 실패 응답이면 예외 대신 마지막 응답을 반환)
+RETRY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=("GET",),
+    raise_on_status=False,
+)
+
+
+class ApiError(Exception):
+    """외부 API 가 실패 응답(status_code != 200)을 돌려줌"""
+
+    def __init__(self, response):
+        super().__init__(f"{response.status_code}, {response.text}")
+        self.status_code = response.status_code
+        self.text = response.text
+
+
+_sessions = {}
+_buckets = {host: TokenBucket(rate, capacity) for host, (rate, capacity) in RATE_LIMITS.items()}
+_flights = {}
+_breakers = {}
+_stats = {}
+_lock = threading.Lock()
+
+
+def _new_session(host):
+    pool_size = POOL_SIZES.get(host, DEFAULT_POOL_SIZE)
+    adapter = HTTPAdapter(
+        pool_connections=1, pool_maxsize=pool_size, max_retries=RETRY, pool_block=True
+    )
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def session_for(url):
+    """URL 호스트 전용 Session (없으면 생성)"""
+    host = urlsplit(url).hostname
+    session = _sessions.get(host)
+    if session is None:
+        with _lock:
+            session = _sessions.get(host)
+            if session is None:
+                session = _sessions[host] = _new_session(host)
+    return session
+
+
+def _flight_for(host):
+    flight = _flights.get(host)
+    if flight is None:
+        with _lock:
+            flight = _flights.setdefault(host, SingleFlight())
+    return flight
+
+
+def _breaker_for(host):
+    breaker = _breakers.get(host)
+    if breaker is None:
+        with _lock:
+            breaker = _breakers.setdefault(host, CircuitBreaker(host))
+    return breaker
+
+
+def _record(host, seconds, failed):
+    with _lock:
+        entry = _stats.setdefault(
+            host, {"calls": 0, "failures": 0, "total_seconds": 0.0, "max_seconds": 0.0}
+        )
+        entry["calls"] += 1
+        entry["failures"] += int(failed)
+        entry["total_seconds"] += seconds
+        entry["max_seconds"] = max(entry["max_seconds"], seconds)
+
+
+def _key(url, params, headers):
+    """동일 요청 판별 키"""
+    return (
+        url,
+        tuple(sorted((params or {}).items())),
+        tuple(sorted((headers or {}).items())),
+    )
+
+
+def _send(host, url, params, headers, timeout):
+    breaker = _breaker_for(host)
+    token = breaker.before_call()
+    bucket = _buckets.get(host)
+    if bucket is not None:
+        bucket.acquire()
+    start = time.perf_counter()
+    failed = True
+    error = "연결 실패"
+    try:
+        response = session_for(url).get(url, params=params, headers=headers, timeout=timeout)
+        failed = response.status_code >= 400
+        # 429/5xx 만 장애로 봄 (400 대 요청 오류는 API 상태와 무관)
+        if response.status_code == 429 or response.status_code >= 500:
+            error = f"HTTP {response.status_code}"
+        else:
+            error = None
+        return response
+    finally:
+        seconds = time.perf_counter() - start
+        _record(host, seconds, failed)
+        breaker.record(token, seconds, error)
+
+
+def get(url, params=None, headers=None, timeout=DEFAULT_TIMEOUT):
+    """
+    GET 요청 (동일 요청 합치기, 호스트별 속도 제한, 풀 Session, 타임아웃, 재시도 적용)
+    재시도 후에도 연결이 안 되면 requests.RequestException 발생
+    (서킷이 열려 있으면 요청 없이 resilience.CircuitOpenError, requests.ConnectionError 의 하위 클래스)
+    """
+    host = urlsplit(url).hostname
+    return _flight_for(host).do(
+        _key(url, params, headers), lambda: _send(host, url, params, headers, timeout)
+    )
+
+
+def stats():
+    """
+    호스트별 {calls, failures, total_seconds, max_seconds, avg_seconds,
+    in_flight, coalesced, waiting, max_waiting, throttle: {...}, circuit: {...}} 스냅샷
+    (waiting: 진행 중인 같은 요청의 응답을 기다리는 호출 수, throttle.waiting: 토큰을 기다리는 호출 수)
+    """
+    with _lock:
+        result = {
+            host: dict(entry, avg_seconds=entry["total_seconds"] / entry["calls"])
+            for host, entry in _stats.items()
+        }
+        flights = dict(_flights)
+    for host, flight in flights.items():
+        result.setdefault(host, {}).update(flight.stats())
+    for host, bucket in _buckets.items():
+        if host in result:
+            result[host]["throttle"] = bucket.stats()
+    for host, circuit in health().items():
+        result.setdefault(host, {})["circuit"] = circuit
+    return result
+
+
+def health():
+    """호스트별 서킷 상태 {state, consecutive_failures, last_error, open_seconds, rejected, trips}"""
+    with _lock:
+        breakers = dict(_breakers)
+    return {host: breaker.health() for host, breaker in breakers.items()}
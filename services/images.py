@@ -0,0 +1,108 @@
+"""
+축제/여행지 대표 이미지 썸네일 캐시 (한국관광공사 firstimage URL)
+
+- 원본 이미지를 서버에서 한 번만 받아 표시 너비로 줄인 WebP 로 저장 (data/cache/thumbnails)
+- 파일 이름은 썸네일 내용 해시 (같은 이미지가 여러 URL 로 와도 한 파일), URL → 해시는 디스크 캐시
+- 페이지는 캐시된 썸네일 bytes 만 바로 사용, 아직 없으면 원본 URL 을 쓰고 백그라운드에서 생성
+- 받기 실패/이미지가 아닌 URL 은 잠시 기억하여 다시 실행할 때마다 같은 URL 을 요청하지 않음
+"""
+
+import hashlib
+import io
+import logging
+import os
+
+import requests
+from PIL import Image
+
+from services import http
+from services.disk_cache import CACHE_DIR, DiskCache
+from services.resilience import refresh_in_background
+
+logger = logging.getLogger(__name__)
+
+THUMBNAIL_DIR = os.path.join(CACHE_DIR, "thumbnails")
+
+# 페이지의 st.image(width=500) 표시 너비, WebP 품질
+DISPLAY_WIDTH = 500
+WEBP_QUALITY = 80
+
+# (URL, 너비) → 썸네일 해시 (30일, 원본 이미지는 거의 바뀌지 않음)
+THUMBNAIL_INDEX = DiskCache("thumbnail", ttl=30 * 24 * 3600, max_entries=20000)
+# 썸네일을 만들지 못한 원본 URL (1시간, 일시적인 장애일 수 있으므로 짧게)
+THUMBNAIL_MISS_CACHE = DiskCache("thumbnail_miss", ttl=3600, max_entries=20000)
+
+
+def _path(digest):
+    return os.path.join(THUMBNAIL_DIR, digest[:2], f"{digest}.webp")
+
+
+def make_thumbnail(content, width=DISPLAY_WIDTH):
+    """원본 이미지 bytes → 너비 width 이하로 줄인 WebP bytes"""
+    with Image.open(io.BytesIO(content)) as image:
+        image = image.convert("RGBA" if image.mode in ("RGBA", "LA", "P") else "RGB")
+        if image.width > width:
+            height = round(image.height * width / image.width)
+            image = image.resize((width, height), Image.LANCZOS)
+        output = io.BytesIO()
+        image.save(output, format="WEBP", quality=WEBP_QUALITY, method=4)
+    return output.getvalue()
+
+
+def store_thumbnail(data):
+    """썸네일 bytes 를 내용 해시 이름으로 저장 (이미 있으면 그대로), 해시 반환"""
+    digest = hashlib.sha256(data).hexdigest()
+    path = _path(digest)
+    if not os.path.exists(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path + ".tmp", "wb") as f:
+            f.write(data)
+        os.replace(path + ".tmp", path)
+    return digest
+
+
+def fetch_thumbnail(url, width=DISPLAY_WIDTH):
+    """원본을 받아 썸네일 생성 후 저장, 해시 반환 (요청 실패/이미지가 아니면 None)"""
+    response = http.get(url)
+    if response.status_code != 200:
+        return None
+    try:
+        data = make_thumbnail(response.content, width)
+    except (OSError, ValueError, Image.DecompressionBombError):  # 이미지가 아니거나 손상/초대형 파일
+        return None
+    return store_thumbnail(data)
+
+
+def _fetch_or_remember(url, width):
+    """fetch_thumbnail, 실패하면 URL 을 THUMBNAIL_MISS_CACHE 에 기록하고 None"""
+    try:
+        digest = fetch_thumbnail(url, width)
+    except requests.RequestException:  # 연결 실패, 서킷 열림
+        digest = None
+    except Exception:  # 그 밖의 디코딩 오류도 기록하여 같은 원본을 반복해서 받지 않음
+        logger.warning("썸네일 생성 실패: %s", url, exc_info=True)
+        digest = None
+    if digest is None:
+        THUMBNAIL_MISS_CACHE.set(url, True)
+    return digest
+
+
+def cached_thumbnail(url, width=DISPLAY_WIDTH):
+    """
+    캐시된 썸네일 WebP bytes, 아직 없으면 None 반환 후 백그라운드에서 생성 시작
+    (페이지 렌더링은 원본 이미지 다운로드를 기다리지 않음, 최근 실패한 URL 은 다시 요청하지 않음)
+    """
+    if not url:
+        return None
+    key = f"{width}:{url}"
+    digest = THUMBNAIL_INDEX.get(key)
+    if digest is not None:
+        try:
+            with open(_path(digest), "rb") as f:
+                return f.read()
+        except FileNotFoundError:  # 썸네일 폴더를 지운 경우 다시 생성
+            pass
+    if THUMBNAIL_MISS_CACHE.get(url) is not None:
+        return None
+    refresh_in_background(THUMBNAIL_INDEX, key, lambda: _fetch_or_remember(url, width))
+    return None
@@ -0,0 +1,143 @@
+"""
+카카오 로컬 API (주소 → 좌표 변환, 키워드 장소 검색)
+
+- 주소별 (위도, 경도) 는 SQLite 디스크 캐시에 저장 (프로세스/재시작 간 공유)
+- 검색 결과가 없는 주소도 따로 저장하여 같은 주소를 반복 요청하지 않음 (요청 실패는 저장하지 않음)
+- API 실패 응답(쿼터 초과, 인증 오류 등)은 '검색 결과 없음' 과 구분하여 http.ApiError
+- geocode_many: 캐시에 없는 주소만 동시에 요청
+- search_keyword: 한 페이지(최대 15개)보다 많이 필요하면 여러 페이지를 동시에 요청
+- search_category: 좌표 반경 내 카테고리(관광명소, 숙박 등) 장소를 가까운 순으로 (POI 저장소 수집용)
+"""
+
+import math
+
+import requests
+
+from services import http
+from services.disk_cache import DiskCache
+from services.fanout import fan_out
+
+ADDRESS_URL = "https://dapi.kakao.com/v2/local/search/address.json"
+KEYWORD_URL = "https://dapi.kakao.com/v2/local/search/keyword.json"
+CATEGORY_URL = "https://dapi.kakao.com/v2/local/search/category.json"
+
+# 키워드/카테고리 검색 한 페이지 최대 항목 수, 최대 페이지 수 (카카오 제한)
+KEYWORD_PAGE_SIZE = 15
+MAX_PAGES = 3
+# 카테고리 검색 최대 반경 (m)
+MAX_RADIUS_M = 20000
+
+# 주소 좌표 (30일), 검색 결과 없음 (1일, 주소 데이터가 보강될 수 있으므로 짧게)
+GEOCODE_CACHE = DiskCache("kakao_geocode", ttl=30 * 24 * 3600, max_entries=50000)
+GEOCODE_MISS_CACHE = DiskCache("kakao_geocode_miss", ttl=24 * 3600, max_entries=50000)
+
+
+def _cached(address):
+    """캐시 조회: 좌표, 검색 결과 없음이면 False, 캐시에 없으면 None"""
+    hit = GEOCODE_CACHE.get(address)
+    if hit is not None:
+        return hit["lat"], hit["lng"]
+    if GEOCODE_MISS_CACHE.get(address) is not None:
+        return False
+    return None
+
+
+def geocode_cached(address):
+    """캐시만 조회 (요청 없음): 좌표, 찾을 수 없는 주소면 False, 캐시에 없으면 None"""
+    if not address or not address.strip():
+        return False
+    return _cached(address)
+
+
+def _request(address, api_key):
+    """
+    카카오 주소 검색 1회: 좌표, 검색 결과 없음이면 False
+    API 가 실패 응답(쿼터 초과, 인증 오류 등)을 주면 http.ApiError
+    """
+    headers = {"Authorization": f"KakaoAK {api_key}"}
+    response = http.get(ADDRESS_URL, headers=headers, params={"query": address})
+    if response.status_code != 200:
+        raise http.ApiError(response)
+
+    documents = response.json()["documents"]
+    if not documents:
+        GEOCODE_MISS_CACHE.set(address, True)
+        return False
+    lat, lng = float(documents[0]["y"]), float(documents[0]["x"])  # 위도, 경도
+    GEOCODE_CACHE.set(address, {"lat": lat, "lng": lng})
+    return lat, lng
+
+
+def geocode(address, api_key):
+    """
+    주소의 (위도, 경도), 찾을 수 없으면 None
+    API 가 실패 응답을 주면 http.ApiError, 요청 실패는 requests.RequestException
+    """
+    if not address or not address.strip():
+        return None
+    result = _cached(address)
+    if result is None:
+        result = _request(address, api_key)
+    return result or None
+
+
+def geocode_many(addresses, api_key):
+    """
+    여러 주소를 한 번에 변환 (캐시에 없는 주소만 동시에 요청)
+    반환: {주소: (위도, 경도) 또는 None}, 요청이 실패한 주소도 None (나머지 주소는 계속 진행)
+    """
+    addresses = [a for a in dict.fromkeys(addresses) if a and a.strip()]
+    results = {address: _cached(address) for address in addresses}
+    missing = [address for address, result in results.items() if result is None]
+
+    def request(address):
+        try:
+            return _request(address, api_key)
+        except (http.ApiError, requests.RequestException):  # 회로 차단(CircuitOpenError) 포함
+            return None
+
+    for address, result in zip(missing, fan_out(request, missing)):
+        results[address] = result
+    return {address: result or None for address, result in results.items()}
+
+
+def _search_pages(url, params, api_key, size):
+    """검색 결과 최대 size 개 (필요한 페이지를 동시에 요청, 페이지 순서 유지, 장소 id 중복 제거)"""
+    headers = {"Authorization": f"KakaoAK {api_key}"}
+    page_size = min(size, KEYWORD_PAGE_SIZE)
+
+    def fetch(page):
+        response = http.get(url, headers=headers, params=dict(params, size=page_size, page=page))
+        if response.status_code != 200:
+            raise http.ApiError(response)
+        return response.json().get("documents", [])
+
+    n_pages = min(math.ceil(size / page_size), MAX_PAGES)
+    documents = {}
+    for page in fan_out(fetch, range(1, n_pages + 1)):
+        for document in page:
+            documents.setdefault(document["id"], document)
+    return list(documents.values())[:size]
+
+
+def search_keyword(query, api_key, size=KEYWORD_PAGE_SIZE):
+    """
+    키워드 장소 검색 결과 최대 size 개 (페이지 순서 유지, 장소 id 중복 제거)
+    API 가 실패 응답을 주면 http.ApiError
+    """
+    return _search_pages(KEYWORD_URL, {"query": query}, api_key, size)
+
+
+def search_category(code, lat, lng, radius_m, api_key, size=KEYWORD_PAGE_SIZE * MAX_PAGES):
+    """
+    (lat, lng) 반경 radius_m 이내 카테고리(AT4 관광명소, AD5 숙박 등) 장소, 가까운 순 최대 size 개
+    API 가 실패 응답을 주면 http.ApiError
+    """
+    params = {
+        "category_group_code": code,
+        "x": lng,
+        "y": lat,
+        "radius": min(int(radius_m), MAX_RADIUS_M),
+        "sort": "distance",
+    }
+    return _search_pages(CATEGORY_URL, params, api_key, size)
@@ -0,0 +1,245 @@
+"""
+한국관광공사 국문 관광정보 서비스 (공공데이터포털 KorService1)
+
+- searchFestival1 의 모든 페이지를 동시에 받아 축제 레코드 테이블로 변환
+- 응답은 JSON(_type=json) 으로 받고, XML 응답(오류 응답 포함)은 iterparse 로 한 번만 훑어 필드 추출
+  (두 형식 모두 요청한 필드만 가진 같은 모양의 레코드, 빈 값은 None)
+- 시작 월(yyyymm)별 축제 목록, 키워드 검색 결과는 디스크 캐시에 TTL 동안 저장 (페이지 렌더링은 로컬 조회)
+  TTL 이 지난 값은 바로 반환하고 백그라운드에서 갱신 (API 가 느리거나 장애여도 마지막 정상 응답 사용)
+- FestivalCatalog.active_in(yyyymm): 시작/종료 월 구간 인덱스로 해당 월에 진행 중인 축제 조회
+- pipeline.kto_sync 가 동기화한 로컬 사본(data/kto/*.json)이 있으면 API 대신 사용
+  (LOCAL_MAX_AGE 보다 오래됐거나 요청한 월이 사본의 시작일(since) 이전이면 API 사용)
+"""
+
+import io
+import json
+import math
+import os
+import time
+import xml.etree.ElementTree as ET
+
+import numpy as np
+
+from services import http
+from services.disk_cache import DiskCache
+from services.fanout import fan_out
+from services.resilience import cached_fetch
+
+BASE_URL = "http://apis.data.go.kr/B551011/KorService1"
+FESTIVAL_URL = f"{BASE_URL}/searchFestival1"
+KEYWORD_URL = f"{BASE_URL}/searchKeyword1"
+
+# 페이지당 항목 수 (한 번에 받을 수 있는 최대치에 가깝게)
+PAGE_SIZE = 100
+
+FESTIVAL_FIELDS = [
+    "contentid",
+    "title",
+    "addr1",
+    "eventstartdate",
+    "eventenddate",
+    "firstimage",
+    "modifiedtime",
+]
+KEYWORD_FIELDS = ["contentid", "title", "addr1", "firstimage", "modifiedtime"]
+
+# pipeline.kto_sync 로컬 사본 폴더 ({이름}.json, 예: festival.json, keyword_봄.json)
+LOCAL_DIR = os.path.join("data", "kto")
+# 로컬 사본을 사용할 최대 경과 시간 (2일, 하루 한 번 동기화가 한 번 빠져도 사용)
+LOCAL_MAX_AGE = 2 * 24 * 3600
+
+# 시작 월별 축제 목록, 키워드 검색 결과 캐시 (6시간)
+FESTIVAL_CACHE = DiskCache("kto_festival", ttl=6 * 3600, max_entries=120)
+KEYWORD_CACHE = DiskCache("kto_keyword", ttl=6 * 3600, max_entries=200)
+
+
+def common_params(service_key):
+    return {
+        "serviceKey": service_key,
+        "MobileOS": "ETC",
+        "MobileApp": "TravelApp",
+        "_type": "json",
+    }
+
+
+def _text(value):
+    """JSON 값을 XML 텍스트와 같은 형태로 (빈 값은 None, 나머지는 문자열)"""
+    if value is None or value == "":
+        return None
+    return str(value)
+
+
+# 정상 응답 코드 (그 외 resultCode 또는 cmmMsgHeader 오류 응답은 실패)
+SUCCESS_CODE = "0000"
+
+
+def parse_json(content, fields):
+    """JSON 응답 한 페이지의 (레코드 목록, 전체 항목 수), 오류 응답이면 None"""
+    response = json.loads(content).get("response", {})
+    if response.get("header", {}).get("resultCode") != SUCCESS_CODE:
+        return None
+    body = response.get("body", {})
+    items = body.get("items") or {}  # 결과가 없으면 빈 문자열
+    items = items.get("item", [])
+    if isinstance(items, dict):  # 항목이 하나면 리스트가 아닌 객체
+        items = [items]
+    records = [
+        {field: _text(item.get(field)) for field in fields} for item in items
+    ]
+    total = body.get("totalCount")
+    return records, int(total) if total not in (None, "") else len(records)
+
+
+def parse_xml(content, fields):
+    """
+    XML 응답 한 페이지의 (레코드 목록, 전체 항목 수), 트리를 만들지 않고 한 번에 훑음
+    오류 응답(OpenAPI_ServiceResponse/cmmMsgHeader, resultCode != 0000)이면 None
+    """
+    wanted = set(fields)
+    records = []
+    record = dict.fromkeys(fields)
+    total = None
+    result_code = None
+    for _, node in ET.iterparse(io.BytesIO(content)):
+        tag = node.tag
+        if tag in wanted:
+            record[tag] = node.text
+        elif tag == "item":
+            records.append(record)
+            record = dict.fromkeys(fields)
+            node.clear()
+        elif tag == "totalCount":
+            total = node.text
+        elif tag == "resultCode":
+            result_code = node.text
+        elif tag == "cmmMsgHeader":  # 인증키 오류 등 공공데이터포털 공통 오류
+            return None
+    if result_code != SUCCESS_CODE:
+        return None
+    return records, int(total) if total else len(records)
+
+
+def parse_page(content, fields):
+    """
+    응답 한 페이지의 (레코드 목록, 전체 항목 수), 오류 응답이면 None
+    _type=json 이어도 인증 오류 등은 XML 로 오므로 내용으로 형식 판단
+    """
+    if content.lstrip()[:1] == b"{":
+        return parse_json(content, fields)
+    return parse_xml(content, fields)
+
+
+def fetch_all_pages(url, params, fields, page_size=PAGE_SIZE):
+    """
+    첫 페이지로 전체 항목 수를 확인한 뒤 나머지 페이지를 동시에 요청하여 레코드 전체 반환
+    요청이 하나라도 실패하거나 오류 응답이면 None
+    """
+
+    def fetch(page_no):
+        response = http.get(url, params=dict(params, numOfRows=page_size, pageNo=page_no))
+        if response.status_code != 200:
+            return None
+        return parse_page(response.content, fields)
+
+    first = fetch(1)
+    if first is None:
+        return None
+    records, total = first
+    pages = fan_out(fetch, range(2, math.ceil(total / page_size) + 1))
+    if any(page is None for page in pages):
+        return None
+    for page_records, _ in pages:
+        records.extend(page_records)
+    return records
+
+
+def load_local(name, local_dir=LOCAL_DIR, start=None, max_age=LOCAL_MAX_AGE):
+    """
+    동기화된 로컬 사본의 레코드 목록 (contentid 순), 없으면 None
+    start(YYYYMMDD)가 사본의 시작일(since) 이전이거나 max_age 초보다 오래된 사본도 None (max_age=None 이면 검사 안 함)
+    """
+    path = os.path.join(local_dir, f"{name}.json")
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        store = json.load(f)
+    if start is not None and (store.get("since") is None or start < store["since"]):
+        return None
+    if max_age is not None:
+        synced_at = store.get("synced_at")
+        if not synced_at:
+            return None
+        if time.time() - time.mktime(time.strptime(synced_at, "%Y-%m-%d %H:%M:%S")) > max_age:
+            return None
+    items = store["items"]
+    return [items[key]["record"] for key in sorted(items)]
+
+
+def search_keyword(keyword, service_key, rows=10):
+    """
+    키워드 검색 결과 상위 rows 개 레코드
+    최근 로컬 사본이 있으면 제목순(API 기본 정렬)으로 바로 반환, 없으면 캐시 또는 API 첫 페이지 (실패 시 None)
+    """
+    records = load_local(f"keyword_{keyword}")
+    if records is not None:
+        return sorted(records, key=lambda r: r["title"] or "")[:rows]
+
+    params = dict(common_params(service_key), keyword=keyword, numOfRows=rows, pageNo=1)
+
+    def fetch():
+        response = http.get(KEYWORD_URL, params=params)
+        if response.status_code != 200:
+            return None
+        page = parse_page(response.content, KEYWORD_FIELDS)
+        return None if page is None else page[0]
+
+    return cached_fetch(KEYWORD_CACHE, f"{keyword}:{rows}", fetch)
+
+
+def fetch_festivals(yyyymm, service_key):
+    """
+    yyyymm 1일 기준 축제 전체 목록, 요청 실패이고 이전 목록도 없으면 None
+    로컬 사본(festival.json)이 최근이고 yyyymm 1일이 사본의 시작일 이후면 그대로 사용
+    (진행 중 여부는 FestivalCatalog 가 판단)
+    """
+    start = f"{yyyymm}01"
+    local = load_local("festival", start=start)
+    if local is not None:
+        return local
+
+    params = dict(common_params(service_key), eventStartDate=start)
+    return cached_fetch(
+        FESTIVAL_CACHE, yyyymm, lambda: fetch_all_pages(FESTIVAL_URL, params, FESTIVAL_FIELDS)
+    )
+
+
+def _month(date):
+    """'20250315' → 202503, 날짜 형식이 아니면 None"""
+    if date and len(date) >= 6 and date[:6].isdigit():
+        return int(date[:6])
+    return None
+
+
+class FestivalCatalog:
+    """축제 레코드 테이블 + (시작 월, 종료 월) 구간 인덱스"""
+
+    def __init__(self, records):
+        self.records = records
+        months = [(_month(r["eventstartdate"]), _month(r["eventenddate"])) for r in records]
+        # 날짜가 없는 축제는 어느 달에도 포함되지 않음
+        valid = [i for i, (start, end) in enumerate(months) if start and end]
+        starts = np.array([months[i][0] for i in valid], dtype=np.int64)
+        ends = np.array([months[i][1] for i in valid], dtype=np.int64)
+
+        # ✅ 시작 월 기준 정렬: 시작 월 <= M 인 후보는 앞쪽 구간 하나
+        order = np.argsort(starts, kind="stable")
+        self._rows = np.array(valid, dtype=np.int64)[order]
+        self._starts = starts[order]
+        self._ends = ends[order]
+
+    def active_in(self, yyyymm):
+        """yyyymm 에 진행 중인 축제 레코드 (API 응답 순서 유지)"""
+        month = int(yyyymm)
+        k = np.searchsorted(self._starts, month, side="right")
+        hits = self._rows[:k][self._ends[:k] >= month]
+        return [self.records[i] for i in np.sort(hits)]
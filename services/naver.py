@@ -0,0 +1,46 @@
+"""
+네이버 블로그 검색 API (축제, 여행지, 관광지 설명 공용)
+
+검색 결과(첫 번째 블로그의 설명, 링크)는 검색어 기준으로 SQLite 디스크 캐시에 저장하여
+워커 프로세스, 재시작, 여러 서버 간에 같은 검색어로 네이버 할당량을 다시 쓰지 않는다.
+TTL 이 지난 검색 결과는 바로 반환하고 백그라운드에서 갱신 (네이버가 느리거나 장애여도 기다리지 않음).
+"""
+
+from services import http
+from services.disk_cache import DiskCache
+from services.resilience import cached_fetch
+
+NAVER_SEARCH_API_URL = "https://openapi.naver.com/v1/search/blog.json"  # 블로그 검색 API 사용
+
+# 블로그 검색 결과 캐시 (하루, 최대 5,000개 검색어)
+BLOG_CACHE = DiskCache("naver_blog", ttl=24 * 3600, max_entries=5000)
+
+
+def search_blog(query, client_id, client_secret):
+    """
+    관련성 가장 높은 블로그 1개의 (설명 원문, 블로그 링크), 검색 결과가 없으면 (None, None)
+    API 요청 실패(서킷 열림 포함)이고 이전 검색 결과도 없으면 ConnectionError (실패 결과가 캐싱되지 않도록)
+    """
+    headers = {
+        "X-Naver-Client-Id": client_id,
+        "X-Naver-Client-Secret": client_secret,
+    }
+    params = {
+        "query": query,
+        "display": 1,  # 상위 1개의 결과만 가져오기
+        "sort": "sim",  # 관련성 높은 결과 우선
+    }
+
+    def fetch():
+        response = http.get(NAVER_SEARCH_API_URL, headers=headers, params=params)
+        if response.status_code != 200:
+            return None
+        items = response.json()["items"]
+        if not items:
+            return {"description": None, "link": None}
+        return {"description": items[0]["description"], "link": items[0]["link"]}
+
+    result = cached_fetch(BLOG_CACHE, query, fetch)
+    if result is None:
+        raise ConnectionError("네이버 블로그 검색 API 요청 실패")
+    return result["description"], result["link"]
@@ -0,0 +1,45 @@
+"""
+관광지/숙소 POI 저장소 (카카오 장소 검색 결과를 SQLite 디스크 캐시에 장소 id 기준으로 누적)
+
+- Tourist Spot 메뉴의 실시간 검색 결과와 pipeline.poi 의 카테고리 검색 결과가 함께 쌓임
+- core.poi.PoiIndex 로 만들어 테마 위치 반경 조회에 사용
+"""
+
+from services.disk_cache import DiskCache
+
+# 카카오 카테고리 그룹 코드
+ATTRACTION_CODES = ["AT4"]  # 관광명소
+LODGING_CODES = ["AD5"]  # 숙박
+
+# 화면/지도에서 쓰는 필드만 저장
+FIELDS = [
+    "id",
+    "place_name",
+    "category_group_code",
+    "category_group_name",
+    "road_address_name",
+    "address_name",
+    "phone",
+    "x",
+    "y",
+]
+
+# 장소 정보 (30일, 폐업/이전 반영을 위해 만료)
+POI_CACHE = DiskCache("poi", ttl=30 * 24 * 3600, max_entries=200000)
+
+
+def record_places(documents):
+    """카카오 장소 검색 document 목록 저장 (좌표 없는 장소 제외)"""
+    items = [
+        (document["id"], {field: document.get(field, "") for field in FIELDS})
+        for document in documents
+        if document.get("x") and document.get("y")
+    ]
+    if items:
+        POI_CACHE.set_many(items)
+    return len(items)
+
+
+def load_places():
+    """저장된 모든 장소 (만료 제외)"""
+    return POI_CACHE.values()
@@ -0,0 +1,179 @@
+"""
+외부 API 장애 대응 (서킷 브레이커, stale-while-revalidate)
+
+- CircuitBreaker: 연속 실패(오류 응답, 연결 실패, 지나치게 느린 응답)가 쌓이면 일정 시간 요청을 바로 거절
+  (열림 → 대기 시간이 지나면 시험 요청 1개만 허용 → 성공하면 닫힘, 열림/닫힘은 로그로 남김)
+- cached_fetch: 디스크 캐시 값이 TTL 이 지났어도 바로 반환하고 백그라운드에서 갱신
+  캐시에 없을 때만 API 응답을 기다림
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+# ✅ 서킷 브레이커 기본값
+FAILURE_THRESHOLD = 5  # 연속 실패 횟수
+RESET_SECONDS = 30  # 열린 뒤 시험 요청까지 대기 시간
+SLOW_CALL_SECONDS = 5.0  # 이보다 오래 걸린 응답은 실패로 셈
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+
+class CircuitOpenError(requests.ConnectionError):
+    """서킷이 열려 있어 요청을 보내지 않음 (기존 연결 오류 처리로 함께 처리됨)"""
+
+
+class CircuitBreaker:
+    """호스트 하나의 서킷 브레이커"""
+
+    def __init__(
+        self,
+        name,
+        failure_threshold=FAILURE_THRESHOLD,
+        reset_seconds=RESET_SECONDS,
+        slow_call_seconds=SLOW_CALL_SECONDS,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.slow_call_seconds = slow_call_seconds
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = None
+        self._trial_running = False
+        self._generation = 0  # 서킷이 열릴 때마다 증가 (열리기 전에 시작한 요청 구분)
+        self._last_error = None
+        self._rejected = 0
+        self._trips = 0
+
+    def before_call(self):
+        """
+        요청 허용 여부 확인, 거절하면 CircuitOpenError
+        반환: record 에 넘길 토큰 (요청 시작 시점의 세대, 시험 요청 여부)
+        """
+        with self._lock:
+            if self._state == CLOSED:
+                return self._generation, False
+            if (
+                self._state == OPEN
+                and time.monotonic() - self._opened_at >= self.reset_seconds
+            ):
+                self._state = HALF_OPEN
+            if self._state == HALF_OPEN and not self._trial_running:
+                self._trial_running = True
+                return self._generation, True
+            self._rejected += 1
+        raise CircuitOpenError(f"{self.name}: 서킷 열림 ({self._last_error})")
+
+    def _open(self):
+        if self._state != OPEN:
+            self._trips += 1
+            logger.warning("%s: 서킷 열림 (%s)", self.name, self._last_error)
+        self._state = OPEN
+        self._opened_at = time.monotonic()
+        self._generation += 1
+
+    def record(self, token, seconds, error=None):
+        """
+        요청 결과 기록 (error 가 없어도 느린 응답은 실패)
+        token: before_call 반환값, 시험 요청만 반열림 상태를 닫거나 다시 열 수 있고
+        서킷이 열리기 전에 시작한 요청의 결과는 무시
+        """
+        generation, trial = token
+        if error is None and seconds > self.slow_call_seconds:
+            error = f"느린 응답 {seconds:.1f}초"
+        with self._lock:
+            if trial:
+                self._trial_running = False
+                if error is None:
+                    self._state = CLOSED
+                    self._failures = 0
+                    logger.warning("%s: 시험 요청 성공, 서킷 닫힘", self.name)
+                else:
+                    self._failures += 1
+                    self._last_error = error
+                    self._open()
+                return
+            if generation != self._generation:
+                return
+            if error is None:
+                self._failures = 0
+                return
+            self._failures += 1
+            self._last_error = error
+            if self._failures >= self.failure_threshold:
+                self._open()
+
+    def health(self):
+        """{state, consecutive_failures, last_error, open_seconds, rejected, trips}"""
+        with self._lock:
+            return {
+                "state": self._state,
+                "consecutive_failures": self._failures,
+                "last_error": self._last_error,
+                "open_seconds": (
+                    time.monotonic() - self._opened_at if self._state != CLOSED else 0.0
+                ),
+                "rejected": self._rejected,
+                "trips": self._trips,
+            }
+
+
+# 백그라운드 갱신 (프로세스 전체 공유, 같은 캐시 키는 동시에 하나만)
+_refresh_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="revalidate")
+_refreshing = set()
+_refresh_lock = threading.Lock()
+
+
+def _fetch(fetch):
+    """fetch() 결과, 요청 실패(연결 오류, 서킷 열림 포함)면 None"""
+    try:
+        return fetch()
+    except requests.RequestException:
+        return None
+
+
+def _revalidate(cache, key, fetch):
+    try:
+        value = _fetch(fetch)
+        if value is not None:
+            cache.set(key, value)
+    finally:
+        with _refresh_lock:
+            _refreshing.discard((cache.namespace, key))
+
+
+def refresh_in_background(cache, key, fetch):
+    """캐시 키 하나를 백그라운드에서 갱신 (이미 갱신 중이면 무시)"""
+    with _refresh_lock:
+        if (cache.namespace, key) in _refreshing:
+            return
+        _refreshing.add((cache.namespace, key))
+    _refresh_executor.submit(_revalidate, cache, key, fetch)
+
+
+def cached_fetch(cache, key, fetch):
+    """
+    stale-while-revalidate 조회
+    - TTL 이내 캐시 값: 그대로 반환
+    - TTL 이 지난 캐시 값: 바로 반환하고 백그라운드에서 fetch 로 갱신
+    - 캐시에 없음: fetch 결과를 저장 후 반환
+    fetch 는 실패 시 None 반환 (또는 requests 예외), 이때 None 을 반환하고 저장하지 않음
+    """
+    entry = cache.peek(key)
+    if entry is not None:
+        value, fresh = entry
+        if not fresh:
+            refresh_in_background(cache, key, fetch)
+        return value
+
+    value = _fetch(fetch)
+    if value is not None:
+        cache.set(key, value)
+    return value
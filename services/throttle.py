@@ -0,0 +1,124 @@
+"""
+외부 API 호출 제어 (프로세스 전체 공유)
+
+- SingleFlight: 같은 키로 진행 중인 호출이 있으면 새로 호출하지 않고 그 결과를 함께 받음
+- TokenBucket: 초당 요청 수 제한 (토큰이 없으면 채워질 때까지 대기)
+- 둘 다 대기 중인 호출 수(큐 깊이)와 누적 지표를 stats() 로 제공
+"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """초당 rate 개씩 채워지고 최대 capacity 개까지 쌓이는 토큰 버킷"""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self._waiting = 0
+        self._max_waiting = 0
+        self._waited = 0  # 토큰을 기다린 호출 수
+        self._wait_seconds = 0.0
+
+    def _take(self):
+        """토큰 1개를 가져오면 0, 아니면 다음 토큰까지 남은 초"""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0
+        return (1 - self._tokens) / self.rate
+
+    def acquire(self):
+        """토큰 1개를 가져올 때까지 대기, 기다린 초 반환"""
+        with self._lock:
+            delay = self._take()
+            if delay == 0:
+                return 0.0
+            self._waiting += 1
+            self._max_waiting = max(self._max_waiting, self._waiting)
+
+        start = time.monotonic()
+        try:
+            while delay:
+                time.sleep(delay)
+                with self._lock:
+                    delay = self._take()
+        finally:
+            waited = time.monotonic() - start
+            with self._lock:
+                self._waiting -= 1
+                self._waited += 1
+                self._wait_seconds += waited
+        return waited
+
+    def stats(self):
+        with self._lock:
+            return {
+                "rate": self.rate,
+                "capacity": self.capacity,
+                "waiting": self._waiting,
+                "max_waiting": self._max_waiting,
+                "throttled": self._waited,
+                "throttle_seconds": self._wait_seconds,
+            }
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.followers = 0
+
+
+class SingleFlight:
+    """키별로 동시에 하나만 실행, 나머지 호출은 같은 결과(또는 예외)를 공유"""
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+        self._coalesced = 0
+        self._max_followers = 0
+
+    def do(self, key, func):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                call.followers += 1
+                self._coalesced += 1
+                self._max_followers = max(self._max_followers, call.followers)
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "in_flight": len(self._calls),
+                "waiting": sum(call.followers for call in self._calls.values()),
+                "max_waiting": self._max_followers,
+                "coalesced": self._coalesced,
+            }
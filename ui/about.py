@@ -1,6 +1,8 @@
 import pandas as pd
 import streamlit as st
 
+from services import http
+
 
 def run_about():
     st.title("👩🏻‍💻 개발 프로세스")
@@ -119,6 +121,9 @@ def run_about():
     col1, col2 = st.columns([1, 1])
     with col1:
         df = pd.read_csv("data/evaluation_df.csv")
+        if "모델" in df.columns:
+            # pipeline.backtest 결과: 국가 × 모델 MAPE 비교표
+            df = df.pivot(index="국적지역", columns="모델", values="MAPE(%)")
         st.dataframe(df, width=600)
     with col2:
         st.image("image/prophet.png", use_container_width=True)
@@ -236,3 +241,28 @@ def run_about():
     개발 과정에서 얻은 경험과 해결 방법들을 바탕으로 앞으로 더 발전된 기능을 추가할 수 있도록 노력하겠습니다.😄  
     """
     )
+    render_api_status()
+
+
+def render_api_status():
+    """외부 API 호스트별 서킷 상태, 호출 수, 응답 시간 (이 서버 프로세스 기준, 운영 모니터링용)"""
+    with st.expander("🩺 외부 API 상태"):
+        rows = [
+            {
+                "호스트": host,
+                "서킷": entry.get("circuit", {}).get("state", "closed"),
+                "연속 실패": entry.get("circuit", {}).get("consecutive_failures", 0),
+                "마지막 오류": entry.get("circuit", {}).get("last_error"),
+                "차단 횟수": entry.get("circuit", {}).get("trips", 0),
+                "거절된 요청": entry.get("circuit", {}).get("rejected", 0),
+                "호출": entry.get("calls", 0),
+                "실패": entry.get("failures", 0),
+                "평균 응답(초)": round(entry.get("avg_seconds", 0.0), 3),
+                "최대 응답(초)": round(entry.get("max_seconds", 0.0), 3),
+            }
+            for host, entry in sorted(http.stats().items())
+        ]
+        if not rows:
+            st.info("아직 외부 API 호출이 없습니다.")
+            return
+        st.dataframe(pd.DataFrame(rows), hide_index=True)
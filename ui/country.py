@@ -1,13 +1,58 @@
 import streamlit as st
+import numpy as np
 import pandas as pd
 import plotly.express as px
 
+from core import store
+from core.cube import ForecastCube
+from core.nationality import REGISTRY as nationalities
+from core.ranking import RankingEngine
+from core.serving import ModelServer
 from navigation import navigate_to
 
 
-def get_top_country(df, year, month):
+@st.cache_resource
+def load_table(name):
+    """컴파일된 컬럼 번들을 프로세스당 한 번만 메모리 매핑으로 로드 (세션 간 공유, 수정 금지)"""
+    return store.load_table(name)
+
+
+@st.cache_resource
+def load_model_server(countries):
+    """
+    학습된 모델을 프로세스당 한 번만 로드
+    (모델 파일/패키지가 없거나 countries 중 모델이 없는 국가가 있으면 None)
+    """
+    return ModelServer.load(countries=countries)
+
+
+@st.cache_resource
+def load_forecast_cube():
+    """df_total 예측 결과를 국가 × 월 조회 엔진으로 프로세스당 한 번만 생성 (모델이 있으면 예측 구간 연장)"""
+    cube = ForecastCube.from_store("df_total")
+    server = load_model_server(tuple(cube.countries))
+    if server is not None:
+        cube = server.extend_cube(cube, EXTENDED_FORECAST_END)
+    return cube
+
+
+@st.cache_resource
+def load_ranking_engine():
+    """월별 순위 엔진 (월 단위로 계산된 순위를 프로세스 내 모든 세션이 공유)"""
+    return RankingEngine(load_forecast_cube(), load_table("df_seasonal_growth"))
+
+
+# 방문자 수 기준 (표, 계절 Tip 대상 국가)
+HIGH_VISITOR_THRESHOLD = 30000
+
+# 예측 연도 선택지 (첫 예측 연도부터 전체 국가 예측이 있는 연도만 표시)
+FIRST_FORECAST_YEAR = 2025
+# 모델 서빙으로 연장할 마지막 예측 월 (df_total.csv 재생성 없이)
+EXTENDED_FORECAST_END = (2027, 12)
+
+
+def get_top_country(cube, year, month):
     """사용자가 선택한 연도와 월을 기준으로 입국자 수 증가량이 가장 큰 1개 국가를 반환하는 함수"""
-    df1 = pd.read_csv("data/df_total.csv")
     # 1월이면 작년 12월과 비교
     if month == 1:
         prev_year = year - 1
@@ -16,24 +61,16 @@ def get_top_country(df, year, month):
         prev_year = year
         prev_month = month - 1
 
-    # 현재 월과 이전 월 데이터 분리
-    df_latest = df1[(df1["년"] == year) & (df1["월"] == month)]
-    df_previous = df1[(df1["년"] == prev_year) & (df1["월"] == prev_month)]
-
-    if df_latest.empty or df_previous.empty:
+    # 현재 월 또는 이전 월 데이터가 통째로 없으면 비교 불가
+    if (
+        np.isnan(cube.month_values(year, month)).all()
+        or np.isnan(cube.month_values(prev_year, prev_month)).all()
+    ):
         st.warning("선택한 연도와 월에 대한 충분한 데이터가 없습니다.")
         return None
 
-    # 입국자 수 차이 계산
-    df_merge = df_latest.merge(
-        df_previous, on="국적지역", suffixes=("_latest", "_previous")
-    )
-    df_merge["입국자수_증가"] = (
-        df_merge["입국자수_latest"] - df_merge["입국자수_previous"]
-    )
-
-    # 증가량이 가장 큰 상위 3개 국가 선택
-    return df_merge.nlargest(1, "입국자수_증가")
+    # ✅ 사전 계산된 전월 대비 증가량에서 최댓값 국가 조회
+    return cube.top_mover(year, month)
 
 
 def run_country():
@@ -71,8 +108,9 @@ def run_country():
     )
 
     # 데이터 로드
-    df = pd.read_csv("data/df_total.csv")
-    seasonal_growth_df = pd.read_csv("data/df_seasonal_growth.csv")
+    cube = load_forecast_cube()
+    ranking_engine = load_ranking_engine()
+    forecast_years = [y for y in cube.complete_years() if y >= FIRST_FORECAST_YEAR]
 
     # 🍎 유저에게 예측희망 년, 월 입력
     st.subheader("예측 희망 년, 월을 입력하세요.🌍")
@@ -81,7 +119,7 @@ def run_country():
     # 한 줄에 연도 & 월 선택
     with col1:
         year = st.selectbox(
-            "연도", [2025, 2026], key="year", placeholder="연도를 선택하세요"
+            "연도", forecast_years, key="year", placeholder="연도를 선택하세요"
         )  # 연도 선택
     with col2:
         month = st.selectbox(
@@ -90,42 +128,12 @@ def run_country():
 
     ######
     # 🍎 지도로 해당 년월의 각국 예상 입국인원을 봅니다.
-    # 유저가 선택한 year, month에 해당하는 데이터 필터링
-    select_df = df[(df["년"] == year) & (df["월"] == month)]
-
-    # 국가명을 ISO 코드로 변환
-    country_to_iso = {
-        "중국": "CHN",
-        "일본": "JPN",
-        "미국": "USA",
-        "프랑스": "FRA",
-        "독일": "DEU",
-        "영국": "GBR",
-        "캐나다": "CAN",
-        "호주": "AUS",
-        "태국": "THA",
-        "베트남": "VNM",
-        "필리핀": "PHL",
-        "인도네시아": "IDN",
-        "말레이시아": "MYS",
-        "싱가포르": "SGP",
-        "러시아": "RUS",
-        "인도": "IND",
-        "브라질": "BRA",
-        "멕시코": "MEX",
-        "이탈리아": "ITA",
-        "스페인": "ESP",
-        "대만": "TWN",
-        "오스트레일리아": "AUS",
-        "홍콩": "HKG",
-    }
-    select_df = select_df.copy()
-    select_df["iso_alpha"] = select_df["국적지역"].map(country_to_iso)
-
-    # select_df 컬럼명 변경 국적지역 -> 국가, 입국자수 -> 예상 입국자수
-    select_df.rename(
-        columns={"국적지역": "국가", "입국자수": "예상 입국자수"}, inplace=True
-    )
+    # ✅ 유저가 선택한 year, month 의 순위 (월 단위 캐싱, 아래 표/티어/Tip 모두 이 순서 하나를 사용)
+    ranking = ranking_engine.month(year, month)
+    select_df = ranking.table()
+
+    # 국가명을 ISO 코드로 변환 (core.nationality 레지스트리)
+    select_df["iso_alpha"] = nationalities.iso3_series(select_df["국가"])
 
     # Choropleth 지도 생성
     # 년,월,국적지역,입국자수
@@ -159,32 +167,18 @@ def run_country():
         # 🍎 해당 년월의 각 국가별 예상 입국자 수를 표로 출력합니다
         st.write(f"📊 {year}년 {month}월 각 국가별 예상 입국자 수")
         st.dataframe(
-            select_df[["국가", "예상 입국자수"]]
-            .sort_values("예상 입국자수", ascending=False)
-            .reset_index(drop=True)  # 기존 인덱스 삭제
-            .rename_axis("순위")  # 인덱스 이름 설정
-            .reset_index()
-            .assign(순위=lambda df: df.index + 1),  # 순위 1부터 시작
+            select_df[["순위", "국가", "예상 입국자수"]],
             hide_index=True,  # Streamlit에서 인덱스 숨기기
             use_container_width=True,
         )
     with col2:
         st.write("방문자 수가 3k 이상 예상되는 국가")
         st.dataframe(
-            select_df[select_df["예상 입국자수"] >= 30000][["국가", "예상 입국자수"]]
-            .sort_values("예상 입국자수", ascending=False)
-            .reset_index(drop=True)  # 기존 인덱스 삭제
-            .rename_axis("순위")  # 인덱스 이름 설정
-            .reset_index()
-            .assign(순위=lambda df: df.index + 1),  # 순위 1부터 시작
+            ranking.table(min_value=HIGH_VISITOR_THRESHOLD),
             hide_index=True,  # Streamlit에서 인덱스 숨기기 (최신 버전)
             use_container_width=True,
         )
         # 계절 판별
-        high_visitor_countries = select_df[select_df["예상 입국자수"] >= 30000][
-            ["국가", "예상 입국자수"]
-        ]
-
         if month in [3, 4, 5]:
             season_col = "봄철 증가율"
             season_name = "봄"
@@ -198,96 +192,53 @@ def run_country():
             season_col = "겨울철 증가율"
             season_name = "겨울"
         # 방문자 30K 이상 국가 중 계절 증가율이 가장 높은 나라 찾기
-        if not high_visitor_countries.empty:
-            # 계절별 증가율 데이터를 합침
-            merged_df = high_visitor_countries.merge(
-                seasonal_growth_df, left_on="국가", right_on="국적지역", how="left"
+        season_leader = ranking.season_leader(
+            season_col, min_value=HIGH_VISITOR_THRESHOLD
+        )
+        if season_leader is not None:
+            country_name, growth_rate = season_leader
+
+            # ✅ 계절별 추천 안내 문구 추가
+            st.html(
+                f"""
+                    <div style="
+                        background-color: #d4edda; 
+                        padding: 15px; 
+                        border-radius: 10px; 
+                        border-left: 5px solid #155724;
+                        color: #155724;
+                        font-size: 16px;
+                        padding-bottom: 10px;">
+                        💡 <b>Tip:</b><br>
+
+                        <span style="display: block; border-top: 1px solid #28a745; margin: 10px 0;"></span>  <!-- 초록색 얇은 줄 -->
+
+                        <b>{country_name}</b> (사계절 대비 {season_name}철 입국 증가율 {growth_rate:.2f}%)은<br>
+                        한국 사계절 중 {season_name}을 사랑하는 나라예요! 🌸🌞🍂❄️
+                    </div>
+                """
             )
-
-            # 해당 계절 증가율이 가장 높은 나라 찾기
-            top_season_country = merged_df.nlargest(5, season_col)
-
-            if not top_season_country.empty:
-                country_name = top_season_country["국가"].values[0]
-                growth_rate = top_season_country[season_col].values[0]
-
-                # ✅ 계절별 추천 안내 문구 추가
-                st.html(
-                    f"""
-                        <div style="
-                            background-color: #d4edda; 
-                            padding: 15px; 
-                            border-radius: 10px; 
-                            border-left: 5px solid #155724;
-                            color: #155724;
-                            font-size: 16px;
-                            padding-bottom: 10px;">
-                            💡 <b>Tip:</b><br>
-
-                            <span style="display: block; border-top: 1px solid #28a745; margin: 10px 0;"></span>  <!-- 초록색 얇은 줄 -->
-
-                            <b>{country_name}</b> (사계절 대비 {season_name}철 입국 증가율 {growth_rate:.2f}%)은<br>
-                            한국 사계절 중 {season_name}을 사랑하는 나라예요! 🌸🌞🍂❄️
-                        </div>
-                    """
-                )
     ############################################################################################################
     # 🍎 ±3개월 입국자 수 추이
-    # 날짜 컬럼 생성
-    df["일"] = 1
-    df = df.rename(columns={"년": "year", "월": "month", "일": "day"})
-    df["ds"] = pd.to_datetime(df[["year", "month", "day"]])
-
     # 날짜 범위 설정
     selected_date = pd.to_datetime(f"{year}-{month}-01")
     start_date = selected_date - pd.DateOffset(months=3)
     end_date = selected_date + pd.DateOffset(months=3)
 
-    # ✅ 해당 기간 데이터 필터링
-    filtered_df = df[(df["ds"] >= start_date) & (df["ds"] <= end_date)]
-    filtered_df = filtered_df.rename(columns={"입국자수": "yhat"})
-
-    # ✅ 상위 5개국 선정 (선택한 연/월 기준)
-    top_countries = (
-        filtered_df[filtered_df["ds"] == selected_date]  # 선택한 연/월 기준 필터링
-        .groupby("국적지역")["yhat"]
-        .sum()  # 입국자 수 합산
-        .nlargest(5)  # 상위 5개국
-        .index.tolist()
-    )
-    # 다음 5개국 (6~10위) 가져오기
-    top_countries_next = (
-        filtered_df[filtered_df["ds"] == selected_date]
-        .groupby("국적지역")["yhat"]
-        .sum()
-        .nlargest(10)  # 상위 10개국 중에서
-        .index.tolist()[5:]  # 6~10위
+    # ✅ 해당 기간 데이터 조회 (국가 × 월 배열 구간 슬라이스)
+    filtered_df = cube.frame(
+        (start_date.year, start_date.month), (end_date.year, end_date.month)
     )
 
-    # 다음 5개국 (11~15위) 가져오기
-    bottom_countries = (
-        filtered_df[filtered_df["ds"] == selected_date]
-        .groupby("국적지역")["yhat"]
-        .sum()
-        .nsmallest(5)  # ✅ 가장 작은 값 5개 가져오기
-        .index.tolist()
-    )
+    # ✅ 선택한 연/월 순위에서 티어별 국가 조회
+    top_countries = ranking.tier(0, 5)  # 상위 5개국
+    top_countries_next = ranking.tier(5, 10)  # 6~10위
+    bottom_countries = ranking.bottom(5)  # 11~15위 (가장 작은 값 5개)
+    top_10_others = ranking.tier(5, 15)  # 그 외 국가 중 상위 10개국
 
     # ✅ 상위 5개국 데이터프레임 생성
     top_5_df = filtered_df[filtered_df["국적지역"].isin(top_countries)]
 
-    # ✅ 그 외 국가 중 입국자 수 상위 10개국 선정
-    other_countries_df = filtered_df[~filtered_df["국적지역"].isin(top_countries)]
-    top_10_others = (
-        other_countries_df[
-            other_countries_df["ds"] == selected_date
-        ]  # 선택한 연/월 기준 필터링
-        .groupby("국적지역")["yhat"]
-        .sum()  # 입국자 수 합산
-        .nlargest(10)  # 상위 10개국
-        .index.tolist()
-    )
-
     # ✅ 그 외 국가 10개국 데이터프레임 생성
     top_10_others_df = filtered_df[filtered_df["국적지역"].isin(top_10_others)]
 
@@ -313,16 +264,10 @@ def run_country():
     st.plotly_chart(fig2)  # ✅ 두 번째 차트 출력
 
     # 분석 실행
-    top_country = get_top_country(df, year, month)
-
-    if top_country is not None and not top_country.empty:
-        row = top_country.iloc[0]
-        country_name = row["국적지역"]
-        growth_rate = (
-            (row["입국자수_증가"] / row["입국자수_previous"]) * 100
-            if row["입국자수_previous"] > 0
-            else 0
-        )
+    top_country = get_top_country(cube, year, month)
+
+    if top_country is not None:
+        country_name, _, growth_rate = top_country
 
         st.html(
             f"""
@@ -347,9 +292,7 @@ def run_country():
     #####################################################
 
     # 여행성향 예시파일 로드
-    country_info_df = pd.read_csv(
-        "data/example_travel_preference.csv", index_col="국가"
-    )
+    country_info_df = load_table("example_travel_preference")
     # 🍎  상위 5개국, 레드오션 추천
 
     col1, col2, col3 = st.columns(3)
@@ -416,8 +359,10 @@ def run_country():
 
     # ✅ 선택한 국가의 정보 출력
     st.subheader(f"🔎 {selected_country if selected_country else ''} 여행 정보")
-    if selected_country and selected_country in country_info_df.index:
-        info = country_info_df.loc[selected_country]
+    # 별칭으로 저장된 국가명도 여행 성향 표의 표준 국적명으로 조회
+    info_key = nationalities.canonical(selected_country) if selected_country else None
+    if info_key in country_info_df.index:
+        info = country_info_df.loc[info_key]
         st.write(f"**🗣️ 사용 언어:** {info['언어']}")
         st.write(
             f"""**🎒 여행 성향:** {info['여행 성향']}  
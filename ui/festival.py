@@ -1,60 +1,43 @@
 
-import re
-from bs4 import BeautifulSoup
 import requests
-import xml.etree.ElementTree as ET
 import streamlit as st
 
+from core.text import clean_html
 from navigation import navigate_to
+from services import images, kto, naver
+from services.fanout import fan_out
 
 # ✅ 네이버 API 키 설정 (네이버 개발자 센터에서 발급)
 NAVER_CLIENT_ID = st.secrets["NAVER_CLIENT_ID"]
 NAVER_CLIENT_SECRET = st.secrets["NAVER_CLIENT_SECRET"]
-NAVER_SEARCH_API_URL = "https://openapi.naver.com/v1/search/blog.json"  # 블로그 검색 API 사용
 #data_go_API_KEY 설정
 data_go_API_KEY = st.secrets["data_go_API_KEY"]
-BASE_URL = "http://apis.data.go.kr/B551011/KorService1/searchFestival1"
-
-def clean_html_with_bs(text):
-    """HTML 태그 및 마크다운 기호 제거"""
-    # 1️⃣ HTML 태그 제거
-    cleaned_text = BeautifulSoup(text, "html.parser").get_text()
-
-    # 2️⃣ 마크다운 기호 제거 (취소선, 볼드, 이탤릭 등)
-    markdown_patterns = [
-        r"\*\*(.*?)\*\*",  # **볼드체**
-        r"__(.*?)__",      # __이탤릭체__
-        r"~~(.*?)~~",      # ~~취소선~~
-        r"`(.*?)`",        # `코드 블록`
-        r"\[(.*?)\]\(.*?\)" # [링크 텍스트](URL)
-    ]
-    for pattern in markdown_patterns:
-        cleaned_text = re.sub(pattern, r"\1", cleaned_text)  # 태그 내용만 남기고 마크다운 기호 삭제
-
-    return cleaned_text
-
 
 @st.cache_data(ttl=3600)
 def get_festival_description(festival_name):
-    """네이버 검색 API - 축제 설명, 블로그주소 가져오기"""
-    headers = {
-        "X-Naver-Client-Id": NAVER_CLIENT_ID,
-        "X-Naver-Client-Secret": NAVER_CLIENT_SECRET
-    }
-    params = {
-        "query": festival_name,  # 검색할 축제명
-        "display": 1,  # 상위 1개의 결과만 가져오기
-        "sort": "sim"  # 관련성 높은 결과 우선
-    }
-    response = requests.get(NAVER_SEARCH_API_URL, headers=headers, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if data["items"]:
-            raw_text = data["items"][0]["description"]  # 첫 번째 검색 결과의 설명 반환
-            clean_text=clean_html_with_bs(raw_text) # HTML 태그 제거 후 반환
-            blog_link = data["items"][0]["link"]  # 블로그 링크
-            return clean_text, blog_link 
-    return "설명 없음",None
+    """네이버 검색 API - 축제 설명, 블로그주소 가져오기 (디스크 캐시 공유)"""
+    raw_text, blog_link = naver.search_blog(festival_name, NAVER_CLIENT_ID, NAVER_CLIENT_SECRET)
+    if raw_text is None:
+        return "설명 없음", None
+    clean_text = clean_html(raw_text)  # HTML 태그 제거 후 반환
+    return clean_text, blog_link
+
+
+def festival_description_or_default(festival_name):
+    """축제 설명, 네이버 API 장애 시 기본값 (실패는 캐싱하지 않음)"""
+    try:
+        return get_festival_description(festival_name)
+    except ConnectionError:
+        return "설명 없음", None
+
+@st.cache_resource(ttl=3600)
+def load_festival_catalog(yyyymm):
+    """yyyymm 시작 축제 전체 목록 (한국관광공사 모든 페이지, 디스크 캐시)"""
+    records = kto.fetch_festivals(yyyymm, data_go_API_KEY)
+    if records is None:
+        # 실패 결과가 캐싱되지 않도록 예외로 알림
+        raise ConnectionError("한국관광공사 축제 API 요청 실패")
+    return kto.FestivalCatalog(records)
 
 ######################################3
 
@@ -106,48 +89,40 @@ def run_festival():
         
 
 
-    # ✅ API 요청 파라미터 설정
-
-    params = {
-        "serviceKey": data_go_API_KEY,
-        "numOfRows": 50,
-        "pageNo": 1,
-        "MobileOS": "ETC",
-        "MobileApp": "TravelApp",
-        "_type": "xml",
-        "eventStartDate": f"{year}{month:02d}01",
-    }
-
-    # ✅ API 요청 및 응답 처리
-    response = requests.get(BASE_URL, params=params)
-    if response.status_code != 200:
+    # ✅ 해당 월 축제 전체 목록 (모든 페이지, 캐시) 에서 진행 중인 축제 조회
+    selected_month_str = f"{year}{month:02d}"
+    try:
+        catalog = load_festival_catalog(selected_month_str)
+    except (ConnectionError, requests.RequestException):
         st.error("❌ API 요청 실패! 다시 시도해 주세요.")
         return
 
-    root = ET.fromstring(response.content)
-    items = root.findall(".//item")
-
     festival_list = []
-    selected_month_str = f"{year}{month:02d}"
+    active_festivals = [
+        (
+            item["title"] or "정보 없음",
+            item["addr1"] or "정보 없음",
+            item["eventstartdate"],
+            item["eventenddate"],
+            item["firstimage"],
+        )
+        for item in catalog.active_in(selected_month_str)
+    ]
 
-    # ✅ 축제 데이터 파싱
-    for item in items:
-        title = item.find("title").text if item.find("title") is not None else "정보 없음"
-        addr = item.find("addr1").text if item.find("addr1") is not None else "정보 없음"
-        start_date = item.find("eventstartdate").text if item.find("eventstartdate") is not None else "정보 없음"
-        end_date = item.find("eventenddate").text if item.find("eventenddate") is not None else "정보 없음"
-        image_url = item.find("firstimage").text if item.find("firstimage") is not None else None
+    # ✅ 설명 & 블로그 링크를 동시에 조회 (축제 순서 유지, 캐시된 축제는 요청 없음)
+    descriptions = fan_out(festival_description_or_default, [f[0] for f in active_festivals])
 
-        if start_date[:6] <= selected_month_str <= end_date[:6]:
-            description, blog_link = get_festival_description(title)  # ✅ 설명 & 블로그 링크 가져오기
-            festival_list.append({
-                "축제명": title,
-                "위치": addr,
-                "일정": f"{start_date} ~ {end_date}",
-                "설명": description,
-                "블로그 링크": blog_link,
-                "이미지": image_url
-            })
+    for (title, addr, start_date, end_date, image_url), (description, blog_link) in zip(
+        active_festivals, descriptions
+    ):
+        festival_list.append({
+            "축제명": title,
+            "위치": addr,
+            "일정": f"{start_date} ~ {end_date}",
+            "설명": description,
+            "블로그 링크": blog_link,
+            "이미지": image_url
+        })
 
 
 
@@ -162,7 +137,9 @@ def run_festival():
             if festival["블로그 링크"]:
                 st.markdown(f"[🔗 관련 블로그 보기]({festival['블로그 링크']})", unsafe_allow_html=True)  # ✅ 블로그 링크 추가
             if festival["이미지"]:
-                st.image(festival["이미지"], caption=festival["축제명"], width=500)
+                # ✅ 줄인 썸네일이 캐시에 있으면 사용, 없으면 원본 (썸네일은 백그라운드에서 생성)
+                image = images.cached_thumbnail(festival["이미지"]) or festival["이미지"]
+                st.image(image, caption=festival["축제명"], width=images.DISPLAY_WIDTH)
             
             if selected_country is None:
              st.warning("❌ 대상 국가를 선택하지 않았습니다. **Country** 메뉴에서 먼저 대상 국가를 선택해주세요.")
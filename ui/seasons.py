@@ -1,38 +1,16 @@
-import re
-from bs4 import BeautifulSoup
-import requests
-import xml.etree.ElementTree as ET
 import streamlit as st
 
+from core.text import clean_html
 from navigation import navigate_to
+from services import images, kto, naver
+from services.fanout import fan_out
 
 # ✅ 네이버 API 키 설정 (네이버 개발자 센터에서 발급)
 NAVER_CLIENT_ID = st.secrets["NAVER_CLIENT_ID"]
 NAVER_CLIENT_SECRET = st.secrets["NAVER_CLIENT_SECRET"]
-NAVER_SEARCH_API_URL = "https://openapi.naver.com/v1/search/blog.json"  # 블로그 검색 API 사용
 
 # ✅ 공공데이터 API 키 설정
 data_go_API_KEY = st.secrets["data_go_API_KEY"]
-KEYWORD_BASE_URL = "http://apis.data.go.kr/B551011/KorService1/searchKeyword1"
-
-def clean_html_with_bs(text):
-    """HTML 태그 및 마크다운 기호 제거"""
-    # 1️⃣ HTML 태그 제거
-    cleaned_text = BeautifulSoup(text, "html.parser").get_text()
-
-    # 2️⃣ 마크다운 기호 제거 (취소선, 볼드, 이탤릭 등)
-    markdown_patterns = [
-        r"\*\*(.*?)\*\*",  # **볼드체**
-        r"__(.*?)__",      # __이탤릭체__
-        r"~~(.*?)~~",      # ~~취소선~~
-        r"`(.*?)`",        # `코드 블록`
-        r"\[(.*?)\]\(.*?\)" # [링크 텍스트](URL)
-    ]
-    for pattern in markdown_patterns:
-        cleaned_text = re.sub(pattern, r"\1", cleaned_text)  # 태그 내용만 남기고 마크다운 기호 삭제
-
-    return cleaned_text
-
 
 def get_season(month):
     """입력된 월(month)에 따라 계절을 반환"""
@@ -46,26 +24,21 @@ def get_season(month):
         return "가을"
     return ""
 
+@st.cache_data(ttl=3600)
 def get_travel_description(travel_name):
-    """네이버 검색 API - 여행지 설명, 블로그 주소 가져오기"""
-    headers = {
-        "X-Naver-Client-Id": NAVER_CLIENT_ID,
-        "X-Naver-Client-Secret": NAVER_CLIENT_SECRET
-    }
-    params = {
-        "query": travel_name,
-        "display": 1,
-        "sort": "sim"
-    }
-    response = requests.get(NAVER_SEARCH_API_URL, headers=headers, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if data["items"]:
-            raw_text = data["items"][0]["description"]
-            clean_text = clean_html_with_bs(raw_text)
-            blog_link = data["items"][0]["link"]
-            return clean_text, blog_link 
-    return "설명 없음", None
+    """네이버 검색 API - 여행지 설명, 블로그 주소 가져오기 (디스크 캐시 공유)"""
+    raw_text, blog_link = naver.search_blog(travel_name, NAVER_CLIENT_ID, NAVER_CLIENT_SECRET)
+    if raw_text is None:
+        return "설명 없음", None
+    clean_text = clean_html(raw_text)
+    return clean_text, blog_link
+
+def travel_description_or_default(travel_name):
+    """여행지 설명, 네이버 API 장애 시 기본값 (실패는 캐싱하지 않음)"""
+    try:
+        return get_travel_description(travel_name)
+    except ConnectionError:
+        return "설명 없음", None
 
 def run_seasons():
     """키워드 검색을 통한 여행 정보 조회"""
@@ -135,31 +108,22 @@ def run_seasons():
     st.write(f"""📅 선택한 날짜: {year}년 {month}월 (계절: {season})  
              정보는 **정확한 날짜를 한번 더 확인**하세요.""")
 
-    params = {
-        "serviceKey": data_go_API_KEY,
-        "numOfRows": 10,
-        "pageNo": 1,
-        "MobileOS": "ETC",
-        "MobileApp": "TravelApp",
-        "_type": "xml",
-        "keyword": season
-    }
-    response = requests.get(KEYWORD_BASE_URL, params=params)
-    
-    if response.status_code == 200:
-        root = ET.fromstring(response.content)
-        items = root.findall(".//item")
-        
+    # ✅ 계절 키워드 검색 상위 10개 (동기화된 로컬 사본이 있으면 API 요청 없음)
+    items = kto.search_keyword(season, data_go_API_KEY, rows=10)
+
+    if items is not None:
         if not items:
             st.warning("❌ 검색 결과가 없습니다.")
             return
         
+        # ✅ 설명 & 블로그 링크를 동시에 조회 (여행지 순서 유지)
+        titles = [item["title"] or "정보 없음" for item in items]
+        descriptions = fan_out(travel_description_or_default, titles)
+
         travel_list = []
-        for item in items:
-            title = item.find("title").text if item.find("title") is not None else "정보 없음"
-            addr = item.find("addr1").text if item.find("addr1") is not None else "정보 없음"
-            image_url = item.find("firstimage").text if item.find("firstimage") is not None else None
-            description, blog_link = get_travel_description(title)
+        for item, title, (description, blog_link) in zip(items, titles, descriptions):
+            addr = item["addr1"] or "정보 없음"
+            image_url = item["firstimage"]
             travel_list.append({
                 "여행지명": title,
                 "위치": addr,
@@ -177,7 +141,9 @@ def run_seasons():
                 if travel["블로그 링크"]:
                     st.markdown(f"[🔗 관련 블로그 보기]({travel['블로그 링크']})", unsafe_allow_html=True)
                 if travel["이미지"]:
-                    st.image(travel["이미지"], caption=travel["여행지명"], width=500)
+                    # ✅ 줄인 썸네일이 캐시에 있으면 사용, 없으면 원본 (썸네일은 백그라운드에서 생성)
+                    image = images.cached_thumbnail(travel["이미지"]) or travel["이미지"]
+                    st.image(image, caption=travel["여행지명"], width=images.DISPLAY_WIDTH)
                 # ✅ 주소가 없을 경우만 입력창 표시
                     if not travel["위치"] or travel["위치"].strip() in ["정보 없음", ""]:  
                         user_input_address = st.text_input(
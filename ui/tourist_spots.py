@@ -1,10 +1,16 @@
+import json
 import re
-from bs4 import BeautifulSoup
+from collections import namedtuple
+
 import requests
 import streamlit as st
 import streamlit.components.v1 as components
 
+from core.poi import PoiIndex
+from core.text import clean_html
 from navigation import navigate_to
+from services import http, kakao, naver, poi_store
+from services.fanout import fan_out, fan_out_as_completed
 
 # ✅ API 키 설정
 KAKAO_API_KEY = st.secrets["KAKAO_API_KEY"]
@@ -55,108 +61,156 @@ def extract_region(address):
     return None, None
 
 
-def clean_html_with_bs(text):
-    """HTML 태그 및 마크다운 기호 제거"""
-    # 1️⃣ HTML 태그 제거
-    cleaned_text = BeautifulSoup(text, "html.parser").get_text()
-
-    # 2️⃣ 마크다운 기호 제거 (취소선, 볼드, 이탤릭 등)
-    markdown_patterns = [
-        r"\*\*(.*?)\*\*",  # **볼드체**
-        r"__(.*?)__",  # __이탤릭체__
-        r"~~(.*?)~~",  # ~~취소선~~
-        r"`(.*?)`",  # `코드 블록`
-        r"\[(.*?)\]\(.*?\)",  # [링크 텍스트](URL)
-    ]
-    for pattern in markdown_patterns:
-        cleaned_text = re.sub(
-            pattern, r"\1", cleaned_text
-        )  # 태그 내용만 남기고 마크다운 기호 삭제
-
-    return cleaned_text
-
-
 @st.cache_data(ttl=3600)  # 1시간 동안 캐싱
 def get_tourist_description(place_name):
     """
-    네이버 블로그 검색 API를 사용하여 관광지 설명과 블로그 링크 가져오기
+    네이버 블로그 검색 API를 사용하여 관광지 설명과 블로그 링크 가져오기 (디스크 캐시 공유)
     """
-    url = "https://openapi.naver.com/v1/search/blog.json"
-    headers = {
-        "X-Naver-Client-Id": NAVER_CLIENT_ID,
-        "X-Naver-Client-Secret": NAVER_CLIENT_SECRET,
-    }
-    params = {
-        "query": place_name,
-        "display": 1,
-        "sort": "sim",
-    }  # 관련성 높은 블로그 1개 검색
-
-    response = requests.get(url, headers=headers, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if data["items"]:
-            raw_text = data["items"][0]["description"]
-            clean_text = clean_html_with_bs(raw_text)  # ✅ HTML 태그 제거
-            blog_link = data["items"][0]["link"]  # ✅ 블로그 링크
-            return clean_text, blog_link
-    return "❌ 관련 블로그 설명을 찾을 수 없습니다.", None
+    raw_text, blog_link = naver.search_blog(place_name, NAVER_CLIENT_ID, NAVER_CLIENT_SECRET)
+    if raw_text is None:
+        return "❌ 관련 블로그 설명을 찾을 수 없습니다.", None
+    clean_text = clean_html(raw_text)  # ✅ HTML 태그 제거
+    return clean_text, blog_link
+
+
+def tourist_description_or_default(place_name):
+    """관광지 설명, 네이버 API 장애 시 기본값 (실패는 캐싱하지 않음)"""
+    try:
+        return get_tourist_description(place_name)
+    except ConnectionError:
+        return "❌ 관련 블로그 설명을 찾을 수 없습니다.", None
 
 
-@st.cache_data(ttl=3600)  # 1시간 동안 캐싱
 def get_coordinates_from_address(address):
     """
     카카오 주소 검색 API를 사용하여 주소를 위도, 경도로 변환하는 함수
+    (좌표/검색 결과 없음은 디스크 캐시에 저장, 찾지 못하면 (None, None), API 실패 응답은 http.ApiError)
     """
-    url = "https://dapi.kakao.com/v2/local/search/address.json"
-    headers = {"Authorization": f"KakaoAK {KAKAO_API_KEY}"}
-    params = {"query": address}
-
-    response = requests.get(url, headers=headers, params=params)
-
-    if response.status_code == 200:
-        data = response.json()
-
-        if data["documents"]:
-            x = data["documents"][0]["x"]  # 경도 (longitude)
-            y = data["documents"][0]["y"]  # 위도 (latitude)
-            return float(y), float(x)  # 위도, 경도 반환
+    coordinates = kakao.geocode(address, KAKAO_API_KEY)
+    return coordinates if coordinates else (None, None)
 
 
 ################################################
 @st.cache_data(ttl=3600)  # 1시간 동안 캐싱
 def search_tourist_spots(query, region, display=10):
     """
-    카카오 키워드 검색 API를 사용하여 지역 내 관광지를 검색
+    카카오 키워드 검색 API를 사용하여 지역 내 관광지를 검색 (15개 초과 시 여러 페이지 동시 요청)
+    검색 결과는 POI 저장소에도 누적
     """
-    url = "https://dapi.kakao.com/v2/local/search/keyword.json"
-    headers = {"Authorization": f"KakaoAK {KAKAO_API_KEY}"}
-    params = {"query": f"{region} {query}", "size": min(display, 15)}
-
-    response = requests.get(url, headers=headers, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        return data.get("documents", [])
-    else:
-        st.error(f"❌ API 요청 실패: {response.status_code}, {response.text}")
-        return []
+    places = kakao.search_keyword(f"{region} {query}", KAKAO_API_KEY, size=display)
+    poi_store.record_places(places)
+    return places
 
 
+@st.cache_data(ttl=3600)  # 1시간 동안 캐싱
 def search_hotels(region, display=10):
     """
-    카카오 키워드 검색 API를 사용하여 지역 내 호텔을 검색
+    카카오 키워드 검색 API를 사용하여 지역 내 호텔을 검색 (15개 초과 시 여러 페이지 동시 요청)
+    검색 결과는 POI 저장소에도 누적
     """
-    url = "https://dapi.kakao.com/v2/local/search/keyword.json"
-    headers = {"Authorization": f"KakaoAK {KAKAO_API_KEY}"}
-    params = {"query": f"{region} 호텔", "size": min(display, 15)}
-
-    response = requests.get(url, headers=headers, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        return data.get("documents", [])
-    else:
-        st.error(f"❌ 호텔 정보 API 요청 실패: {response.status_code}, {response.text}")
+    hotels = kakao.search_keyword(f"{region} 호텔", KAKAO_API_KEY, size=display)
+    poi_store.record_places(hotels)
+    return hotels
+
+
+@st.cache_resource(ttl=600)  # 10분마다 새로 쌓인 장소 반영
+def load_poi_index():
+    """POI 저장소 전체의 공간 인덱스"""
+    return PoiIndex(poi_store.load_places())
+
+
+# 관광지/숙소 검색 개수 (카테고리 필터 후 표시 개수를 채우기 위해 여러 페이지 검색)
+SEARCH_SIZE = 30
+DISPLAY_SIZE = 10
+
+# 테마 위치 주변 추천 반경 (km), POI 저장소에 표시 개수만큼 있으면 실시간 키워드 검색 생략
+NEARBY_RADIUS_KM = 10
+
+# ✅ Tourist Spot 페이지 데이터 묶음
+TouristSpotData = namedtuple(
+    "TouristSpotData", ["places", "hotels", "coordinates", "errors"]
+)
+
+
+def nearby_places(coordinates, codes, filter_func):
+    """테마 위치 반경 내 저장된 장소 (카테고리 필터 후 가까운 순 표시 개수, distance: 거리 m)"""
+    lat, lng = coordinates
+    if not (lat and lng):
         return []
+    hits = load_poi_index().nearby(lat, lng, NEARBY_RADIUS_KM, categories=codes)
+    places = [dict(record, distance=str(round(distance * 1000))) for record, distance in hits]
+    return filter_func(places)[:DISPLAY_SIZE]
+
+
+def load_tourist_spot_data(region, location):
+    """
+    테마 위치 좌표 → POI 저장소 반경 조회 (가까운 순)
+    - 좌표가 캐시에 있으면 저장소에 표시 개수만큼 없는 종류만 관광지/숙소 키워드 검색 (각각 캐싱)
+    - 캐시에 없으면 주소 검색과 두 키워드 검색(지역명만 필요)을 동시에 실행하고,
+      저장소가 표시 개수를 채운 종류의 검색 결과는 버림
+    저장소 결과 뒤에 실시간 검색 결과를 이어 붙여 표시 개수를 채움
+    실패한 조회는 빈 결과와 오류 메시지로 반환
+    """
+    error_labels = {"places": "API 요청 실패", "hotels": "호텔 정보 API 요청 실패", "coordinates": "주소 검색 실패"}
+
+    def run(lookup):
+        name, func, default = lookup
+        try:
+            return func(), None
+        except http.ApiError as e:
+            return default, f"❌ {error_labels[name]}: {e.status_code}, {e.text}"
+        except requests.RequestException as e:
+            return default, f"❌ {error_labels[name]}: {e}"
+
+    searches = {
+        "places": lambda: filter_tourist_spots(
+            search_tourist_spots("관광지", region, display=SEARCH_SIZE)
+        ),
+        "hotels": lambda: filter_hotel(search_hotels(region, display=SEARCH_SIZE)),
+    }
+
+    def nearby(coordinates):
+        return {
+            "places": nearby_places(coordinates, poi_store.ATTRACTION_CODES, filter_tourist_spots),
+            "hotels": nearby_places(coordinates, poi_store.LODGING_CODES, filter_hotel),
+        }
+
+    errors = []
+    cached = kakao.geocode_cached(location)
+    if cached is not None:
+        coordinates = cached or (None, None)
+        results = nearby(coordinates)
+        lookups = [
+            (name, searches[name], []) for name in results if len(results[name]) < DISPLAY_SIZE
+        ]
+    else:
+        lookups = [
+            ("coordinates", lambda: get_coordinates_from_address(location), (None, None))
+        ] + [(name, search, []) for name, search in searches.items()]
+    outputs = {name: output for (name, _, _), output in zip(lookups, fan_out(run, lookups))}
+    if cached is None:
+        coordinates, error = outputs.pop("coordinates")
+        if error:
+            errors.append(error)
+        results = nearby(coordinates)
+
+    for name, (result, error) in outputs.items():
+        if len(results[name]) >= DISPLAY_SIZE:
+            continue  # 저장소 결과로 충분 (함께 시작한 검색 결과는 사용하지 않음)
+        # ✅ 저장소 결과(가까운 순)를 먼저 두고 부족한 만큼 실시간 결과로 채움 (장소 id 중복 제거)
+        merged = {place["id"]: place for place in results[name]}
+        for place in result:
+            merged.setdefault(place["id"], place)
+        results[name] = list(merged.values())[:DISPLAY_SIZE]
+        if error:
+            errors.append(error)
+
+    return TouristSpotData(
+        places=results["places"],
+        hotels=results["hotels"],
+        coordinates=coordinates,
+        errors=errors,
+    )
 
 
 ################################################
@@ -206,94 +260,11 @@ def filter_hotel(places):
 ################################################
 
 
-def generate_kakao_map(places, hotels, selected_location=None):
-    """카카오 지도 HTML 파일을 생성하고, HTTPS 환경에서도 정상적으로 작동하도록 설정"""
+# 지점이 이보다 많으면 마커 클러스터링 (이름 라벨은 지점이 적을 때만 표시)
+CLUSTER_THRESHOLD = 50
 
-    selected_location = st.session_state.get("selected_location", "위치 정보 없음")
-    if not selected_location:
-        return None
-
-    # ✅ 지도 중심 좌표 설정
-    selected_lat, selected_lng = (
-        get_coordinates_from_address(selected_location)
-        if selected_location
-        else (None, None)
-    )
-    if selected_lat and selected_lng:
-        center_lat, center_lng = selected_lat, selected_lng
-    elif places:
-        center_lat, center_lng = places[0]["y"], places[0]["x"]
-    else:
-        center_lat, center_lng = 37.5665, 126.9780  # 기본값 (서울)
-
-    markers_js = ""
-
-    # ✅ 🎉 축제 위치 마커 추가 (빨간색)
-    if selected_location and selected_lat and selected_lng:
-        markers_js += f"""
-            var selectedMarkerImage = new kakao.maps.MarkerImage(
-                "https://ssl.daumcdn.net/localimg/localimages/07/mapapidoc/marker_red.png",
-                new kakao.maps.Size(36, 45),
-                new kakao.maps.Point(18, 45)
-            );
-
-            var selectedMarker = new kakao.maps.Marker({{
-                position: new kakao.maps.LatLng({selected_lat}, {selected_lng}),
-                map: map,
-                image: selectedMarkerImage
-            }});
-
-            var selectedOverlay = new kakao.maps.CustomOverlay({{
-                position: new kakao.maps.LatLng({selected_lat}, {selected_lng}),
-                content: '<div class="custom-label" style="background:#ffaaaa; border-radius:6px; ' +
-                        'padding:6px 8px; font-size:12px; color:#000; font-weight:bold; ' +
-                        'display: inline-block; white-space: nowrap; ' +
-                        'box-shadow: 1px 1px 3px rgba(0,0,0,0.2);"><b>🎉 {selected_location} (테마 위치)</b></div>',
-                yAnchor: 1.8  
-            }});
-            selectedOverlay.setMap(map);
-        """
-
-    # ✅ 🏞️ 관광지 마커 추가 (초록색)
-    for idx, place in enumerate(places):
-        markers_js += f"""
-            var marker{idx} = new kakao.maps.Marker({{
-                position: new kakao.maps.LatLng({place['y']}, {place['x']}),
-                map: map
-            }});
-
-            var overlay{idx} = new kakao.maps.CustomOverlay({{
-                position: new kakao.maps.LatLng({place['y']}, {place['x']}),
-                content: '<div class="custom-label" style="background:#aaffde; border-radius:6px; ' +
-                        'padding:6px 8px; font-size:12px; color:#000; font-weight:bold; ' +
-                        'display: inline-block; white-space: nowrap; ' +
-                        'box-shadow: 1px 1px 3px rgba(0,0,0,0.2);"><b>🏞️ {place["place_name"]}</b></div>',
-                yAnchor: 1.8  
-            }});
-            overlay{idx}.setMap(map);
-        """
-
-    # ✅ 🏨 호텔 마커 추가 (파란색)
-    for idx, hotel in enumerate(hotels):
-        markers_js += f"""
-            var hotelMarker{idx} = new kakao.maps.Marker({{
-                position: new kakao.maps.LatLng({hotel['y']}, {hotel['x']}),
-                map: map
-            }});
-
-            var hotelOverlay{idx} = new kakao.maps.CustomOverlay({{
-                position: new kakao.maps.LatLng({hotel['y']}, {hotel['x']}),
-                content: '<div class="custom-label" style="background:#aaddff; border-radius:6px; ' +
-                        'padding:6px 8px; font-size:12px; color:#000; font-weight:bold; ' +
-                        'display: inline-block; white-space: nowrap; ' +
-                        'box-shadow: 1px 1px 3px rgba(0,0,0,0.2);"><b>🏨 {hotel["place_name"]}</b></div>',
-                yAnchor: 1.8  
-            }});
-            hotelOverlay{idx}.setMap(map);
-        """
-
-    # ✅ HTTPS 업그레이드 설정 추가 (Mixed Content 오류 해결)
-    map_html = f"""
+# ✅ 지도 HTML 템플릿: 지점은 JSON 하나로 넣고 반복문 하나로 그림 (장소 이름은 textContent 로 넣어 따옴표 등에 안전)
+MAP_TEMPLATE = """
     <!DOCTYPE html>
     <html>
     <head>
@@ -302,25 +273,119 @@ def generate_kakao_map(places, hotels, selected_location=None):
         <meta http-equiv="Content-Security-Policy" content="upgrade-insecure-requests">
         
         <script type="text/javascript" 
-            src="https://dapi.kakao.com/v2/maps/sdk.js?appkey={KAKAO_JS_KEY}&libraries=services"></script>
+            src="https://dapi.kakao.com/v2/maps/sdk.js?appkey=__KAKAO_JS_KEY__&libraries=services,clusterer"></script>
     </head>
     <body>
         <div id="map" style="width: 100%; height: 500px;"></div>
         <script>
-            var mapContainer = document.getElementById('map'),
-                mapOption = {{
-                    center: new kakao.maps.LatLng({center_lat}, {center_lng}),
-                    level: 10
-                }};
-            var map = new kakao.maps.Map(mapContainer, mapOption);
-
-            {markers_js}
+            var data = __MAP_DATA__;
+            var map = new kakao.maps.Map(document.getElementById('map'), {
+                center: new kakao.maps.LatLng(data.center[0], data.center[1]),
+                level: 10
+            });
+
+            function label(text, color) {
+                var div = document.createElement('div');
+                div.className = 'custom-label';
+                div.style.cssText = 'background:' + color + '; border-radius:6px; padding:6px 8px; ' +
+                    'font-size:12px; color:#000; font-weight:bold; display:inline-block; ' +
+                    'white-space:nowrap; box-shadow:1px 1px 3px rgba(0,0,0,0.2);';
+                var b = document.createElement('b');
+                b.textContent = text;
+                div.appendChild(b);
+                return div;
+            }
+
+            // 🎉 테마 위치 마커 (빨간색)
+            if (data.selected) {
+                var position = new kakao.maps.LatLng(data.selected.lat, data.selected.lng);
+                new kakao.maps.Marker({
+                    position: position,
+                    map: map,
+                    image: new kakao.maps.MarkerImage(
+                        "https://ssl.daumcdn.net/localimg/localimages/07/mapapidoc/marker_red.png",
+                        new kakao.maps.Size(36, 45),
+                        new kakao.maps.Point(18, 45)
+                    )
+                });
+                new kakao.maps.CustomOverlay({
+                    position: position,
+                    content: label('🎉 ' + data.selected.name + ' (테마 위치)', '#ffaaaa'),
+                    yAnchor: 1.8
+                }).setMap(map);
+            }
+
+            // 🏞️ 관광지 (초록색) / 🏨 숙소 (파란색)
+            var styles = {place: ['🏞️ ', '#aaffde'], hotel: ['🏨 ', '#aaddff']};
+            var markers = data.points.map(function (p) {
+                var position = new kakao.maps.LatLng(p.lat, p.lng);
+                var style = styles[p.kind];
+                var marker = new kakao.maps.Marker({position: position, title: p.name});
+                if (!data.cluster) {
+                    marker.setMap(map);
+                    new kakao.maps.CustomOverlay({
+                        position: position,
+                        content: label(style[0] + p.name, style[1]),
+                        yAnchor: 1.8
+                    }).setMap(map);
+                }
+                return marker;
+            });
+            if (data.cluster) {
+                new kakao.maps.MarkerClusterer({map: map, averageCenter: true, minLevel: 6})
+                    .addMarkers(markers);
+            }
         </script>
     </body>
     </html>
     """
 
-    return map_html
+
+@st.cache_data(max_entries=64)
+def render_map_html(map_data):
+    """
+    지도 데이터(JSON 문자열) → 지도 HTML (중심 좌표 + 지점 목록이 같으면 캐시된 HTML 재사용)
+    같은 HTML 은 다시 그려도 지도 iframe 이 새로 로드되지 않음
+    """
+    # </script> 가 데이터 안에서 스크립트를 닫지 않도록
+    map_data = map_data.replace("</", "<\\/")
+    return MAP_TEMPLATE.replace("__KAKAO_JS_KEY__", KAKAO_JS_KEY).replace("__MAP_DATA__", map_data)
+
+
+def generate_kakao_map(places, hotels, selected_location=None, coordinates=None):
+    """카카오 지도 HTML 파일을 생성하고, HTTPS 환경에서도 정상적으로 작동하도록 설정"""
+
+    selected_location = st.session_state.get("selected_location", "위치 정보 없음")
+    if not selected_location:
+        return None
+
+    # ✅ 지도 중심 좌표 설정 (미리 조회한 좌표가 있으면 사용)
+    if coordinates is None:
+        coordinates = get_coordinates_from_address(selected_location)
+    selected_lat, selected_lng = coordinates
+    if selected_lat and selected_lng:
+        center_lat, center_lng = selected_lat, selected_lng
+    elif places:
+        center_lat, center_lng = places[0]["y"], places[0]["x"]
+    else:
+        center_lat, center_lng = 37.5665, 126.9780  # 기본값 (서울)
+
+    points = [
+        {"lat": float(place["y"]), "lng": float(place["x"]), "name": place["place_name"], "kind": kind}
+        for kind, group in (("place", places), ("hotel", hotels))
+        for place in group
+    ]
+    map_data = {
+        "center": [float(center_lat), float(center_lng)],
+        "selected": (
+            {"lat": selected_lat, "lng": selected_lng, "name": selected_location}
+            if selected_lat and selected_lng
+            else None
+        ),
+        "points": points,
+        "cluster": len(points) > CLUSTER_THRESHOLD,
+    }
+    return render_map_html(json.dumps(map_data, ensure_ascii=False, sort_keys=True))
 
 def extract_tourist_spots_with_category(places):
     """
@@ -395,13 +460,12 @@ def run_tourist_spots():
         )
         return
 
-    # 🔹 관광지 검색
-    places = search_tourist_spots("관광지", f"{province} {city}", display=10)
-    tourist_spots = filter_tourist_spots(places)
-
-    # 🔹 숙소 검색
-    hotel_places = search_hotels(f"{province} {city}", display=10)
-    hotels = filter_hotel(hotel_places)
+    # 🔹 관광지 검색, 숙소 검색, 테마 위치 좌표를 동시에 조회
+    data = load_tourist_spot_data(f"{province} {city}", selected_location)
+    for error in data.errors:
+        st.error(error)
+    tourist_spots = data.places
+    hotels = data.hotels
 
     # ✅ 선택한 관광지 및 숙소를 저장할 세션 상태 초기화
     if "selected_tourist_spots" not in st.session_state:
@@ -422,7 +486,7 @@ def run_tourist_spots():
     # 🔹 카카오 지도 표시
     st.subheader("🗺 카카오 지도에서 관광지 & 숙소 확인")
     # ✅ 카카오 지도 HTML 생성
-    map_html = generate_kakao_map(tourist_spots, hotels)
+    map_html = generate_kakao_map(tourist_spots, hotels, coordinates=data.coordinates)
 
     # 렌더링
     if map_html:
@@ -437,6 +501,9 @@ def run_tourist_spots():
     if "submit_clicked" not in st.session_state:
         st.session_state.submit_clicked = False
 
+    # (관광지 이름, 설명 자리) — 폼을 그린 뒤 설명을 동시에 조회하여 채움
+    description_slots = []
+
     with st.form("selection_form"):
         col1, col2 = st.columns(2)
 
@@ -450,18 +517,16 @@ def run_tourist_spots():
                     place_map_url = f"https://map.kakao.com/link/map/{place['id']}"
 
                     with st.expander(f"📍 {place['place_name']} (자세히 보기)"):
-                        # ✅ 관광지 설명과 블로그 링크 가져오기
-                        description, blog_url = get_tourist_description(place_name)
                         st.write(f"📍 **주소:** {place_address}")
                         if place.get("phone"):
                             st.write(f"📞 **전화번호:** {place['phone']}")
                         st.write(f"🏷 **카테고리:** {place_category}")
-                        st.write(f"📝 **설명:** {description}")
-                        if blog_url:
-                            st.markdown(
-                                f"[📖 네이버 블로그 리뷰 보기]({blog_url})",
-                                unsafe_allow_html=True,
-                            )
+                        if place.get("distance"):
+                            st.write(f"📏 **테마 위치에서:** {int(place['distance']) / 1000:.1f}km")
+                        # ✅ 설명은 자리만 먼저 그리고, 페이지를 다 그린 뒤 채움
+                        description_slot = st.empty()
+                        description_slot.write("📝 **설명:** ⏳ 블로그 설명을 불러오는 중...")
+                        description_slots.append((place_name, description_slot))
                         st.markdown(
                             f"[📍 카카오 지도에서 보기]({place_map_url})",
                             unsafe_allow_html=True,
@@ -490,6 +555,8 @@ def run_tourist_spots():
 
                     with st.expander(f"🏨 {hotel_name} (자세히 보기)"):
                         st.write(f"🏷 **카테고리:** {hotel_category}")
+                        if hotel.get("distance"):
+                            st.write(f"📏 **테마 위치에서:** {int(hotel['distance']) / 1000:.1f}km")
                         st.markdown(
                             f"[📍 카카오 지도에서 보기](https://map.kakao.com/link/map/{hotel['id']})",
                             unsafe_allow_html=True,
@@ -514,6 +581,17 @@ def run_tourist_spots():
     if submit_button:
         st.session_state.submit_clicked = True
 
+    # ✅ 관광지 설명과 블로그 링크: 페이지가 먼저 표시된 뒤 끝나는 순서대로 채움 (캐시 공유)
+    place_names = [place_name for place_name, _ in description_slots]
+    for i, (description, blog_url) in fan_out_as_completed(tourist_description_or_default, place_names):
+        with description_slots[i][1].container():
+            st.write(f"📝 **설명:** {description}")
+            if blog_url:
+                st.markdown(
+                    f"[📖 네이버 블로그 리뷰 보기]({blog_url})",
+                    unsafe_allow_html=True,
+                )
+
     if st.session_state.submit_clicked:
         st.subheader("✅ 선택한 관광지 & 숙소 목록")
 